@@ -1,20 +1,38 @@
 from __future__ import annotations
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends
 from sqlalchemy.orm import Session
 
 from app.api.deps import require_user
 from app.db.database import get_db
 from app.services.crawl_service import run_crawl
+from app.services.outbox import drain_outbox
+from app.services.profiling import profile_crawl_in_subprocess
+from app.services.response_cache import bump_cache_generation
 
 router = APIRouter(prefix="/crawl", tags=["crawl"])
 
 
 @router.post("/trigger")
-def trigger(_: str = Depends(require_user), db: Session = Depends(get_db)):
-    digest = run_crawl(db)
-    return {
+def trigger(
+    background_tasks: BackgroundTasks,
+    profile: bool = False,
+    _: str = Depends(require_user),
+    db: Session = Depends(get_db),
+):
+    if profile:
+        digest = profile_crawl_in_subprocess(db.get_bind().url.render_as_string(hide_password=False))
+        # The child's cache generation bump does not reach this process.
+        bump_cache_generation()
+    else:
+        digest = run_crawl(db)
+    # Discord delivery runs after the response is sent: a single pass, so a worker is never parked on retries.
+    background_tasks.add_task(drain_outbox)
+    response = {
         "success": True,
         "message": "crawl completed",
         "new_jobs": digest["new_jobs"],
         "high_priority_jobs": digest["high_priority_jobs"],
     }
+    if profile:
+        response["profile_path"] = digest["profile_path"]
+    return response
@@ -1,5 +1,9 @@
 from __future__ import annotations
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from app.api.deps import require_user
+from app.db.database import current_async_engine, engine
+from app.db.pool_stats import pool_stats
 
 router = APIRouter(tags=["health"])
 
@@ -7,3 +11,12 @@ router = APIRouter(tags=["health"])
 @router.get("/health")
 def health():
     return {"ok": True}
+
+
+@router.get("/health/pool")
+def health_pool(_: str = Depends(require_user)):
+    async_engine = current_async_engine()
+    return {
+        "sync": pool_stats(engine.pool),
+        "async": pool_stats(async_engine.pool) if async_engine is not None else None,
+    }
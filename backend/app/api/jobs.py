@@ -1,84 +1,27 @@
 from __future__ import annotations
+from collections import Counter
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import require_user
-from app.db.database import get_db
+from app.api.responses import FastJSONResponse
+from app.core.config import settings
+from app.db.database import get_async_db
 from app.models.job import Job
+from app.models.job_body import JobBody
 from app.models.job_score import JobScore
+from app.services.job_bodies import decode_description, decode_payload
+from app.services.job_search import has_cjk, search_condition, trigram_available
+from app.services.response_cache import cached_response
+from app.utils.cursor import decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 
-@router.get("")
-def list_jobs(
-    q: str | None = None,
-    source_id: int | None = None,
-    high_priority: bool | None = None,
-    start: datetime | None = None,
-    end: datetime | None = None,
-    limit: int = Query(default=50, ge=1, le=500),
-    offset: int = Query(default=0, ge=0),
-    _: str = Depends(require_user),
-    db: Session = Depends(get_db),
-):
-    query = db.query(Job, JobScore).outerjoin(JobScore, Job.id == JobScore.job_id)
-
-    if q:
-        like = f"%{q}%"
-        query = query.filter((Job.title.ilike(like)) | (Job.company.ilike(like)) | (Job.description.ilike(like)))
-    if source_id is not None:
-        query = query.filter(Job.source_id == source_id)
-    if high_priority is True:
-        query = query.filter(JobScore.decision == "high")
-    if high_priority is False:
-        query = query.filter((JobScore.decision != "high") | (JobScore.decision.is_(None)))
-    if start:
-        query = query.filter(Job.collected_at >= start)
-    if end:
-        query = query.filter(Job.collected_at <= end)
-
-    rows = query.order_by(Job.collected_at.desc()).offset(offset).limit(limit).all()
-    data = []
-    for job, score in rows:
-        payload = {
-            "id": job.id,
-            "source_id": job.source_id,
-            "source_job_id": job.source_job_id,
-            "canonical_url": job.canonical_url,
-            "title": job.title,
-            "company": job.company,
-            "location": job.location,
-            "remote_type": job.remote_type,
-            "employment_type": job.employment_type,
-            "description": job.description,
-            "posted_at": job.posted_at,
-            "collected_at": job.collected_at,
-            "is_new": job.is_new,
-            "score": None,
-        }
-        if score:
-            payload["score"] = {
-                "total_score": score.total_score,
-                "keyword_score": score.keyword_score,
-                "seniority_score": score.seniority_score,
-                "remote_bonus": score.remote_bonus,
-                "region_bonus": score.region_bonus,
-                "decision": score.decision,
-                "scored_at": score.scored_at,
-            }
-        data.append(payload)
-    return data
-
-
-@router.get("/{job_id}")
-def get_job(job_id: int, _: str = Depends(require_user), db: Session = Depends(get_db)):
-    row = db.query(Job, JobScore).outerjoin(JobScore, Job.id == JobScore.job_id).filter(Job.id == job_id).first()
-    if not row:
-        raise HTTPException(status_code=404, detail="job not found")
-    job, score = row
+def _job_payload(job: Job, score: JobScore | None, description: str | None = None) -> dict:
     return {
         "id": job.id,
         "source_id": job.source_id,
@@ -89,7 +32,8 @@ def get_job(job_id: int, _: str = Depends(require_user), db: Session = Depends(g
         "location": job.location,
         "remote_type": job.remote_type,
         "employment_type": job.employment_type,
-        "description": job.description,
+        "domain": job.domain,
+        "description": job.description if description is None else description,
         "posted_at": job.posted_at,
         "collected_at": job.collected_at,
         "is_new": job.is_new,
@@ -105,3 +49,285 @@ def get_job(job_id: int, _: str = Depends(require_user), db: Session = Depends(g
         if score
         else None,
     }
+
+
+async def _external_descriptions(db: AsyncSession, job_ids: list[int]) -> dict[int, str]:
+    # Jobs stored with JOB_BODY_STORAGE=compressed keep only a search excerpt inline, so the full view
+    # decompresses the body of every job on the page; view=summary skips this.
+    if not job_ids:
+        return {}
+    stmt = select(JobBody.job_id, JobBody.codec, JobBody.description).where(JobBody.job_id.in_(job_ids))
+    return {job_id: decode_description(codec, data) for job_id, codec, data in (await db.execute(stmt)).all()}
+
+
+# Columns served by the list summary view; description and raw_payload come only from GET /jobs/{id}.
+SUMMARY_COLUMNS = {
+    "id": Job.id,
+    "source_id": Job.source_id,
+    "source_job_id": Job.source_job_id,
+    "canonical_url": Job.canonical_url,
+    "title": Job.title,
+    "company": Job.company,
+    "location": Job.location,
+    "remote_type": Job.remote_type,
+    "employment_type": Job.employment_type,
+    "domain": Job.domain,
+    "posted_at": Job.posted_at,
+    "collected_at": Job.collected_at,
+    "is_new": Job.is_new,
+}
+SUMMARY_FIELDS = (*SUMMARY_COLUMNS, "score")
+
+
+def _summary_fields(fields: str | None) -> list[str]:
+    if not fields:
+        return list(SUMMARY_FIELDS)
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SUMMARY_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"unknown fields: {', '.join(unknown)}")
+    # id is always returned so rows can be linked to GET /jobs/{id}.
+    return ["id", *[name for name in dict.fromkeys(names) if name != "id"]]
+
+
+def _summary_select(names: list[str], keyset: bool):
+    columns = [SUMMARY_COLUMNS[name].label(name) for name in names if name in SUMMARY_COLUMNS]
+    if keyset and "collected_at" not in names:
+        columns.append(Job.collected_at.label("collected_at"))
+    if "score" in names:
+        columns += [JobScore.total_score.label("score_total_score"), JobScore.decision.label("score_decision")]
+    return select(*columns)
+
+
+def _summary_payload(row, names: list[str]) -> dict:
+    data = row._mapping
+    payload = {name: data[name] for name in names if name in SUMMARY_COLUMNS}
+    if "score" in names:
+        payload["score"] = (
+            {"total_score": data["score_total_score"], "decision": data["score_decision"]}
+            if data["score_total_score"] is not None
+            else None
+        )
+    return payload
+
+
+def _apply_job_filters(
+    stmt,
+    dialect_name: str,
+    q: str | None,
+    source_id: int | None,
+    high_priority: bool | None,
+    start: datetime | None,
+    end: datetime | None,
+    trigram: bool = True,
+):
+    stmt = stmt.select_from(Job).outerjoin(JobScore, Job.id == JobScore.job_id)
+    rank = None
+    if q and q.strip():
+        condition, rank = search_condition(q, dialect_name, trigram)
+        stmt = stmt.where(condition)
+    if source_id is not None:
+        stmt = stmt.where(Job.source_id == source_id)
+    if high_priority is True:
+        stmt = stmt.where(JobScore.decision == "high")
+    if high_priority is False:
+        stmt = stmt.where((JobScore.decision != "high") | (JobScore.decision.is_(None)))
+    if start:
+        stmt = stmt.where(Job.collected_at >= start)
+    if end:
+        stmt = stmt.where(Job.collected_at <= end)
+    return stmt, rank
+
+
+async def _list_jobs_content(
+    db: AsyncSession,
+    q: str | None,
+    source_id: int | None,
+    high_priority: bool | None,
+    start: datetime | None,
+    end: datetime | None,
+    limit: int,
+    offset: int,
+    sort: str,
+    paginate: str,
+    cursor: str | None,
+    view: str,
+    fields: str | None,
+):
+    # Cursor mode pages on (collected_at, id) and answers {"items", "next_cursor"};
+    # offset mode keeps the original bare list.
+    keyset = paginate == "cursor" or cursor is not None
+    if keyset and sort == "relevance":
+        raise HTTPException(status_code=400, detail="cursor pagination only supports sort=recent")
+
+    summary = view == "summary" or fields is not None
+    if summary:
+        names = _summary_fields(fields)
+        stmt = _summary_select(names, keyset)
+    else:
+        stmt = select(Job, JobScore)
+    dialect_name = db.bind.dialect.name
+    # CJK relevance needs pg_trgm's word_similarity(); without it the search orders by recency.
+    trigram = sort != "relevance" or dialect_name != "postgresql" or not has_cjk(q or "")
+    if not trigram:
+        trigram = await db.run_sync(trigram_available)
+    stmt, rank = _apply_job_filters(stmt, dialect_name, q, source_id, high_priority, start, end, trigram)
+
+    async def to_payloads(rows) -> list[dict]:
+        if summary:
+            return [_summary_payload(row, names) for row in rows]
+        descriptions = await _external_descriptions(db, [job.id for job, _score in rows])
+        return [_job_payload(job, score, descriptions.get(job.id)) for job, score in rows]
+
+    if keyset:
+        if cursor:
+            try:
+                after_ts, after_id = decode_cursor(cursor)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="invalid cursor")
+            # A row-value comparison is a range on ix_jobs_collected_at_id; the expanded OR is only a filter.
+            stmt = stmt.where(tuple_(Job.collected_at, Job.id) < tuple_(after_ts, after_id))
+        rows = (await db.execute(stmt.order_by(Job.collected_at.desc(), Job.id.desc()).limit(limit + 1))).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            last_ts, last_id = (last.collected_at, last.id) if summary else (last[0].collected_at, last[0].id)
+            next_cursor = encode_cursor(last_ts, last_id)
+        return {"items": await to_payloads(rows), "next_cursor": next_cursor}
+
+    if sort == "relevance" and rank is not None:
+        stmt = stmt.order_by(rank.desc(), Job.collected_at.desc(), Job.id.desc())
+    else:
+        stmt = stmt.order_by(Job.collected_at.desc(), Job.id.desc())
+
+    rows = (await db.execute(stmt.offset(offset).limit(limit))).all()
+    return await to_payloads(rows)
+
+
+@router.get("", response_class=FastJSONResponse)
+async def list_jobs(
+    request: Request,
+    q: str | None = None,
+    source_id: int | None = None,
+    high_priority: bool | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    limit: int = Query(default=50, ge=1, le=500),
+    offset: int = Query(default=0, ge=0),
+    sort: str = Query(default="recent", pattern="^(recent|relevance)$"),
+    paginate: str = Query(default="offset", pattern="^(offset|cursor)$"),
+    cursor: str | None = None,
+    view: str = Query(default="full", pattern="^(full|summary)$"),
+    fields: str | None = None,
+    _: str = Depends(require_user),
+    db: AsyncSession = Depends(get_async_db),
+):
+    return await cached_response(
+        request,
+        lambda: _list_jobs_content(
+            db, q, source_id, high_priority, start, end, limit, offset, sort, paginate, cursor, view, fields
+        ),
+    )
+
+
+FACET_DIMENSIONS = {
+    "source_id": Job.source_id,
+    "decision": JobScore.decision,
+    "domain": Job.domain,
+    "remote_type": Job.remote_type,
+    "day": func.date(Job.collected_at),
+}
+
+
+def _facet_statements(
+    dialect_name: str,
+    q: str | None,
+    source_id: int | None,
+    high_priority: bool | None,
+    start: datetime | None,
+    end: datetime | None,
+) -> list:
+    """Count each facet dimension on its own, so the result is the sum of the dimension sizes, not their product.
+
+    Postgres does it in one statement with a grouping set per dimension (``grouping_<name>`` is 0 for the
+    dimension a row counts); other backends run one small GROUP BY per dimension.
+    """
+    filters = (dialect_name, q, source_id, high_priority, start, end)
+    count = func.count(Job.id).label("n")
+    if dialect_name == "postgresql":
+        stmt = select(
+            *[column.label(name) for name, column in FACET_DIMENSIONS.items()],
+            *[func.grouping(column).label(f"grouping_{name}") for name, column in FACET_DIMENSIONS.items()],
+            count,
+        )
+        stmt, _rank = _apply_job_filters(stmt, *filters)
+        return [stmt.group_by(func.grouping_sets(*FACET_DIMENSIONS.values()))]
+    statements = []
+    for name, column in FACET_DIMENSIONS.items():
+        stmt, _rank = _apply_job_filters(select(column.label(name), count), *filters)
+        statements.append(stmt.group_by(column))
+    return statements
+
+
+async def _facets_content(
+    db: AsyncSession,
+    q: str | None,
+    source_id: int | None,
+    high_priority: bool | None,
+    start: datetime | None,
+    end: datetime | None,
+) -> dict:
+    counts: dict[str, Counter] = {name: Counter() for name in FACET_DIMENSIONS}
+    for stmt in _facet_statements(db.bind.dialect.name, q, source_id, high_priority, start, end):
+        for row in (await db.execute(stmt)).all():
+            values = row._mapping
+            name = next(name for name in FACET_DIMENSIONS if name in values and not values.get(f"grouping_{name}"))
+            value = values[name]
+            counts[name][str(value) if name == "day" and value is not None else value] += row.n
+    # Every job falls in exactly one source group.
+    total = sum(counts["source_id"].values())
+
+    facets = {
+        name: [{"value": value, "count": count} for value, count in counter.most_common()]
+        for name, counter in counts.items()
+        if name != "day"
+    }
+    facets["day"] = [{"value": value, "count": counts["day"][value]} for value in sorted(counts["day"], key=str)]
+    return {"total": total, "facets": facets}
+
+
+@router.get("/facets", response_class=FastJSONResponse)
+async def job_facets(
+    request: Request,
+    q: str | None = None,
+    source_id: int | None = None,
+    high_priority: bool | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    _: str = Depends(require_user),
+    db: AsyncSession = Depends(get_async_db),
+):
+    return await cached_response(
+        request,
+        lambda: _facets_content(db, q, source_id, high_priority, start, end),
+        ttl=settings.facets_cache_seconds,
+    )
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: int, _: str = Depends(require_user), db: AsyncSession = Depends(get_async_db)):
+    stmt = (
+        select(Job, JobScore, JobBody.codec, JobBody.description, JobBody.raw_payload)
+        .outerjoin(JobScore, Job.id == JobScore.job_id)
+        .outerjoin(JobBody, Job.id == JobBody.job_id)
+        .where(Job.id == job_id)
+    )
+    row = (await db.execute(stmt)).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="job not found")
+    job, score, codec, compressed, compressed_payload = row
+    payload = _job_payload(job, score, decode_description(codec, compressed) if codec else None)
+    # Only the detail view carries the source's raw payload.
+    payload["raw_payload"] = decode_payload(codec, compressed_payload) if codec else job.raw_payload
+    return payload
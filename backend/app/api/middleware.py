@@ -0,0 +1,31 @@
+from __future__ import annotations
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db.query_stats import track_queries
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+DB_TIME_HEADER = "X-DB-Time-Ms"
+
+
+class QueryCountMiddleware:
+    """Reports the statements an HTTP request executed (and their total time) in response headers."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as queries:
+
+            async def send_with_counts(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers[QUERY_COUNT_HEADER] = str(queries.count)
+                    headers[DB_TIME_HEADER] = f"{queries.seconds * 1000:.1f}"
+                await send(message)
+
+            await self.app(scope, receive, send_with_counts)
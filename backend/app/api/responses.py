@@ -0,0 +1,13 @@
+from __future__ import annotations
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from app.utils.serialization import dumps
+
+
+class FastJSONResponse(JSONResponse):
+    """Serializes plain dicts/lists straight to bytes, skipping FastAPI's jsonable_encoder pass."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
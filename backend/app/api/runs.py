@@ -1,18 +1,42 @@
 from __future__ import annotations
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import require_user
-from app.db.database import get_db
+from app.api.responses import FastJSONResponse
+from app.db.database import get_async_db
 from app.services.crawl_service import list_runs
+from app.services.response_cache import cached_response
+from app.utils.cursor import decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/runs", tags=["runs"])
 
 
-@router.get("")
-def get_runs(
+async def _runs_content(db: AsyncSession, limit: int, paginate: str, cursor: str | None):
+    if paginate != "cursor" and cursor is None:
+        return [dict(row._mapping) for row in await db.run_sync(list_runs, limit)]
+
+    before = None
+    if cursor:
+        try:
+            before = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="invalid cursor")
+    runs = await db.run_sync(list_runs, limit + 1, before)
+    next_cursor = None
+    if len(runs) > limit:
+        runs = runs[:limit]
+        next_cursor = encode_cursor(runs[-1].started_at, runs[-1].id)
+    return {"items": [dict(row._mapping) for row in runs], "next_cursor": next_cursor}
+
+
+@router.get("", response_class=FastJSONResponse)
+async def get_runs(
+    request: Request,
     limit: int = Query(default=100, ge=1, le=500),
+    paginate: str = Query(default="limit", pattern="^(limit|cursor)$"),
+    cursor: str | None = None,
     _: str = Depends(require_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    return list_runs(db, limit)
+    return await cached_response(request, lambda: _runs_content(db, limit, paginate, cursor))
@@ -1,9 +1,10 @@
 from __future__ import annotations
 from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api.deps import require_user
-from app.db.database import get_db
+from app.db.database import get_async_db, get_db
 from app.schemas.score import ScoreConfig
 from app.schemas.setting import NotificationSettings
 from app.services.settings_service import get_setting, upsert_setting
@@ -12,8 +13,8 @@ router = APIRouter(prefix="/settings", tags=["settings"])
 
 
 @router.get("/scoring")
-def get_scoring(_: str = Depends(require_user), db: Session = Depends(get_db)):
-    return get_setting(db, "scoring")
+async def get_scoring(_: str = Depends(require_user), db: AsyncSession = Depends(get_async_db)):
+    return await db.run_sync(get_setting, "scoring")
 
 
 @router.put("/scoring")
@@ -22,8 +23,8 @@ def put_scoring(body: ScoreConfig, _: str = Depends(require_user), db: Session =
 
 
 @router.get("/notifications")
-def get_notifications(_: str = Depends(require_user), db: Session = Depends(get_db)):
-    return get_setting(db, "notifications")
+async def get_notifications(_: str = Depends(require_user), db: AsyncSession = Depends(get_async_db)):
+    return await db.run_sync(get_setting, "notifications")
 
 
 @router.put("/notifications")
@@ -1,18 +1,34 @@
 from __future__ import annotations
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api.deps import require_user
-from app.db.database import get_db
+from app.api.responses import FastJSONResponse
+from app.db.database import get_async_db, get_db
 from app.models.source import Source
-from app.schemas.source import SourcePatch
+from app.schemas.source import SourceOut, SourcePatch
+from app.services.circuit_breaker import breaker_state, breaker_states
+from app.services.response_cache import bump_cache_generation, cached_response
 
 router = APIRouter(prefix="/sources", tags=["sources"])
 
 
-@router.get("")
-def list_sources(_: str = Depends(require_user), db: Session = Depends(get_db)):
-    return db.query(Source).order_by(Source.id.asc()).all()
+def _source_payload(row: Source, breaker: dict) -> dict:
+    payload = SourceOut.model_validate(row).model_dump()
+    payload["breaker"] = breaker
+    return payload
+
+
+def _list_source_payloads(db: Session) -> list[dict]:
+    rows = db.query(Source).order_by(Source.id.asc()).all()
+    breakers = breaker_states(db, [row.id for row in rows])
+    return [_source_payload(row, breakers[row.id]) for row in rows]
+
+
+@router.get("", response_class=FastJSONResponse)
+async def list_sources(request: Request, _: str = Depends(require_user), db: AsyncSession = Depends(get_async_db)):
+    return await cached_response(request, lambda: db.run_sync(_list_source_payloads))
 
 
 @router.patch("/{source_id}")
@@ -20,8 +36,12 @@ def patch_source(source_id: int, body: SourcePatch, _: str = Depends(require_use
     row = db.query(Source).filter(Source.id == source_id).first()
     if not row:
         raise HTTPException(status_code=404, detail="source not found")
-    row.enabled = body.enabled
+    if body.enabled is not None:
+        row.enabled = body.enabled
+    if body.crawl_config is not None:
+        row.crawl_config = body.crawl_config
     db.add(row)
     db.commit()
+    bump_cache_generation()
     db.refresh(row)
-    return row
+    return _source_payload(row, breaker_state(db, row.id))
@@ -132,54 +132,123 @@ def _build_jobs_from_blocks(blocks: dict[str, Any], collection_id: str, schema:
     return jobs
 
 
+def _block_version(wrapped: Any) -> int | None:
+    value = (wrapped or {}).get("value") or {}
+    version = value.get("version")
+    if version is None:
+        version = value.get("last_edited_time")
+    return version if isinstance(version, (int, float)) else None
+
+
+def _load_collection(client: httpx.Client, api_base: str = NOTION_API_BASE) -> tuple[str, str, dict[str, Any]]:
+    cached = client.post(
+        f"{api_base}/loadCachedPageChunk",
+        json={
+            "pageId": PAGE_ID,
+            "limit": 100,
+            "cursor": {"stack": []},
+            "chunkNumber": 0,
+            "verticalColumns": False,
+        },
+    )
+    cached.raise_for_status()
+    record_map = cached.json().get("recordMap") or {}
+    return _extract_collection_and_view(record_map)
+
+
+def _query_collection(
+    client: httpx.Client, collection_id: str, view_id: str, api_base: str = NOTION_API_BASE
+) -> dict[str, Any]:
+    query = client.post(
+        f"{api_base}/queryCollection",
+        json={
+            "collection": {"id": collection_id},
+            "collectionView": {"id": view_id},
+            "loader": {
+                "reducers": {"results": {"type": "results", "limit": 120}},
+                "sort": [],
+                "searchQuery": "",
+                "userTimeZone": "Asia/Shanghai",
+                "userLocale": "en",
+            },
+            "query": {"aggregate": []},
+        },
+    )
+    query.raise_for_status()
+    return query.json()
+
+
+def _result_block_ids(payload: dict[str, Any]) -> list[str]:
+    reducers = (payload.get("result") or {}).get("reducerResults") or {}
+    rows = (reducers.get("results") or {}).get("blockIds") or []
+    if not rows:
+        rows = (reducers.get("collection_group_results") or {}).get("blockIds") or []
+    return rows[:120]
+
+
 class ABetterWeb3Adapter(SourceAdapter):
     source_name = "abetterweb3"
+    base_url = "https://www.notion.so"
 
     def fetch(self) -> list[NormalizedJob]:
+        # Cursor: collection/view ids, schema and the last seen version of every listed block.
+        # Steady state is a single queryCollection call; only changed blocks are re-synced.
+        cursor = self.cursor if self.cursor is not None else {}
         headers = {"User-Agent": "Mozilla/5.0", "Content-Type": "application/json"}
+        api_base = self.resolve(NOTION_API_BASE)
 
         with httpx.Client(timeout=30, follow_redirects=True, headers=headers) as client:
-            cached = client.post(
-                f"{NOTION_API_BASE}/loadCachedPageChunk",
-                json={
-                    "pageId": PAGE_ID,
-                    "limit": 100,
-                    "cursor": {"stack": []},
-                    "chunkNumber": 0,
-                    "verticalColumns": False,
-                },
+            collection_id = cursor.get("collection_id") or ""
+            view_id = cursor.get("view_id") or ""
+            schema = cursor.get("schema") or {}
+
+            payload = None
+            if collection_id and view_id and schema:
+                try:
+                    payload = _query_collection(client, collection_id, view_id, api_base)
+                except httpx.HTTPStatusError:
+                    # Cached ids went stale (view deleted, page moved); resolve them again.
+                    payload = None
+            if payload is None:
+                collection_id, view_id, schema = _load_collection(client, api_base)
+                cursor.clear()
+                cursor.update({"collection_id": collection_id, "view_id": view_id, "schema": schema, "blocks": {}})
+                payload = _query_collection(client, collection_id, view_id, api_base)
+
+            record_map = payload.get("recordMap") or {}
+            fresh_schema = (((record_map.get("collection") or {}).get(collection_id) or {}).get("value") or {}).get(
+                "schema"
             )
-            cached.raise_for_status()
-            record_map = cached.json().get("recordMap") or {}
-            collection_id, view_id, schema = _extract_collection_and_view(record_map)
-
-            query = client.post(
-                f"{NOTION_API_BASE}/queryCollection",
-                json={
-                    "collection": {"id": collection_id},
-                    "collectionView": {"id": view_id},
-                    "loader": {
-                        "reducers": {"results": {"type": "results", "limit": 120}},
-                        "sort": [],
-                        "searchQuery": "",
-                        "userTimeZone": "Asia/Shanghai",
-                        "userLocale": "en",
-                    },
-                    "query": {"aggregate": []},
-                },
-            )
-            query.raise_for_status()
-            result = query.json().get("result") or {}
-            reducers = result.get("reducerResults") or {}
-            rows = (reducers.get("results") or {}).get("blockIds") or []
-            if not rows:
-                rows = (reducers.get("collection_group_results") or {}).get("blockIds") or []
+            if fresh_schema:
+                schema = fresh_schema
+                cursor["schema"] = schema
+
+            rows = _result_block_ids(payload)
             if not rows:
                 return []
 
-            requests = [{"table": "block", "id": bid, "version": -1} for bid in rows[:120]]
-            sync = client.post(f"{NOTION_API_BASE}/syncRecordValues", json={"requests": requests})
-            sync.raise_for_status()
-            blocks = (sync.json().get("recordMap") or {}).get("block") or {}
+            known = cursor.get("blocks") or {}
+            listed = record_map.get("block") or {}
+            changed = []
+            for bid in rows:
+                version = _block_version(listed.get(bid))
+                if version is None or known.get(bid) != version:
+                    changed.append(bid)
+
+            blocks: dict[str, Any] = {}
+            if changed:
+                requests = [{"table": "block", "id": bid, "version": -1} for bid in changed]
+                sync = client.post(f"{api_base}/syncRecordValues", json={"requests": requests})
+                sync.raise_for_status()
+                blocks = (sync.json().get("recordMap") or {}).get("block") or {}
+
+            # Only remember blocks still listed so the cursor stays bounded.
+            versions = {bid: known[bid] for bid in rows if bid in known}
+            for bid, wrapped in blocks.items():
+                version = _block_version(wrapped)
+                if version is not None:
+                    versions[bid] = version
+            cursor["blocks"] = versions
+            self.cursor = cursor
 
         return _build_jobs_from_blocks(blocks, collection_id, schema)[:80]
@@ -4,6 +4,8 @@ from datetime import datetime, timedelta
 import re
 from urllib.parse import urljoin
 
+from bs4 import SoupStrainer
+
 from app.crawlers.base import NormalizedJob, SourceAdapter
 from app.crawlers.http_helpers import fetch_html, soup_links
 
@@ -36,11 +38,13 @@ def _parse_relative_posted(text: str) -> datetime | None:
 
 class AIJobsNetAdapter(SourceAdapter):
     source_name = "aijobsnet"
+    base_url = "https://aijobs.net"
+    parse_only = SoupStrainer("ul", id="job_list")
 
     def fetch(self) -> list[NormalizedJob]:
         listing_url = "https://aijobs.net/"
-        html = fetch_html(listing_url)
-        soup, _ = soup_links(html)
+        html = fetch_html(self.resolve(listing_url))
+        soup, _ = soup_links(html, parse_only=self.parse_only)
 
         jobs: list[NormalizedJob] = []
         seen: set[str] = set()
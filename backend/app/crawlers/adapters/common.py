@@ -8,8 +8,10 @@ from app.crawlers.http_helpers import fetch_html, soup_links
 KEYWORDS = ["job", "career", "position", "opening", "web3", "crypto", "blockchain"]
 
 
-def scrape_jobs_from_listing(listing_url: str, site_name: str, host_contains: str) -> list[NormalizedJob]:
-    html = fetch_html(listing_url)
+def scrape_jobs_from_listing(
+    listing_url: str, site_name: str, host_contains: str, fetch_url: str | None = None
+) -> list[NormalizedJob]:
+    html = fetch_html(fetch_url or listing_url)
     soup, links = soup_links(html)
     jobs: list[NormalizedJob] = []
     seen: set[str] = set()
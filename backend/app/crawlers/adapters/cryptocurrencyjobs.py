@@ -4,6 +4,8 @@ from datetime import datetime
 import re
 from urllib.parse import urljoin
 
+from bs4 import SoupStrainer
+
 from app.crawlers.base import NormalizedJob, SourceAdapter
 from app.crawlers.http_helpers import fetch_html, soup_links
 
@@ -23,11 +25,13 @@ def _parse_datetime(raw: str) -> datetime | None:
 
 class CryptocurrencyJobsAdapter(SourceAdapter):
     source_name = "cryptocurrencyjobs"
+    base_url = "https://www.cryptocurrencyjobs.co"
+    parse_only = SoupStrainer(id="find-a-job")
 
     def fetch(self) -> list[NormalizedJob]:
         listing_url = "https://www.cryptocurrencyjobs.co/"
-        html = fetch_html(listing_url)
-        soup, _ = soup_links(html)
+        html = fetch_html(self.resolve(listing_url))
+        soup, _ = soup_links(html, parse_only=self.parse_only)
 
         jobs: list[NormalizedJob] = []
         seen: set[str] = set()
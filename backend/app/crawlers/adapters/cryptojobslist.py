@@ -4,13 +4,17 @@ from datetime import datetime, timedelta
 import re
 from urllib.parse import urljoin
 
+from bs4 import SoupStrainer
+
 from app.crawlers.base import NormalizedJob
-from app.crawlers.http_helpers import fetch_html, soup_links
+from app.crawlers.http_helpers import class_pattern, fetch_html, soup_links
 from app.crawlers.base import SourceAdapter
 
 
 class CryptoJobsListAdapter(SourceAdapter):
     source_name = "cryptojobslist"
+    base_url = "https://cryptojobslist.com"
+    parse_only = SoupStrainer("table", class_=class_pattern("job-preview-inline-table"))
 
     @staticmethod
     def _parse_posted_at(age_text: str) -> datetime | None:
@@ -40,8 +44,8 @@ class CryptoJobsListAdapter(SourceAdapter):
 
     def fetch(self):
         listing_url = "https://cryptojobslist.com"
-        html = fetch_html(listing_url)
-        soup, _ = soup_links(html)
+        html = fetch_html(self.resolve(listing_url))
+        soup, _ = soup_links(html, parse_only=self.parse_only)
         jobs: list[NormalizedJob] = []
         seen: set[str] = set()
 
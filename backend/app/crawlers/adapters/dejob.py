@@ -64,6 +64,7 @@ def _build_jobs(results: list[dict[str, Any]]) -> list[NormalizedJob]:
 
 class DeJobAdapter(SourceAdapter):
     source_name = "dejob"
+    base_url = "https://dejob.ai"
 
     def fetch(self) -> list[NormalizedJob]:
         headers = {"User-Agent": "Mozilla/5.0", "Accept-Language": "en-US"}
@@ -73,7 +74,7 @@ class DeJobAdapter(SourceAdapter):
             # Pull a bounded number of pages for stability and speed.
             for page in range(1, 5):
                 url = f"https://dejob.ai/api/worker/topics?page={page}&limit=20"
-                resp = client.get(url)
+                resp = client.get(self.resolve(url))
                 resp.raise_for_status()
                 payload = resp.json()
                 data = payload.get("data") if isinstance(payload, dict) else {}
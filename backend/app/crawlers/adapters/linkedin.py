@@ -4,13 +4,17 @@ from datetime import datetime
 import re
 from urllib.parse import urljoin, urlsplit, urlunsplit
 
+from bs4 import SoupStrainer
+
 from app.crawlers.base import NormalizedJob
-from app.crawlers.http_helpers import fetch_html, soup_links
+from app.crawlers.http_helpers import class_pattern, fetch_html, soup_links
 from app.crawlers.base import SourceAdapter
 
 
 class LinkedInAdapter(SourceAdapter):
     source_name = "linkedin"
+    base_url = "https://www.linkedin.com"
+    parse_only = SoupStrainer("div", class_=class_pattern("base-card", "base-search-card"))
 
     @staticmethod
     def _parse_posted_at(card) -> datetime | None:
@@ -35,8 +39,8 @@ class LinkedInAdapter(SourceAdapter):
 
     def fetch(self):
         listing_url = "https://www.linkedin.com/jobs/search/?keywords=web3%20crypto%20blockchain"
-        html = fetch_html(listing_url)
-        soup, _ = soup_links(html)
+        html = fetch_html(self.resolve(listing_url))
+        soup, _ = soup_links(html, parse_only=self.parse_only)
         jobs: list[NormalizedJob] = []
         seen: set[str] = set()
 
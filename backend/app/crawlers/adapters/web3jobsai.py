@@ -3,8 +3,10 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 from urllib.parse import urljoin
 
+from bs4 import SoupStrainer
+
 from app.crawlers.base import NormalizedJob, SourceAdapter
-from app.crawlers.http_helpers import fetch_html, soup_links
+from app.crawlers.http_helpers import class_pattern, fetch_html, soup_links
 
 
 def _parse_date(text: str) -> datetime | None:
@@ -21,6 +23,8 @@ def _parse_date(text: str) -> datetime | None:
 
 class Web3JobsAiAdapter(SourceAdapter):
     source_name = "web3jobsai"
+    base_url = "https://web3jobs.ai"
+    parse_only = SoupStrainer("article", class_=class_pattern("job-list"))
 
     @staticmethod
     def _extract_detail(detail_url: str) -> tuple[str, str, str]:
@@ -43,8 +47,8 @@ class Web3JobsAiAdapter(SourceAdapter):
 
     def fetch(self) -> list[NormalizedJob]:
         listing_url = "https://web3jobs.ai/jobs/"
-        html = fetch_html(listing_url)
-        soup, _ = soup_links(html)
+        html = fetch_html(self.resolve(listing_url))
+        soup, _ = soup_links(html, parse_only=self.parse_only)
 
         jobs: list[NormalizedJob] = []
         seen: set[str] = set()
@@ -80,7 +84,7 @@ class Web3JobsAiAdapter(SourceAdapter):
             description = ""
             # Only request detail pages for potentially recent roles to control runtime.
             if posted_at and posted_at >= now - timedelta(days=2):
-                company, company_url, description = self._extract_detail(canonical_url)
+                company, company_url, description = self._extract_detail(self.resolve(canonical_url))
 
             category_el = article.select_one(".category-job a")
             category = " ".join(category_el.get_text(" ", strip=True).split()) if category_el else ""
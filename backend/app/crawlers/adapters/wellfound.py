@@ -5,10 +5,8 @@ from app.crawlers.base import SourceAdapter
 
 class WellfoundAdapter(SourceAdapter):
     source_name = "wellfound"
+    base_url = "https://wellfound.com"
 
     def fetch(self):
-        return scrape_jobs_from_listing(
-            "https://wellfound.com/role/l/web3",
-            "wellfound",
-            "wellfound.com",
-        )
+        listing_url = "https://wellfound.com/role/l/web3"
+        return scrape_jobs_from_listing(listing_url, "wellfound", "wellfound.com", fetch_url=self.resolve(listing_url))
@@ -6,10 +6,10 @@ import json
 import re
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 
 from app.crawlers.base import NormalizedJob, SourceAdapter
-from app.crawlers.http_helpers import fetch_html, soup_links
+from app.crawlers.http_helpers import class_pattern, fetch_html, make_soup, soup_links
 
 
 def _parse_relative_posted(text: str) -> datetime | None:
@@ -47,6 +47,8 @@ def _parse_relative_posted(text: str) -> datetime | None:
 
 class WorkAtStartupAIAdapter(SourceAdapter):
     source_name = "workatstartup_ai"
+    base_url = "https://www.workatastartup.com"
+    parse_only = SoupStrainer("div", class_=class_pattern("jobs-list"))
 
     @staticmethod
     def _extract_detail(detail_url: str) -> tuple[str, str, str]:
@@ -87,7 +89,7 @@ class WorkAtStartupAIAdapter(SourceAdapter):
 
                     desc_html = job_data.get("description")
                     if isinstance(desc_html, str) and desc_html:
-                        description = BeautifulSoup(desc_html, "html.parser").get_text(" ", strip=True)
+                        description = make_soup(desc_html).get_text(" ", strip=True)
 
         if not description:
             meta_desc = soup.select_one("meta[property='og:description']")
@@ -101,8 +103,8 @@ class WorkAtStartupAIAdapter(SourceAdapter):
 
     def fetch(self) -> list[NormalizedJob]:
         listing_url = "https://www.workatastartup.com/jobs?query=ai"
-        html = fetch_html(listing_url)
-        soup, _ = soup_links(html)
+        html = fetch_html(self.resolve(listing_url))
+        soup, _ = soup_links(html, parse_only=self.parse_only)
 
         jobs: list[NormalizedJob] = []
         seen: set[str] = set()
@@ -146,7 +148,7 @@ class WorkAtStartupAIAdapter(SourceAdapter):
             if company_link:
                 company_url = company_link.get("href", "").strip()
 
-            detail_company, detail_company_url, detail_description = self._extract_detail(canonical_url)
+            detail_company, detail_company_url, detail_description = self._extract_detail(self.resolve(canonical_url))
             if detail_company:
                 company = detail_company
             if detail_company_url:
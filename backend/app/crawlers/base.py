@@ -1,9 +1,30 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
+import sys
 
+# Values that repeat across thousands of jobs; interning keeps one copy of each string.
+INTERNED_FIELDS = ("company", "location", "remote_type", "employment_type")
+# raw_payload values up to this length (site names, modes, company urls) are interned too.
+PAYLOAD_INTERN_MAX_LENGTH = 64
 
-@dataclass
+
+def _intern(value):
+    # sys.intern rejects str subclasses such as bs4's NavigableString.
+    return sys.intern(str(value)) if isinstance(value, str) else value
+
+
+def compact_payload(payload: dict | None) -> dict:
+    """Intern keys and short strings. Every entry is kept, empty ones included: ``raw_payload`` is stored as parsed."""
+    compact = {}
+    for key, value in (payload or {}).items():
+        if isinstance(value, str) and len(value) <= PAYLOAD_INTERN_MAX_LENGTH:
+            value = _intern(value)
+        compact[_intern(key)] = value
+    return compact
+
+
+@dataclass(slots=True)
 class NormalizedJob:
     source_job_id: str | None
     canonical_url: str
@@ -16,9 +37,38 @@ class NormalizedJob:
     posted_at: datetime | None = None
     raw_payload: dict = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Adapters create millions of these in backfills; keep the per-instance footprint small.
+        for name in INTERNED_FIELDS:
+            setattr(self, name, _intern(getattr(self, name)))
+        self.raw_payload = compact_payload(self.raw_payload)
+
 
 class SourceAdapter:
     source_name: str
+    # Optional bs4 SoupStrainer: only the matching subtrees of the listing page are parsed.
+    parse_only = None
+    # Opaque state persisted between runs (source_cursors). run_crawl loads it before fetch()
+    # and stores whatever fetch() left behind once the run succeeds.
+    cursor: dict | None = None
+    # Origin the adapter crawls. Source.crawl_config can redirect it ("base_url") and any other
+    # origin it requests ("url_overrides"), e.g. to a mirror or a local mock server.
+    base_url: str = ""
+    url_overrides: dict[str, str] = {}
+
+    def configure(self, crawl_config: dict | None) -> None:
+        crawl_config = crawl_config or {}
+        overrides = dict(crawl_config.get("url_overrides") or {})
+        if crawl_config.get("base_url") and self.base_url:
+            overrides[self.base_url] = crawl_config["base_url"]
+        self.url_overrides = {origin.rstrip("/"): target.rstrip("/") for origin, target in overrides.items()}
+
+    def resolve(self, url: str) -> str:
+        """Map ``url`` onto its configured override; canonical job URLs keep the public origin."""
+        for origin, target in self.url_overrides.items():
+            if url.startswith(origin) and url[len(origin) : len(origin) + 1] in ("", "/", "?", "#"):
+                return target + url[len(origin) :]
+        return url
 
     def fetch(self) -> list[NormalizedJob]:
         raise NotImplementedError
@@ -1,18 +1,78 @@
 from __future__ import annotations
-from bs4 import BeautifulSoup
+from collections.abc import Sequence
+from functools import lru_cache
+import re
+
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
 import httpx
 
+from app.core.config import settings
 
-def fetch_html(url: str, timeout: int = 30) -> str:
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
-    }
-    with httpx.Client(timeout=timeout, follow_redirects=True, headers=headers) as client:
+FALLBACK_PARSER = "html.parser"
+
+
+BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+}
+
+
+def _get(url: str, timeout: int) -> httpx.Response:
+    with httpx.Client(timeout=timeout, follow_redirects=True, headers=BROWSER_HEADERS) as client:
         resp = client.get(url)
         resp.raise_for_status()
-        return resp.text
+        return resp
+
+
+def fetch_html(url: str, timeout: int = 30) -> str:
+    return _get(url, timeout).text
+
+
+def fetch_bytes(url: str, timeout: int = 30) -> bytes:
+    return _get(url, timeout).content
+
+
+@lru_cache(maxsize=None)
+def resolve_parser(name: str) -> str:
+    # "lxml" is an optional extra; fall back to the stdlib parser when it is not installed.
+    try:
+        BeautifulSoup("", name)
+    except FeatureNotFound:
+        return FALLBACK_PARSER
+    return name
+
+
+def class_pattern(*names: str) -> re.Pattern:
+    # While a strainer runs, the class attribute is still the raw "a b c" string, so match whole tokens.
+    alternatives = "|".join(re.escape(name) for name in names)
+    return re.compile(rf"(?:^|\s)(?:{alternatives})(?:\s|$)")
+
+
+def make_soup(html: str, parser: str | None = None, parse_only: SoupStrainer | None = None) -> BeautifulSoup:
+    return BeautifulSoup(html, resolve_parser(parser or settings.html_parser), parse_only=parse_only)
+
+
+class LazyLinks(Sequence):
+    """All <a> tags of a soup, collected on first access."""
+
+    def __init__(self, soup: BeautifulSoup):
+        self._soup = soup
+        self._links: list | None = None
+
+    def _load(self) -> list:
+        if self._links is None:
+            self._links = self._soup.find_all("a")
+        return self._links
+
+    def __getitem__(self, index):
+        return self._load()[index]
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __iter__(self):
+        return iter(self._load())
 
 
-def soup_links(html: str):
-    soup = BeautifulSoup(html, "html.parser")
-    return soup, soup.find_all("a")
+def soup_links(html: str, parse_only: SoupStrainer | None = None):
+    soup = make_soup(html, parse_only=parse_only)
+    return soup, LazyLinks(soup)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+from collections.abc import Iterable, Iterator
+import json
+import re
+
+try:
+    import orjson
+except ImportError:  # optional `fast` extra
+    orjson = None
+
+# Matches <script type="application/ld+json"> bodies directly in the raw bytes, no DOM needed.
+_SCRIPT_RE = re.compile(
+    rb"<script\b[^>]*?\btype\s*=\s*[\"']?application/ld\+json[\"']?[^>]*>(.*?)</script\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _loads(body: bytes):
+    body = body.strip()
+    if body.startswith(b"<!--") and body.endswith(b"-->"):
+        body = body[4:-3].strip()
+    if not body:
+        return None
+    try:
+        if orjson is not None:
+            return orjson.loads(body)
+        return json.loads(body)
+    except ValueError:
+        return None
+
+
+def _flatten(node) -> Iterator[dict]:
+    if isinstance(node, list):
+        for item in node:
+            yield from _flatten(item)
+    elif isinstance(node, dict):
+        graph = node.get("@graph")
+        if isinstance(graph, list):
+            yield from _flatten(graph)
+        else:
+            yield node
+
+
+def _type_names(node: dict) -> set[str]:
+    value = node.get("@type")
+    if isinstance(value, list):
+        return {str(x) for x in value}
+    return {str(value)} if value else set()
+
+
+def iter_json_ld(raw: bytes | str, types: Iterable[str] | None = None) -> Iterator[dict]:
+    if isinstance(raw, str):
+        raw = raw.encode("utf-8")
+    wanted = set(types) if types else None
+
+    for match in _SCRIPT_RE.finditer(raw):
+        for node in _flatten(_loads(match.group(1))):
+            if wanted is None or _type_names(node) & wanted:
+                yield node
+
+
+def iter_job_postings(raw: bytes | str) -> Iterator[dict]:
+    return iter_json_ld(raw, ("JobPosting",))
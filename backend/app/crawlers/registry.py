@@ -1,24 +1,55 @@
 from __future__ import annotations
-from app.crawlers.adapters.aijobsnet import AIJobsNetAdapter
-from app.crawlers.adapters.cryptojobslist import CryptoJobsListAdapter
-from app.crawlers.adapters.cryptocurrencyjobs import CryptocurrencyJobsAdapter
-from app.crawlers.adapters.dejob import DeJobAdapter
-from app.crawlers.adapters.linkedin import LinkedInAdapter
-from app.crawlers.adapters.abetterweb3 import ABetterWeb3Adapter
-from app.crawlers.adapters.workatstartup_ai import WorkAtStartupAIAdapter
-from app.crawlers.adapters.web3jobsai import Web3JobsAiAdapter
-from app.crawlers.adapters.web3career import Web3CareerAdapter
-from app.crawlers.adapters.wellfound import WellfoundAdapter
-
-ADAPTERS = {
-    "aijobsnet": AIJobsNetAdapter,
-    "linkedin": LinkedInAdapter,
-    "cryptojobslist": CryptoJobsListAdapter,
-    "cryptocurrencyjobs": CryptocurrencyJobsAdapter,
-    "workatstartup_ai": WorkAtStartupAIAdapter,
-    "web3career": Web3CareerAdapter,
-    "web3jobsai": Web3JobsAiAdapter,
-    "wellfound": WellfoundAdapter,
-    "dejob": DeJobAdapter,
-    "abetterweb3": ABetterWeb3Adapter,
+from collections.abc import Iterator, MutableMapping
+from importlib import import_module
+
+from app.crawlers.base import SourceAdapter
+
+# Source name -> "module:Class". Adapters pull in BeautifulSoup/httpx, so they are imported on first lookup only.
+ADAPTER_PATHS = {
+    "aijobsnet": "app.crawlers.adapters.aijobsnet:AIJobsNetAdapter",
+    "linkedin": "app.crawlers.adapters.linkedin:LinkedInAdapter",
+    "cryptojobslist": "app.crawlers.adapters.cryptojobslist:CryptoJobsListAdapter",
+    "cryptocurrencyjobs": "app.crawlers.adapters.cryptocurrencyjobs:CryptocurrencyJobsAdapter",
+    "workatstartup_ai": "app.crawlers.adapters.workatstartup_ai:WorkAtStartupAIAdapter",
+    "web3career": "app.crawlers.adapters.web3career:Web3CareerAdapter",
+    "web3jobsai": "app.crawlers.adapters.web3jobsai:Web3JobsAiAdapter",
+    "wellfound": "app.crawlers.adapters.wellfound:WellfoundAdapter",
+    "dejob": "app.crawlers.adapters.dejob:DeJobAdapter",
+    "abetterweb3": "app.crawlers.adapters.abetterweb3:ABetterWeb3Adapter",
 }
+
+
+def load_adapter(path: str) -> type[SourceAdapter]:
+    module_name, _, attr = path.partition(":")
+    return getattr(import_module(module_name), attr)
+
+
+class LazyAdapterRegistry(MutableMapping):
+    """Maps source names to adapter classes, importing each adapter module on first access."""
+
+    def __init__(self, paths: dict[str, str | type[SourceAdapter]]):
+        self._entries: dict[str, str | type[SourceAdapter]] = dict(paths)
+
+    def __getitem__(self, name: str) -> type[SourceAdapter]:
+        entry = self._entries[name]
+        if isinstance(entry, str):
+            entry = self._entries[name] = load_adapter(entry)
+        return entry
+
+    def __setitem__(self, name: str, value: str | type[SourceAdapter]) -> None:
+        self._entries[name] = value
+
+    def __delitem__(self, name: str) -> None:
+        del self._entries[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries
+
+
+ADAPTERS = LazyAdapterRegistry(ADAPTER_PATHS)
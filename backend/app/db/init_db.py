@@ -1,9 +1,137 @@
 from __future__ import annotations
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+import hashlib
+import json
+
+from sqlalchemy import inspect, select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
 from app.db.database import Base, engine
-from app.models import crawl_run, job, job_score, notification, setting, source
-from app.services.seed import seed_sources_if_empty
+from app.models import (
+    crawl_run,
+    job,
+    job_body,
+    job_score,
+    notification,
+    notification_outbox,
+    schema_version,
+    setting,
+    source,
+    source_cursor,
+)
+from app.models.schema_version import SchemaVersion
+from app.services.job_search import POSTGRES_SEARCH_DDL, POSTGRES_TRIGRAM_DDL, ensure_search_index
+from app.services.seed import DEFAULT_SOURCES, default_notification_config, seed_sources_if_empty
+
+# Data backfills run by init_db; listed in the fingerprint so adding one re-runs startup migrations.
+BACKFILLS = ("jobs.domain",)
+
+# Arbitrary constant shared by every replica; pg_advisory_lock serializes their startup migrations.
+INIT_DB_LOCK_ID = 0x77336A6D
+
+
+def _add_missing_columns() -> None:
+    # Nullable columns added to existing models are backfilled with ALTER TABLE; anything else needs a manual migration.
+    inspector = inspect(engine)
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing or not column.nullable:
+                continue
+            column_type = column.type.compile(dialect=engine.dialect)
+            with engine.begin() as conn:
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+
+
+def _backfill() -> None:
+    # Columns added by _add_missing_columns start out NULL on existing rows.
+    from app.services.crawl_service import backfill_job_domains
+
+    with Session(bind=engine) as db:
+        backfill_job_domains(db)
+
+
+def _ensure_indexes() -> None:
+    # create_all only creates indexes together with new tables; add ones declared later to existing tables.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
+def schema_fingerprint() -> str:
+    """Hash of everything init_db creates or seeds; a change means startup has work to do."""
+    tables = [
+        [
+            table.name,
+            [[column.name, str(column.type), column.nullable] for column in table.columns],
+            sorted(index.name for index in table.indexes),
+        ]
+        for table in Base.metadata.sorted_tables
+    ]
+    payload = {
+        "tables": tables,
+        "search_ddl": [*POSTGRES_SEARCH_DDL, *POSTGRES_TRIGRAM_DDL],
+        "sources": DEFAULT_SOURCES,
+        "notification_keys": sorted(default_notification_config()),
+        "backfills": BACKFILLS,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _stored_fingerprint() -> str | None:
+    try:
+        with engine.connect() as conn:
+            return conn.execute(select(SchemaVersion.fingerprint).where(SchemaVersion.id == 1)).scalar()
+    except DBAPIError:
+        # Fresh database: the marker table does not exist yet.
+        return None
+
+
+def _store_fingerprint(fingerprint: str) -> None:
+    with engine.begin() as conn:
+        updated = conn.execute(
+            SchemaVersion.__table__.update()
+            .where(SchemaVersion.id == 1)
+            .values(fingerprint=fingerprint, updated_at=datetime.utcnow())
+        ).rowcount
+        if not updated:
+            conn.execute(
+                SchemaVersion.__table__.insert().values(id=1, fingerprint=fingerprint, updated_at=datetime.utcnow())
+            )
+
+
+@contextmanager
+def _migration_lock() -> Iterator[None]:
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+    with engine.connect() as conn:
+        conn.execute(text("SELECT pg_advisory_lock(:id)"), {"id": INIT_DB_LOCK_ID})
+        conn.commit()
+        try:
+            yield
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": INIT_DB_LOCK_ID})
+            conn.commit()
 
 
 def init_db() -> None:
-    Base.metadata.create_all(bind=engine)
-    seed_sources_if_empty()
+    fingerprint = schema_fingerprint()
+    if _stored_fingerprint() == fingerprint:
+        return
+    with _migration_lock():
+        # Another replica may have finished while this one waited for the lock.
+        if _stored_fingerprint() == fingerprint:
+            return
+        Base.metadata.create_all(bind=engine)
+        _add_missing_columns()
+        _ensure_indexes()
+        ensure_search_index(engine)
+        seed_sources_if_empty()
+        _backfill()
+        _store_fingerprint(fingerprint)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+from bisect import bisect_left
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# Upper bounds (ms) of the checkout wait buckets; anything slower lands in "+inf".
+WAIT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+
+class WaitHistogram:
+    def __init__(self, buckets_ms: tuple[int, ...] = WAIT_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self._counts = [0] * (len(self.buckets_ms) + 1)
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+        self._timeouts = 0
+
+    def observe(self, seconds: float, timed_out: bool = False) -> None:
+        elapsed_ms = seconds * 1000
+        with self._lock:
+            self._counts[bisect_left(self.buckets_ms, elapsed_ms)] += 1
+            self._count += 1
+            self._total_ms += elapsed_ms
+            self._max_ms = max(self._max_ms, elapsed_ms)
+            if timed_out:
+                self._timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            labels = [f"le_{bound}ms" for bound in self.buckets_ms] + ["+inf"]
+            return {
+                "count": self._count,
+                "timeouts": self._timeouts,
+                "total_ms": round(self._total_ms, 3),
+                "max_ms": round(self._max_ms, 3),
+                "buckets": dict(zip(labels, self._counts)),
+            }
+
+
+def _timed_do_get(base: type[QueuePool]):
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            entry = base._do_get(self)
+        except PoolTimeoutError:
+            self.wait_histogram.observe(time.perf_counter() - started, timed_out=True)
+            raise
+        self.wait_histogram.observe(time.perf_counter() - started)
+        return entry
+
+    return _do_get
+
+
+def instrumented_pool_class(base: type[QueuePool], histogram: WaitHistogram) -> type[QueuePool]:
+    """A ``base`` subclass timing every checkout into ``histogram``; survives ``Pool.recreate()``."""
+    return type(f"Instrumented{base.__name__}", (base,), {"wait_histogram": histogram, "_do_get": _timed_do_get(base)})
+
+
+sync_wait_histogram = WaitHistogram()
+async_wait_histogram = WaitHistogram()
+InstrumentedQueuePool = instrumented_pool_class(QueuePool, sync_wait_histogram)
+InstrumentedAsyncQueuePool = instrumented_pool_class(AsyncAdaptedQueuePool, async_wait_histogram)
+
+
+def pool_stats(pool: Pool) -> dict:
+    if not isinstance(pool, QueuePool):
+        return {"pool": type(pool).__name__}
+    stats = {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+    }
+    histogram = getattr(pool, "wait_histogram", None)
+    if histogram is not None:
+        stats["wait"] = histogram.snapshot()
+    return stats
@@ -0,0 +1,81 @@
+from __future__ import annotations
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import logging
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_active: ContextVar[tuple[QueryStats, ...]] = ContextVar("query_stats", default=())
+
+
+class QueryStats:
+    """Statements executed and time spent in the database while ``track_queries`` is active."""
+
+    def __init__(self, keep_statements: bool = False):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: list[str] | None = [] if keep_statements else None
+
+    def mark(self) -> tuple[int, float]:
+        return self.count, self.seconds
+
+    def since(self, mark: tuple[int, float]) -> dict:
+        count, seconds = mark
+        return {"queries": self.count - count, "db_ms": round((self.seconds - seconds) * 1000, 3)}
+
+    def snapshot(self) -> dict:
+        return self.since((0, 0.0))
+
+
+@contextmanager
+def track_queries(keep_statements: bool = False) -> Iterator[QueryStats]:
+    # Trackers nest: a query counts towards every active one (request, crawl, test budget).
+    stats = QueryStats(keep_statements)
+    token = _active.set((*_active.get(), stats))
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+
+
+@contextmanager
+def assert_query_budget(limit: int) -> Iterator[QueryStats]:
+    """Fail if the block executes more than ``limit`` statements; the message lists them."""
+    with track_queries(keep_statements=True) as stats:
+        yield stats
+    if stats.count > limit:
+        listing = "\n".join(f"  {statement}" for statement in stats.statements)
+        raise AssertionError(f"{stats.count} queries executed, budget is {limit}:\n{listing}")
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started"].pop()
+    elapsed = time.perf_counter() - started
+    for stats in _active.get():
+        stats.count += 1
+        stats.seconds += elapsed
+        if stats.statements is not None:
+            stats.statements.append(statement)
+    if settings.slow_query_ms and elapsed * 1000 >= settings.slow_query_ms:
+        logger.warning("slow query (%.1f ms): %s", elapsed * 1000, statement)
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute; drop its start time.
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started"):
+        conn.info["query_started"].pop()
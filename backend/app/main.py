@@ -3,7 +3,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import auth, crawl, health, jobs, runs, settings as settings_api, sources
+from app.api.middleware import DB_TIME_HEADER, QUERY_COUNT_HEADER, QueryCountMiddleware
 from app.core.config import settings
+from app.db.database import dispose_async_engine
 from app.db.init_db import init_db
 
 app = FastAPI(title=settings.app_name)
@@ -13,12 +15,14 @@ if not origins:
     origins = ["*"]
 allow_credentials = settings.cors_allow_credentials and "*" not in origins
 
+app.add_middleware(QueryCountMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=allow_credentials,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[QUERY_COUNT_HEADER, DB_TIME_HEADER],
 )
 
 
@@ -27,6 +31,11 @@ def on_startup():
     init_db()
 
 
+@app.on_event("shutdown")
+async def on_shutdown():
+    await dispose_async_engine()
+
+
 app.include_router(health.router)
 app.include_router(auth.router, prefix=settings.api_prefix)
 app.include_router(jobs.router, prefix=settings.api_prefix)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 from app.models.crawl_run import CrawlRun
 from app.models.job import Job
+from app.models.job_body import JobBody
 from app.models.job_score import JobScore
 from app.models.notification import Notification
+from app.models.notification_outbox import NotificationOutbox
+from app.models.schema_version import SchemaVersion
 from app.models.setting import Setting
 from app.models.source import Source
+from app.models.source_cursor import SourceCursor
 
-__all__ = ["CrawlRun", "Job", "JobScore", "Notification", "Setting", "Source"]
+__all__ = ["CrawlRun", "Job", "JobBody", "JobScore", "Notification", "NotificationOutbox", "SchemaVersion", "Setting", "Source", "SourceCursor"]
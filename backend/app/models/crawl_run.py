@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.database import Base
@@ -11,6 +11,7 @@ from app.db.database import Base
 
 class CrawlRun(Base):
     __tablename__ = "crawl_runs"
+    __table_args__ = (Index("ix_crawl_runs_started_at_id", "started_at", "id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     source_id: Mapped[int] = mapped_column(ForeignKey("sources.id"), nullable=False)
@@ -22,3 +23,8 @@ class CrawlRun(Base):
     blocked_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     status: Mapped[str] = mapped_column(String(16), default="running", nullable=False)
     error_summary: Mapped[str] = mapped_column(Text, default="", nullable=False)
+    # Statements the source's crawl executed and the time spent in them.
+    query_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    db_ms: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    # Directory with the CPU profile and tracemalloc snapshot of a profiled crawl.
+    profile_path: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
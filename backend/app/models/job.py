@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, JSON, String, Text, UniqueConstraint
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, JSON, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.database import Base
@@ -14,6 +14,7 @@ class Job(Base):
     __table_args__ = (
         UniqueConstraint("source_id", "source_job_id", name="uq_jobs_source_sourcejob"),
         UniqueConstraint("source_id", "fallback_hash", name="uq_jobs_source_hash"),
+        Index("ix_jobs_collected_at_id", "collected_at", "id"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -27,6 +28,7 @@ class Job(Base):
     location: Mapped[str] = mapped_column(String(256), default="", nullable=False)
     remote_type: Mapped[str] = mapped_column(String(64), default="unknown", nullable=False)
     employment_type: Mapped[str] = mapped_column(String(64), default="unknown", nullable=False)
+    domain: Mapped[Optional[str]] = mapped_column(String(16), nullable=True)
     description: Mapped[str] = mapped_column(Text, default="", nullable=False)
     posted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     collected_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from sqlalchemy import ForeignKey, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.database import Base
+
+
+class JobBody(Base):
+    """Compressed description and raw_payload of a job stored outside the hot ``jobs`` rows."""
+
+    __tablename__ = "job_bodies"
+
+    job_id: Mapped[int] = mapped_column(ForeignKey("jobs.id"), primary_key=True)
+    codec: Mapped[str] = mapped_column(String(8), nullable=False)
+    description: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    raw_payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
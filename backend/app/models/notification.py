@@ -19,3 +19,5 @@ class Notification(Base):
     sent_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     status: Mapped[str] = mapped_column(String(16), nullable=False)
     error: Mapped[str] = mapped_column(Text, default="", nullable=False)
+    # Outbox batch that will deliver this notification; set while the row is "pending".
+    batch_id: Mapped[Optional[str]] = mapped_column(String(32), index=True, nullable=True)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, Index, Integer, JSON, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.database import Base
+
+
+class NotificationOutbox(Base):
+    __tablename__ = "notification_outbox"
+    __table_args__ = (Index("ix_notification_outbox_status_next_attempt", "status", "next_attempt_at"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    batch_id: Mapped[str] = mapped_column(String(32), index=True, nullable=False)
+    channel: Mapped[str] = mapped_column(String(32), default="discord", nullable=False)
+    mode: Mapped[str] = mapped_column(String(32), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
+    # Sent as the Discord message nonce, so a redelivery after a crash is dropped by Discord.
+    idempotency_key: Mapped[str] = mapped_column(String(25), unique=True, nullable=False)
+    status: Mapped[str] = mapped_column(String(16), default="pending", nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    last_error: Mapped[str] = mapped_column(Text, default="", nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # When a drainer moved the row to "sending"; stale claims are released after OUTBOX_CLAIM_TIMEOUT_SECONDS.
+    claimed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
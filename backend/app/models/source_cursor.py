@@ -0,0 +1,15 @@
+from __future__ import annotations
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, JSON
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.database import Base
+
+
+class SourceCursor(Base):
+    __tablename__ = "source_cursors"
+
+    source_id: Mapped[int] = mapped_column(ForeignKey("sources.id"), primary_key=True)
+    value: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
@@ -4,7 +4,7 @@ from app.schemas.job import JobOut
 from app.schemas.run import CrawlRunOut
 from app.schemas.score import JobScoreOut, ScoreConfig
 from app.schemas.setting import CrawlTriggerResponse, NotificationSettings
-from app.schemas.source import SourceOut, SourcePatch
+from app.schemas.source import CircuitBreakerOut, SourceOut, SourcePatch
 
 __all__ = [
     "LoginRequest",
@@ -15,6 +15,7 @@ __all__ = [
     "ScoreConfig",
     "CrawlTriggerResponse",
     "NotificationSettings",
+    "CircuitBreakerOut",
     "SourceOut",
     "SourcePatch",
 ]
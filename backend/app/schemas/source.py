@@ -1,7 +1,13 @@
 from __future__ import annotations
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
+
+
+class CircuitBreakerOut(BaseModel):
+    state: str
+    consecutive_failures: int
+    retry_at: datetime | None
 
 
 class SourceOut(BaseModel):
@@ -11,10 +17,32 @@ class SourceOut(BaseModel):
     enabled: bool
     crawl_config: dict
     created_at: datetime
+    breaker: CircuitBreakerOut | None = None
 
     class Config:
         from_attributes = True
 
 
+def _check_http_url(value) -> None:
+    if not isinstance(value, str) or not value.startswith(("http://", "https://")):
+        raise ValueError(f"expected an http(s) URL, got {value!r}")
+
+
 class SourcePatch(BaseModel):
-    enabled: bool
+    enabled: bool | None = None
+    crawl_config: dict | None = None
+
+    @field_validator("crawl_config")
+    @classmethod
+    def _check_urls(cls, value: dict | None) -> dict | None:
+        if value is None:
+            return value
+        if "base_url" in value:
+            _check_http_url(value["base_url"])
+        overrides = value.get("url_overrides") or {}
+        if not isinstance(overrides, dict):
+            raise ValueError("url_overrides must map origins to URLs")
+        for origin, target in overrides.items():
+            _check_http_url(origin)
+            _check_http_url(target)
+        return value
@@ -0,0 +1,87 @@
+from __future__ import annotations
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.crawl_run import CrawlRun
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Only finished runs count; "running" rows and runs skipped by the breaker itself are ignored.
+_DECISIVE_STATUSES = ("success", "failed")
+_HISTORY_LIMIT = 50
+
+
+def cooldown_for(failures: int, threshold: int) -> timedelta:
+    # Doubles with every failed probe after the circuit opened, up to breaker_max_cooldown_minutes.
+    base = max(0, settings.breaker_cooldown_minutes)
+    ceiling = max(base, settings.breaker_max_cooldown_minutes)
+    return timedelta(minutes=min(ceiling, base * 2 ** max(0, failures - threshold)))
+
+
+def _history_limit(threshold: int) -> int:
+    return max(threshold, _HISTORY_LIMIT)
+
+
+def _state_from_history(rows, threshold: int, now: datetime) -> dict:
+    """Breaker state from a source's decisive runs, newest first."""
+    failures = 0
+    last_failure_at: datetime | None = None
+    for status, started_at, finished_at in rows:
+        if status != "failed":
+            break
+        failures += 1
+        if last_failure_at is None:
+            last_failure_at = finished_at or started_at
+
+    if failures < threshold or last_failure_at is None:
+        return {"state": CLOSED, "consecutive_failures": failures, "retry_at": None}
+
+    retry_at = last_failure_at + cooldown_for(failures, threshold)
+    if now < retry_at:
+        return {"state": OPEN, "consecutive_failures": failures, "retry_at": retry_at}
+    # Cool-down elapsed: let one probe run through. Its outcome closes or re-opens the circuit.
+    return {"state": HALF_OPEN, "consecutive_failures": failures, "retry_at": retry_at}
+
+
+def breaker_state(db: Session, source_id: int, now: datetime | None = None) -> dict:
+    threshold = max(1, settings.breaker_failure_threshold)
+    rows = (
+        db.query(CrawlRun.status, CrawlRun.started_at, CrawlRun.finished_at)
+        .filter(CrawlRun.source_id == source_id, CrawlRun.status.in_(_DECISIVE_STATUSES))
+        .order_by(CrawlRun.started_at.desc(), CrawlRun.id.desc())
+        .limit(_history_limit(threshold))
+        .all()
+    )
+    return _state_from_history(rows, threshold, now or datetime.utcnow())
+
+
+def breaker_states(db: Session, source_ids: list[int], now: datetime | None = None) -> dict[int, dict]:
+    """``breaker_state`` of several sources from one query over their recent decisive runs."""
+    threshold = max(1, settings.breaker_failure_threshold)
+    if not source_ids:
+        return {}
+    position = (
+        func.row_number()
+        .over(partition_by=CrawlRun.source_id, order_by=(CrawlRun.started_at.desc(), CrawlRun.id.desc()))
+        .label("position")
+    )
+    recent = (
+        select(CrawlRun.source_id, CrawlRun.status, CrawlRun.started_at, CrawlRun.finished_at, position)
+        .where(CrawlRun.source_id.in_(source_ids), CrawlRun.status.in_(_DECISIVE_STATUSES))
+        .subquery()
+    )
+    rows = db.execute(
+        select(recent.c.source_id, recent.c.status, recent.c.started_at, recent.c.finished_at)
+        .where(recent.c.position <= _history_limit(threshold))
+        .order_by(recent.c.source_id, recent.c.position)
+    ).all()
+    history: dict[int, list] = {source_id: [] for source_id in source_ids}
+    for source_id, status, started_at, finished_at in rows:
+        history[source_id].append((status, started_at, finished_at))
+    now = now or datetime.utcnow()
+    return {source_id: _state_from_history(runs, threshold, now) for source_id, runs in history.items()}
@@ -2,20 +2,28 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 import re
 
-from sqlalchemy import desc, func
+from sqlalchemy import Row, desc, func, select, tuple_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.crawlers.registry import ADAPTERS
+from app.db.query_stats import QueryStats, track_queries
 from app.models.crawl_run import CrawlRun
 from app.models.job import Job
+from app.models.job_body import JobBody
 from app.models.job_score import JobScore
 from app.models.notification import Notification
 from app.models.source import Source
+from app.models.source_cursor import SourceCursor
+from app.services.circuit_breaker import OPEN, breaker_state
+from app.services.job_bodies import decode_description, encode_body, external_bodies, search_excerpt
 from app.services.notifier import DiscordNotifier
+from app.services.outbox import enqueue_batch
+from app.services.response_cache import bump_cache_generation
 from app.services.scoring import Scorer
 from app.services.settings_service import get_setting
 from app.utils.hash import job_fallback_hash
+from app.utils.stages import stage
 
 EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
 TELEGRAM_RE = re.compile(r"(https?://t\.me/[A-Za-z0-9_]+|@[A-Za-z0-9_]{5,})")
@@ -402,6 +410,28 @@ def _classify_job_domain(source_name: str, title: str, description: str) -> str:
     return "web3"
 
 
+def backfill_job_domains(db: Session, batch_size: int = 1000) -> int:
+    """Classify jobs stored before ``jobs.domain`` existed; returns the number of rows updated."""
+    updated = 0
+    while True:
+        rows = (
+            db.query(Job, Source.name, JobBody.codec, JobBody.description)
+            .join(Source, Source.id == Job.source_id)
+            .outerjoin(JobBody, JobBody.job_id == Job.id)
+            .filter(Job.domain.is_(None))
+            .order_by(Job.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            return updated
+        for job, source_name, codec, compressed in rows:
+            description = decode_description(codec, compressed) if codec else job.description
+            job.domain = _classify_job_domain(source_name, job.title, description)
+        db.commit()
+        updated += len(rows)
+
+
 def _is_asia_job(location: str, title: str, description: str) -> bool:
     text = " ".join([(location or ""), (title or ""), (description or "")[:1000]]).lower()
     return any(_keyword_hit(text, keyword) for keyword in ASIA_LOCATION_KEYWORDS)
@@ -504,25 +534,34 @@ def _is_prod_research_job(title: str, description: str) -> bool:
 
 def _build_company_summaries(db: Session, company_stats: dict[str, dict], now_utc: datetime) -> list[dict]:
     summaries: list[dict] = []
-    for stat in company_stats.values():
+    stats = [stat for stat in company_stats.values() if stat["company"].strip().lower() != "unknown company"]
+    # Two statements for all companies instead of two per company.
+    keys = {stat["company"].lower() for stat in stats}
+    recent_by_company: dict[str, list] = {}
+    first_seen_by_company: dict[str, datetime] = {}
+    if keys:
+        company_key = func.lower(Job.company)
+        recent_rows = db.execute(
+            select(company_key, Job.collected_at, Job.source_id, Job.title).where(
+                company_key.in_(keys), Job.collected_at >= now_utc - timedelta(days=30)
+            )
+        )
+        for key, collected_at, source_id, title in recent_rows:
+            recent_by_company.setdefault(key, []).append((collected_at, source_id, title))
+        first_seen_rows = db.execute(
+            select(company_key, func.min(Job.collected_at)).where(company_key.in_(keys)).group_by(company_key)
+        )
+        first_seen_by_company = dict(first_seen_rows.all())
+
+    for stat in stats:
         company = stat["company"]
-        if company.strip().lower() == "unknown company":
-            continue
 
         source_counts = stat["source_counts"]
         main_source = sorted(source_counts.items(), key=lambda x: (-x[1], x[0]))[0][0]
         avg_score = stat["score_sum"] / stat["new_jobs"] if stat["new_jobs"] else 0.0
         company_url = stat["company_url"]
 
-        company_rows = (
-            db.query(Job, JobScore)
-            .outerjoin(JobScore, Job.id == JobScore.job_id)
-            .filter(
-                func.lower(Job.company) == company.lower(),
-                Job.collected_at >= now_utc - timedelta(days=30),
-            )
-            .all()
-        )
+        company_rows = recent_by_company.get(company.lower(), [])
         recent_30d = len(company_rows)
         recent_7d = 0
         prev_7d = 0
@@ -530,13 +569,12 @@ def _build_company_summaries(db: Session, company_stats: dict[str, dict], now_ut
         senior_count_30d = 0
         source_ids_30d: set = set()
 
-        for job, _score in company_rows:
-            collected = job.collected_at
+        for collected, source_id, title in company_rows:
             if not collected:
                 continue
             active_days_30d.add(collected.date())
-            source_ids_30d.add(job.source_id)
-            if _contains_senior_signal(job.title):
+            source_ids_30d.add(source_id)
+            if _contains_senior_signal(title):
                 senior_count_30d += 1
             if collected >= now_utc - timedelta(days=7):
                 recent_7d += 1
@@ -550,9 +588,7 @@ def _build_company_summaries(db: Session, company_stats: dict[str, dict], now_ut
         )
         contact_action = _contact_recommendation_label(contact_priority, hiring_status)
 
-        first_seen_at = (
-            db.query(func.min(Job.collected_at)).filter(func.lower(Job.company) == company.lower()).scalar()
-        )
+        first_seen_at = first_seen_by_company.get(company.lower())
         first_seen_text = first_seen_at.strftime("%Y-%m-%d") if first_seen_at else "N/A"
 
         dedup_role_map: dict[str, dict] = {}
@@ -634,7 +670,35 @@ def _build_company_summaries(db: Session, company_stats: dict[str, dict], now_ut
     return summaries
 
 
-def run_crawl(db: Session) -> dict:
+def _store_cursor(db: Session, source_id: int, row: SourceCursor | None, cursor: dict | None) -> None:
+    if not cursor or (row is not None and row.value == cursor):
+        return
+    if row is None:
+        row = SourceCursor(source_id=source_id)
+    row.value = dict(cursor)
+    row.updated_at = datetime.utcnow()
+    db.add(row)
+
+
+END_OF_PUSH_MESSAGE = "[END_OF_PUSH] 今日岗位推送结束，请 <@1473632297671725096> 生成今日报告"
+
+
+def _record_queries(run: CrawlRun, queries: QueryStats, mark: tuple[int, float]) -> dict:
+    # Covers the source's statements up to, not including, the commit that stores these numbers.
+    usage = queries.since(mark)
+    run.query_count = usage["queries"]
+    run.db_ms = usage["db_ms"]
+    return usage
+
+
+def run_crawl(db: Session, profile_path: str | None = None) -> dict:
+    with track_queries() as queries:
+        digest = _run_crawl(db, profile_path, queries)
+    digest["db"] = queries.snapshot()
+    return digest
+
+
+def _run_crawl(db: Session, profile_path: str | None, queries: QueryStats) -> dict:
     sources = db.query(Source).filter(Source.enabled.is_(True)).all()
     score_cfg = get_setting(db, "scoring")
     notify_cfg = get_setting(db, "notifications")
@@ -656,7 +720,36 @@ def run_crawl(db: Session) -> dict:
     all_new_job_details: list[dict] = []
 
     for source in sources:
-        run = CrawlRun(source_id=source.id, started_at=datetime.utcnow(), status="running")
+        breaker = breaker_state(db, source.id)
+        if breaker["state"] == OPEN:
+            skipped_at = datetime.utcnow()
+            db.add(
+                CrawlRun(
+                    source_id=source.id,
+                    started_at=skipped_at,
+                    finished_at=skipped_at,
+                    status="skipped",
+                    profile_path=profile_path,
+                    error_summary=(
+                        f"circuit open after {breaker['consecutive_failures']} consecutive failures, "
+                        f"retry after {breaker['retry_at'].strftime('%Y-%m-%d %H:%M UTC')}"
+                    ),
+                )
+            )
+            db.commit()
+            source_stats.append(
+                {
+                    "source": source.name,
+                    "fetched": 0,
+                    "new": 0,
+                    "high": 0,
+                    "status": "circuit_open",
+                }
+            )
+            continue
+
+        query_mark = queries.mark()
+        run = CrawlRun(source_id=source.id, started_at=datetime.utcnow(), status="running", profile_path=profile_path)
         db.add(run)
         db.commit()
         db.refresh(run)
@@ -671,41 +764,52 @@ def run_crawl(db: Session) -> dict:
                 raise ValueError(f"missing adapter for source={source.name}")
 
             adapter = adapter_cls()
-            jobs = adapter.fetch()
+            if hasattr(adapter, "configure"):
+                adapter.configure(source.crawl_config)
+            cursor_row = db.get(SourceCursor, source.id)
+            if hasattr(adapter, "cursor"):
+                adapter.cursor = dict(cursor_row.value) if cursor_row else {}
+            with stage("parse"):
+                jobs = adapter.fetch()
             fetched_count = len(jobs)
 
             for normalized in jobs:
-                normalized_posted_at = _to_utc_naive(normalized.posted_at)
-                if not _is_recent_posted(normalized_posted_at, now_utc):
-                    continue
-                if not _is_ai_domain_job(source.name, normalized.title, normalized.description):
-                    continue
-                if not _is_prod_research_job(normalized.title, normalized.description):
-                    continue
-
-                fallback_hash = None
-                if not normalized.source_job_id:
-                    fallback_hash = job_fallback_hash(normalized.canonical_url, normalized.title, normalized.company)
-
-                existing = None
-                if normalized.source_job_id:
-                    existing = (
-                        db.query(Job)
-                        .filter(Job.source_id == source.id, Job.source_job_id == normalized.source_job_id)
-                        .first()
-                    )
-                if not existing:
-                    hash_to_use = fallback_hash or job_fallback_hash(
-                        normalized.canonical_url,
-                        normalized.title,
-                        normalized.company,
-                    )
-                    existing = db.query(Job).filter(Job.source_id == source.id, Job.fallback_hash == hash_to_use).first()
+                with stage("filter"):
+                    normalized_posted_at = _to_utc_naive(normalized.posted_at)
+                    if not _is_recent_posted(normalized_posted_at, now_utc):
+                        continue
+                    if not _is_ai_domain_job(source.name, normalized.title, normalized.description):
+                        continue
+                    if not _is_prod_research_job(normalized.title, normalized.description):
+                        continue
+
+                with stage("dedup"):
+                    fallback_hash = None
+                    if not normalized.source_job_id:
+                        fallback_hash = job_fallback_hash(normalized.canonical_url, normalized.title, normalized.company)
+
+                    existing = None
+                    if normalized.source_job_id:
+                        existing = (
+                            db.query(Job)
+                            .filter(Job.source_id == source.id, Job.source_job_id == normalized.source_job_id)
+                            .first()
+                        )
+                    if not existing:
+                        hash_to_use = fallback_hash or job_fallback_hash(
+                            normalized.canonical_url,
+                            normalized.title,
+                            normalized.company,
+                        )
+                        existing = db.query(Job).filter(Job.source_id == source.id, Job.fallback_hash == hash_to_use).first()
 
                 if existing:
                     existing.is_new = False
                     continue
 
+                with stage("score"):
+                    domain = _classify_job_domain(source.name, normalized.title, normalized.description)
+                body = encode_body(normalized.description, normalized.raw_payload) if external_bodies() else None
                 record = Job(
                     source_id=source.id,
                     source_job_id=normalized.source_job_id,
@@ -717,45 +821,52 @@ def run_crawl(db: Session) -> dict:
                     location=normalized.location,
                     remote_type=normalized.remote_type,
                     employment_type=normalized.employment_type,
-                    description=normalized.description,
+                    domain=domain,
+                    description=normalized.description if body is None else search_excerpt(normalized.description),
                     posted_at=normalized_posted_at,
                     collected_at=datetime.utcnow(),
-                    raw_payload=normalized.raw_payload,
+                    raw_payload=normalized.raw_payload if body is None else {},
                     is_new=True,
                 )
-                db.add(record)
-                try:
-                    db.commit()
-                except IntegrityError:
-                    db.rollback()
-                    continue
-
-                db.refresh(record)
+                with stage("persist"):
+                    db.add(record)
+                    try:
+                        if body is not None:
+                            db.flush()
+                            body.job_id = record.id
+                            db.add(body)
+                        db.commit()
+                    except IntegrityError:
+                        db.rollback()
+                        continue
+
+                    db.refresh(record)
                 new_count += 1
                 total_new += 1
 
-                domain = _classify_job_domain(source.name, record.title, record.description)
-                is_asia = _is_asia_job(record.location, record.title, record.description)
-                score_result = scorer.score(
-                    {
-                        "title": record.title,
-                        "description": record.description,
-                        "location": record.location,
-                        "remote_type": record.remote_type,
-                    }
-                )
-                score_row = JobScore(
-                    job_id=record.id,
-                    total_score=score_result.total_score,
-                    keyword_score=score_result.keyword_score,
-                    seniority_score=score_result.seniority_score,
-                    remote_bonus=score_result.remote_bonus,
-                    region_bonus=score_result.region_bonus,
-                    decision=score_result.decision,
-                    scored_at=datetime.utcnow(),
-                )
-                db.add(score_row)
-                db.commit()
+                with stage("score"):
+                    is_asia = _is_asia_job(record.location, record.title, normalized.description)
+                    score_result = scorer.score(
+                        {
+                            "title": record.title,
+                            "description": normalized.description,
+                            "location": record.location,
+                            "remote_type": record.remote_type,
+                        }
+                    )
+                with stage("persist"):
+                    score_row = JobScore(
+                        job_id=record.id,
+                        total_score=score_result.total_score,
+                        keyword_score=score_result.keyword_score,
+                        seniority_score=score_result.seniority_score,
+                        remote_bonus=score_result.remote_bonus,
+                        region_bonus=score_result.region_bonus,
+                        decision=score_result.decision,
+                        scored_at=datetime.utcnow(),
+                    )
+                    db.add(score_row)
+                    db.commit()
 
                 posted_at_dt = record.posted_at or record.collected_at
                 all_new_job_details.append(
@@ -798,11 +909,11 @@ def run_crawl(db: Session) -> dict:
                 stat["max_score"] = max(stat["max_score"], float(score_result.total_score))
                 stat["score_sum"] += float(score_result.total_score)
                 if not stat["company_url"]:
-                    stat["company_url"] = _pick_company_url(record.raw_payload, record.canonical_url)
+                    stat["company_url"] = _pick_company_url(normalized.raw_payload, record.canonical_url)
                 stat["source_counts"][source.name] = stat["source_counts"].get(source.name, 0) + 1
                 stat["source_websites"][source.name] = source.base_url
 
-                role_candidates = _extract_role_candidates(record.title, record.description)
+                role_candidates = _extract_role_candidates(record.title, normalized.description)
                 for role_title in role_candidates:
                     stat["new_roles"].append(
                         {
@@ -815,7 +926,9 @@ def run_crawl(db: Session) -> dict:
                         }
                     )
 
-                clues = _extract_contact_clues(record.description, record.raw_payload, stat["company_url"], record.canonical_url)
+                clues = _extract_contact_clues(
+                    normalized.description, normalized.raw_payload, stat["company_url"], record.canonical_url
+                )
                 stat["contact_clues"]["emails"].update(clues["emails"])
                 stat["contact_clues"]["telegrams"].update(clues["telegrams"])
                 stat["contact_clues"]["career_urls"].update(clues["career_urls"])
@@ -837,13 +950,16 @@ def run_crawl(db: Session) -> dict:
                         }
                     )
 
+            _store_cursor(db, source.id, cursor_row, getattr(adapter, "cursor", None))
             run.status = "success"
             run.fetched_count = fetched_count
             run.new_count = new_count
             run.high_priority_count = high_count
             run.finished_at = datetime.utcnow()
+            usage = _record_queries(run, queries, query_mark)
             db.add(run)
             db.commit()
+            bump_cache_generation()
 
             source_stats.append(
                 {
@@ -852,6 +968,7 @@ def run_crawl(db: Session) -> dict:
                     "new": new_count,
                     "high": high_count,
                     "status": "success",
+                    **usage,
                 }
             )
         except Exception as exc:  # noqa: BLE001
@@ -859,8 +976,10 @@ def run_crawl(db: Session) -> dict:
             run.status = "failed"
             run.error_summary = str(exc)[:2000]
             run.finished_at = datetime.utcnow()
+            usage = _record_queries(run, queries, query_mark)
             db.add(run)
             db.commit()
+            bump_cache_generation()
             failed_sources.append(source.name)
             source_stats.append(
                 {
@@ -869,15 +988,18 @@ def run_crawl(db: Session) -> dict:
                     "new": new_count,
                     "high": high_count,
                     "status": "failed",
+                    **usage,
                 }
             )
 
+    with stage("digest"):
+        company_summaries = _build_company_summaries(db, company_stats, now_utc)
     digest = {
         "new_jobs": total_new,
         "high_priority_jobs": total_high,
         "failed_sources": failed_sources,
         "source_stats": source_stats,
-        "company_summaries": _build_company_summaries(db, company_stats, now_utc),
+        "company_summaries": company_summaries,
         "high_jobs": sorted(high_job_details, key=lambda x: (-x["score"], x["company"].lower(), x["title"].lower())),
     }
 
@@ -893,7 +1015,8 @@ def run_crawl(db: Session) -> dict:
         .filter(
             Notification.channel == "discord",
             Notification.mode == "job_digest_item",
-            Notification.status == "sent",
+            # Items still queued in the outbox count too, so back-to-back runs cannot overshoot the limit.
+            Notification.status.in_(("sent", "pending")),
             Notification.sent_at >= now_utc - timedelta(days=1),
         )
         .count()
@@ -943,47 +1066,26 @@ def run_crawl(db: Session) -> dict:
         }
     )
 
-    send_errors: list[str] = []
-    send_success_count = 0
-    digest_status = "skipped" if quiet_hours else "failed"
-    digest_error = "quiet hours" if quiet_hours else ""
-
+    batch_id = None
+    status = "skipped"
+    error = "quiet hours"
     if not quiet_hours:
-        # Send digest as multiple clear messages to improve readability.
-        payloads = notifier.build_digest_payloads(digest)
-        for payload in payloads:
-            ok, msg = notifier.send(payload)
-            if ok:
-                send_success_count += 1
-            else:
-                send_errors.append(msg)
-
-        if send_success_count > 0:
-            digest_status = "sent"
-            digest_error = "" if not send_errors else " | ".join(send_errors)[:2000]
-        else:
-            digest_status = "failed"
-            digest_error = "" if not send_errors else " | ".join(send_errors)[:2000]
-
-    end_push_sent = False
-    end_push_status = "skipped"
-    end_push_error = "quiet hours" if quiet_hours else ""
-    if not quiet_hours:
-        end_ok, end_msg = notifier.send({"content": "[END_OF_PUSH] 今日岗位推送结束，请 <@1473632297671725096> 生成今日报告"})
-        end_push_sent = end_ok
-        end_push_status = "sent" if end_ok else "failed"
-        end_push_error = "" if end_ok else end_msg
-
-    job_item_status = "skipped" if quiet_hours else ("sent" if send_success_count > 0 else "failed")
-    job_item_error = "quiet hours" if quiet_hours else ("" if send_success_count > 0 else "digest send failed")
+        # Messages are queued and delivered by deliver_outbox, so Discord latency never lengthens the crawl.
+        with stage("digest"):
+            messages = [("digest", payload) for payload in notifier.build_digest_payloads(digest)]
+            messages.append(("end_of_push", {"content": END_OF_PUSH_MESSAGE}))
+            batch_id = enqueue_batch(db, messages)
+        status = "pending"
+        error = ""
 
     db.add(
         Notification(
             job_id=None,
             channel="discord",
             mode="digest",
-            status=digest_status,
-            error=digest_error,
+            status=status,
+            error=error,
+            batch_id=batch_id,
         )
     )
     for item in selected_jobs:
@@ -992,24 +1094,30 @@ def run_crawl(db: Session) -> dict:
                 job_id=item["job_id"],
                 channel="discord",
                 mode="job_digest_item",
-                status=job_item_status,
-                error=job_item_error,
+                status=status,
+                error=error,
+                batch_id=batch_id,
             )
         )
-    if end_push_status in {"sent", "failed", "skipped"}:
-        db.add(
-            Notification(
-                job_id=None,
-                channel="discord",
-                mode="end_of_push",
-                status=end_push_status,
-                error=end_push_error[:2000],
-            )
+    db.add(
+        Notification(
+            job_id=None,
+            channel="discord",
+            mode="end_of_push",
+            status=status,
+            error=error,
+            batch_id=batch_id,
         )
+    )
     db.commit()
+    bump_cache_generation()
 
     return digest
 
 
-def list_runs(db: Session, limit: int = 100) -> list[CrawlRun]:
-    return db.query(CrawlRun).order_by(desc(CrawlRun.started_at)).limit(limit).all()
+def list_runs(db: Session, limit: int = 100, before: tuple[datetime, int] | None = None) -> list[Row]:
+    stmt = select(*CrawlRun.__table__.columns)
+    if before is not None:
+        started_at, run_id = before
+        stmt = stmt.where(tuple_(CrawlRun.started_at, CrawlRun.id) < tuple_(started_at, run_id))
+    return db.execute(stmt.order_by(desc(CrawlRun.started_at), desc(CrawlRun.id)).limit(limit)).all()
@@ -0,0 +1,105 @@
+"""Compressed storage of job descriptions and raw payloads in ``job_bodies``.
+
+    python -m app.services.job_bodies [--batch-size 500]
+
+moves the bodies of existing jobs out of the ``jobs`` rows (run VACUUM afterwards on Postgres).
+"""
+from __future__ import annotations
+import argparse
+import json
+import zlib
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.job import Job
+from app.models.job_body import JobBody
+from app.utils.serialization import dumps
+
+try:
+    import zstandard
+except ImportError:  # optional `fast` extra
+    zstandard = None
+
+
+def _compress(data: bytes) -> tuple[str, bytes]:
+    if zstandard is not None:
+        return "zstd", zstandard.ZstdCompressor().compress(data)
+    return "zlib", zlib.compress(data)
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == "zlib":
+        return zlib.decompress(data)
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("job body is zstd-compressed; install the `fast` extra to read it")
+        return zstandard.ZstdDecompressor().decompress(data)
+    raise ValueError(f"unknown job body codec: {codec}")
+
+
+def external_bodies() -> bool:
+    return settings.job_body_storage == "compressed"
+
+
+def search_excerpt(description: str) -> str:
+    """The plain-text start of a description kept in ``jobs.description`` so search still sees it."""
+    return description[: settings.job_search_excerpt_chars]
+
+
+def encode_body(description: str, raw_payload: dict) -> JobBody:
+    """A JobBody without ``job_id``; the caller sets it once the job row has an id."""
+    codec, compressed_description = _compress(description.encode("utf-8"))
+    _codec, compressed_payload = _compress(dumps(raw_payload))
+    return JobBody(codec=codec, description=compressed_description, raw_payload=compressed_payload)
+
+
+def decode_description(codec: str, data: bytes) -> str:
+    return _decompress(codec, data).decode("utf-8")
+
+
+def decode_payload(codec: str, data: bytes) -> dict:
+    return json.loads(_decompress(codec, data))
+
+
+def externalize_bodies(db: Session, batch_size: int = 500) -> int:
+    """Move inline bodies of jobs without a job_bodies row into it; returns the number of jobs moved."""
+    moved = 0
+    last_id = 0
+    while True:
+        stored = select(JobBody.job_id).where(JobBody.job_id == Job.id)
+        jobs = (
+            db.query(Job)
+            .filter(Job.id > last_id, ~stored.exists())
+            .order_by(Job.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not jobs:
+            return moved
+        for job in jobs:
+            body = encode_body(job.description or "", job.raw_payload or {})
+            body.job_id = job.id
+            db.add(body)
+            job.description = search_excerpt(job.description or "")
+            job.raw_payload = {}
+        last_id = jobs[-1].id
+        db.commit()
+        moved += len(jobs)
+
+
+if __name__ == "__main__":
+    from app.db.database import SessionLocal
+    from app.db.init_db import init_db
+
+    parser = argparse.ArgumentParser(description="Move job descriptions and raw payloads into job_bodies.")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    init_db()
+    db = SessionLocal()
+    try:
+        print({"moved": externalize_bodies(db, args.batch_size)})
+    finally:
+        db.close()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+import logging
+import re
+
+from sqlalchemy import func, literal_column, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.job import Job
+
+logger = logging.getLogger(__name__)
+
+# "simple" keeps tokens unstemmed: titles mix English, Chinese and product names.
+SEARCH_CONFIG = "simple"
+SEARCH_DOCUMENT_SQL = (
+    f"to_tsvector('{SEARCH_CONFIG}', coalesce(title, '') || ' ' || coalesce(company, '') || ' ' || "
+    "coalesce(description, ''))"
+)
+WORD_RE = re.compile(r"[^\W_]+")
+# Quotes, negation and OR are websearch syntax; such queries are not widened with prefix matching.
+WEBSEARCH_OPERATOR_RE = re.compile(r'["-]|\bor\b', re.IGNORECASE)
+CJK_RE = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]")
+
+_SEARCH_VECTOR = literal_column("jobs.search_vector")
+
+POSTGRES_SEARCH_DDL = (
+    f"ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ({SEARCH_DOCUMENT_SQL}) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_jobs_search_vector ON jobs USING gin (search_vector)",
+)
+# Trigram indexes back the ILIKE fallback used for CJK text, which the tsvector parser cannot segment.
+POSTGRES_TRIGRAM_DDL = (
+    "CREATE INDEX IF NOT EXISTS ix_jobs_title_trgm ON jobs USING gin (title gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_jobs_company_trgm ON jobs USING gin (company gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_jobs_description_trgm ON jobs USING gin (description gin_trgm_ops)",
+)
+
+
+_trigram_available: bool | None = None
+
+
+def has_cjk(value: str) -> bool:
+    return CJK_RE.search(value or "") is not None
+
+
+def trigram_available(conn) -> bool:
+    """Whether pg_trgm is installed (cached per process); without it word_similarity() does not exist."""
+    global _trigram_available
+    if _trigram_available is None:
+        row = conn.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")).first()
+        _trigram_available = row is not None
+    return _trigram_available
+
+
+def prefix_tsquery(q: str) -> str | None:
+    """``to_tsquery`` text matching every word with the last one as a prefix: "solid eng" -> "solid & eng:*"."""
+    if WEBSEARCH_OPERATOR_RE.search(q):
+        return None
+    words = WORD_RE.findall(q.lower())
+    if not words:
+        return None
+    return " & ".join([*words[:-1], f"{words[-1]}:*"])
+
+
+def ensure_search_index(engine: Engine) -> None:
+    if engine.dialect.name != "postgresql":
+        return
+    with engine.begin() as conn:
+        for statement in POSTGRES_SEARCH_DDL:
+            conn.execute(text(statement))
+    global _trigram_available
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            for statement in POSTGRES_TRIGRAM_DDL:
+                conn.execute(text(statement))
+        _trigram_available = True
+    except DBAPIError as exc:
+        _trigram_available = False
+        logger.warning("pg_trgm unavailable, CJK search falls back to sequential scans and recency order: %s", exc)
+
+
+def _ilike_condition(q: str) -> ColumnElement:
+    like = f"%{q}%"
+    return (Job.title.ilike(like)) | (Job.company.ilike(like)) | (Job.description.ilike(like))
+
+
+def search_condition(q: str, dialect_name: str, trigram: bool = True) -> tuple[ColumnElement, ColumnElement | None]:
+    """Return the WHERE clause for ``q`` and, where the backend supports it, a relevance expression.
+
+    ``trigram=False`` (pg_trgm missing) drops the CJK relevance rank, so results fall back to recency.
+    """
+    q = q.strip()
+    if dialect_name != "postgresql":
+        return _ilike_condition(q), None
+
+    if has_cjk(q):
+        if not trigram:
+            return _ilike_condition(q), None
+        rank = func.greatest(func.word_similarity(q, Job.title), func.word_similarity(q, Job.company))
+        return _ilike_condition(q), rank
+
+    tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    condition = _SEARCH_VECTOR.op("@@")(tsquery)
+    prefix = prefix_tsquery(q)
+    if prefix is not None:
+        # Keeps the substring feel of the old ILIKE search: "eng" finds "engineer", "solid" finds "Solidity".
+        prefix_query = func.to_tsquery(SEARCH_CONFIG, prefix)
+        condition = condition | _SEARCH_VECTOR.op("@@")(prefix_query)
+        tsquery = tsquery.op("||")(prefix_query)
+    return condition, func.ts_rank_cd(_SEARCH_VECTOR, tsquery)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
+import time
 
 import httpx
 
@@ -8,11 +11,61 @@ import httpx
 class DiscordNotifier:
     MAX_DETAILED_COMPANIES = 20
     MIN_DETAILED_PER_SOURCE = 2
+    MAX_RATE_LIMIT_RETRIES = 3
 
     def __init__(self, webhook_url: str, bot_token: str = "", channel_id: str = ""):
         self.webhook_url = webhook_url
         self.bot_token = bot_token
         self.channel_id = channel_id
+        self._client: httpx.Client | None = None
+        # route url -> (remaining requests, monotonic time the bucket resets)
+        self._buckets: dict[str, tuple[int, float]] = {}
+
+    @contextmanager
+    def session(self) -> Iterator[DiscordNotifier]:
+        """Reuse one keep-alive client for every send() inside the block, e.g. a whole digest."""
+        if self._client is not None:
+            yield self
+            return
+        with httpx.Client(timeout=20) as client:
+            self._client = client
+            try:
+                yield self
+            finally:
+                self._client = None
+
+    def _wait_for_bucket(self, url: str) -> None:
+        remaining, reset_at = self._buckets.get(url, (1, 0.0))
+        delay = reset_at - time.monotonic()
+        if remaining <= 0 and delay > 0:
+            time.sleep(delay)
+
+    def _update_bucket(self, url: str, resp) -> None:
+        remaining = resp.headers.get("X-RateLimit-Remaining")
+        reset_after = resp.headers.get("X-RateLimit-Reset-After")
+        if remaining is None or reset_after is None:
+            return
+        try:
+            self._buckets[url] = (int(remaining), time.monotonic() + float(reset_after))
+        except ValueError:
+            return
+
+    @staticmethod
+    def _retry_after(resp) -> float:
+        try:
+            return float(resp.json().get("retry_after"))
+        except Exception:  # noqa: BLE001
+            return float(resp.headers.get("Retry-After") or 1)
+
+    def _post(self, url: str, payload: dict, headers: dict | None = None):
+        # Honour Discord's per-route buckets up front so a digest never trips a 429; retry if one slips through.
+        for attempt in range(1, self.MAX_RATE_LIMIT_RETRIES + 1):
+            self._wait_for_bucket(url)
+            resp = self._client.post(url, headers=headers, json=payload)
+            self._update_bucket(url, resp)
+            if resp.status_code != 429 or attempt == self.MAX_RATE_LIMIT_RETRIES:
+                return resp
+            time.sleep(self._retry_after(resp))
 
     @staticmethod
     def build_single_payload(job: dict, score: dict, run_id: int) -> dict:
@@ -253,7 +306,15 @@ class DiscordNotifier:
             return payloads[0]
         return {"content": "Web3 招聘监控汇总: 无数据"}
 
-    def send(self, payload: dict) -> tuple[bool, str]:
+    @classmethod
+    def from_config(cls, notify_cfg: dict) -> DiscordNotifier:
+        return cls(
+            webhook_url=notify_cfg.get("discord_webhook_url") or "",
+            bot_token=notify_cfg.get("discord_bot_token") or "",
+            channel_id=notify_cfg.get("discord_channel_id") or "",
+        )
+
+    def send(self, payload: dict, idempotency_key: str | None = None) -> tuple[bool, str]:
         if not self.bot_token and not self.webhook_url:
             return False, "discord notifier not configured"
         try:
@@ -262,23 +323,27 @@ class DiscordNotifier:
             if "embeds" not in send_payload and "flags" not in send_payload:
                 send_payload["flags"] = 4
 
-            with httpx.Client(timeout=20) as client:
+            with self.session():
                 if self.bot_token and self.channel_id:
                     bot_url = f"https://discord.com/api/v10/channels/{self.channel_id}/messages"
-                    resp = client.post(
+                    bot_payload = send_payload
+                    if idempotency_key:
+                        # Discord drops a repeated nonce, so an outbox redelivery cannot double-post.
+                        bot_payload = {**send_payload, "nonce": idempotency_key, "enforce_nonce": True}
+                    resp = self._post(
                         bot_url,
+                        bot_payload,
                         headers={
                             "Authorization": f"Bot {self.bot_token}",
                             "Content-Type": "application/json",
                         },
-                        json=send_payload,
                     )
                     if resp.status_code < 300:
                         return True, "ok"
                     if not self.webhook_url:
                         return False, f"discord bot status={resp.status_code} body={resp.text[:300]}"
 
-                resp = client.post(self.webhook_url, json=send_payload)
+                resp = self._post(self.webhook_url, send_payload)
                 if resp.status_code >= 300:
                     return False, f"discord webhook status={resp.status_code} body={resp.text[:300]}"
             return True, "ok"
@@ -0,0 +1,212 @@
+from __future__ import annotations
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import secrets
+import time
+import uuid
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.notification import Notification
+from app.models.notification_outbox import NotificationOutbox
+from app.services.notifier import DiscordNotifier
+from app.services.response_cache import bump_cache_generation
+from app.services.settings_service import get_setting
+
+PENDING = "pending"
+# Claimed by one drainer while its send is in flight.
+SENDING = "sending"
+SENT = "sent"
+FAILED = "failed"
+
+
+def enqueue_batch(db: Session, messages: list[tuple[str, dict]]) -> str:
+    """Append (mode, payload) messages to the outbox as one ordered batch; the caller commits."""
+    batch_id = uuid.uuid4().hex
+    now = datetime.utcnow()
+    for mode, payload in messages:
+        db.add(
+            NotificationOutbox(
+                batch_id=batch_id,
+                mode=mode,
+                payload=payload,
+                idempotency_key=secrets.token_hex(12),
+                status=PENDING,
+                next_attempt_at=now,
+                created_at=now,
+            )
+        )
+    return batch_id
+
+
+def _finalize_batch(db: Session, batch_id: str) -> None:
+    rows = db.query(NotificationOutbox).filter(NotificationOutbox.batch_id == batch_id).all()
+    if any(row.status in (PENDING, SENDING) for row in rows):
+        return
+
+    digest_rows = [row for row in rows if row.mode == "digest"]
+    digest_sent = any(row.status == SENT for row in digest_rows)
+    digest_errors = " | ".join(row.last_error for row in digest_rows if row.status == FAILED and row.last_error)
+    end_rows = [row for row in rows if row.mode == "end_of_push"]
+
+    pending = (
+        db.query(Notification)
+        .filter(Notification.batch_id == batch_id, Notification.status == PENDING)
+        .all()
+    )
+    now = datetime.utcnow()
+    for notification in pending:
+        if notification.mode == "digest":
+            notification.status = SENT if digest_sent else FAILED
+            notification.error = digest_errors[:2000]
+        elif notification.mode == "job_digest_item":
+            notification.status = SENT if digest_sent else FAILED
+            notification.error = "" if digest_sent else "digest send failed"
+        elif notification.mode == "end_of_push" and end_rows:
+            notification.status = end_rows[0].status
+            notification.error = end_rows[0].last_error[:2000]
+        notification.sent_at = now
+        db.add(notification)
+
+
+def _claim(db: Session, row_id: int, now: datetime) -> bool:
+    # Conditional UPDATE: of several concurrent drainers only one moves the row out of pending.
+    claimed = db.execute(
+        update(NotificationOutbox)
+        .where(NotificationOutbox.id == row_id, NotificationOutbox.status == PENDING)
+        .values(status=SENDING, claimed_at=now)
+    ).rowcount
+    db.commit()
+    return claimed == 1
+
+
+def _release_stale_claims(db: Session, now: datetime) -> None:
+    # A drainer that crashed mid-send leaves its row in sending; retry it once the claim is old enough.
+    stale_before = now - timedelta(seconds=settings.outbox_claim_timeout_seconds)
+    db.execute(
+        update(NotificationOutbox)
+        .where(NotificationOutbox.status == SENDING, NotificationOutbox.claimed_at < stale_before)
+        .values(status=PENDING)
+    )
+    db.commit()
+
+
+def deliver_outbox(
+    db: Session,
+    notifier: DiscordNotifier | None = None,
+    max_attempts: int | None = None,
+    now: datetime | None = None,
+) -> dict:
+    """Send every due outbox message, retrying failures with exponential backoff."""
+    now = now or datetime.utcnow()
+    max_attempts = max(1, max_attempts or settings.outbox_max_attempts)
+    _release_stale_claims(db, now)
+    rows = db.scalars(
+        select(NotificationOutbox)
+        .where(NotificationOutbox.status.in_((PENDING, SENDING)))
+        .order_by(NotificationOutbox.id)
+    ).all()
+    stats = {"sent": 0, "failed": 0, "retrying": 0}
+    if not any(row.status == PENDING and row.next_attempt_at <= now for row in rows):
+        return stats
+
+    notifier = notifier or DiscordNotifier.from_config(get_setting(db, "notifications"))
+    # A message waiting on a retry holds back the rest of its batch so the end marker never overtakes the digest.
+    held_batches: set[str] = set()
+    touched_batches: list[str] = []
+    with notifier.session():
+        for row in rows:
+            if row.batch_id in held_batches:
+                continue
+            # Another drainer is sending this batch, or the message waits for its retry.
+            if row.status == SENDING or row.next_attempt_at > now or not _claim(db, row.id, now):
+                held_batches.add(row.batch_id)
+                continue
+            if row.batch_id not in touched_batches:
+                touched_batches.append(row.batch_id)
+
+            ok, msg = notifier.send(row.payload, idempotency_key=row.idempotency_key)
+            row.attempts += 1
+            row.status = PENDING
+            if ok:
+                row.status = SENT
+                row.sent_at = datetime.utcnow()
+                row.last_error = ""
+                stats["sent"] += 1
+            elif row.attempts >= max_attempts:
+                row.status = FAILED
+                row.last_error = msg[:2000]
+                stats["failed"] += 1
+            else:
+                row.last_error = msg[:2000]
+                row.next_attempt_at = now + timedelta(seconds=settings.outbox_retry_base_seconds * 2 ** (row.attempts - 1))
+                held_batches.add(row.batch_id)
+                stats["retrying"] += 1
+            db.add(row)
+            # Commit per message: a crash after this point never resends a delivered message.
+            db.commit()
+
+    for batch_id in touched_batches:
+        _finalize_batch(db, batch_id)
+    db.commit()
+    if any(stats.values()):
+        bump_cache_generation()
+    return stats
+
+
+def drain_until_settled(
+    db: Session,
+    notifier: DiscordNotifier | None = None,
+    max_wait_seconds: float | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> dict:
+    """Keep delivering, sleeping until retries fall due, until every message is sent or exhausted.
+
+    Gives up after ``max_wait_seconds`` (OUTBOX_DRAIN_MAX_SECONDS); what is left is picked up by the next drain.
+    """
+    budget = settings.outbox_drain_max_seconds if max_wait_seconds is None else max_wait_seconds
+    deadline = time.monotonic() + budget
+    totals = {"sent": 0, "failed": 0, "retrying": 0}
+    while True:
+        stats = deliver_outbox(db, notifier)
+        for key, value in stats.items():
+            totals[key] += value
+        now = datetime.utcnow()
+        next_retry = db.scalar(
+            select(func.min(NotificationOutbox.next_attempt_at)).where(
+                NotificationOutbox.status == PENDING, NotificationOutbox.next_attempt_at > now
+            )
+        )
+        if next_retry is None:
+            # Either settled, or due messages held by another drainer that will finish them.
+            if any(stats.values()):
+                continue
+            break
+        wait = (next_retry - now).total_seconds()
+        if time.monotonic() + wait > deadline:
+            break
+        sleep(wait)
+    totals["pending"] = db.scalar(
+        select(func.count()).select_from(NotificationOutbox).where(NotificationOutbox.status.in_((PENDING, SENDING)))
+    )
+    return totals
+
+
+def drain_outbox() -> dict:
+    """One delivery pass for API-triggered crawls; waiting for retries is left to run_crawler.py."""
+    db = SessionLocal()
+    try:
+        return deliver_outbox(db)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    db = SessionLocal()
+    try:
+        print(drain_until_settled(db))
+    finally:
+        db.close()
@@ -0,0 +1,187 @@
+from __future__ import annotations
+import cProfile
+from datetime import datetime
+import json
+import logging
+import multiprocessing
+import os
+from pathlib import Path
+import sys
+import threading
+import time
+import tracemalloc
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PSTATS_FILE = "cpu.pstats"
+SPEEDSCOPE_FILE = "cpu.speedscope.json"
+SNAPSHOT_FILE = "memory.tracemalloc"
+TOP_ALLOCATIONS_FILE = "memory-top.txt"
+
+
+class StackSampler:
+    """Samples one thread's Python stack from a helper thread and exports it as a speedscope profile.
+
+    cProfile only keeps caller/callee pairs, so the flame graph comes from sampling real stacks instead.
+    """
+
+    def __init__(self, thread_id: int | None = None, interval: float = 0.005):
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval
+        self.frames: list[dict] = []
+        self._frame_index: dict[tuple[str, str, int], int] = {}
+        self.samples: list[list[int]] = []
+        self.weights: list[float] = []
+        self.duration = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def _stack(self, frame) -> list[int]:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            key = (code.co_name, code.co_filename, code.co_firstlineno)
+            index = self._frame_index.get(key)
+            if index is None:
+                index = self._frame_index[key] = len(self.frames)
+                self.frames.append({"name": code.co_name, "file": code.co_filename, "line": code.co_firstlineno})
+            stack.append(index)
+            frame = frame.f_back
+        stack.reverse()
+        return stack
+
+    def _run(self) -> None:
+        start = last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            if frame is not None:
+                self.samples.append(self._stack(frame))
+                self.weights.append(now - last)
+            last = now
+        self.duration = time.perf_counter() - start
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def speedscope(self, name: str) -> dict:
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": settings.app_name,
+            "shared": {"frames": self.frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": self.duration,
+                    "samples": self.samples,
+                    "weights": self.weights,
+                }
+            ],
+        }
+
+
+def new_profile_dir(base_dir: str | None = None) -> Path:
+    stamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+    path = Path(base_dir or settings.profile_dir) / f"crawl-{stamp}-{os.getpid()}"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _write_artifacts(path: Path, profiler: cProfile.Profile, sampler: StackSampler, snapshot) -> None:
+    profiler.dump_stats(path / PSTATS_FILE)
+    (path / SPEEDSCOPE_FILE).write_text(json.dumps(sampler.speedscope(f"run_crawl {path.name}")), encoding="utf-8")
+    snapshot.dump(str(path / SNAPSHOT_FILE))
+    top = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)]).statistics("lineno")[:50]
+    (path / TOP_ALLOCATIONS_FILE).write_text("\n".join(str(stat) for stat in top) + "\n", encoding="utf-8")
+
+
+def profile_crawl(db: Session, base_dir: str | None = None) -> dict:
+    """Run ``run_crawl`` under cProfile, a stack sampler and tracemalloc and write the results next to each other.
+
+    Every CrawlRun of the crawl gets ``profile_path`` set to the name of the directory (under ``base_dir``,
+    default PROFILE_DIR) holding ``cpu.pstats``, ``cpu.speedscope.json`` and ``memory.tracemalloc``
+    (plus a readable top-allocations list).
+    """
+    from app.services.crawl_service import run_crawl
+
+    path = new_profile_dir(base_dir)
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start(10)
+    profiler = cProfile.Profile()
+    sampler = StackSampler()
+    sampler.start()
+    profiler.enable()
+    crawl_failed = False
+    try:
+        result = run_crawl(db, profile_path=path.name)
+    except BaseException:
+        crawl_failed = True
+        raise
+    finally:
+        profiler.disable()
+        sampler.stop()
+        snapshot = tracemalloc.take_snapshot()
+        if started_tracing:
+            tracemalloc.stop()
+        try:
+            _write_artifacts(path, profiler, sampler, snapshot)
+        except Exception:
+            if not crawl_failed:
+                raise
+            # The crawl's own error is the one worth re-raising.
+            logger.exception("could not write profile artifacts to %s", path)
+
+    result["profile_path"] = path.name
+    return result
+
+
+def _profile_child(database_url: str, base_dir: str | None, conn) -> None:
+    engine = create_engine(database_url, future=True, poolclass=NullPool)
+    db = Session(bind=engine, autoflush=False, future=True)
+    try:
+        conn.send((True, profile_crawl(db, base_dir)))
+    except Exception as exc:
+        conn.send((False, f"{type(exc).__name__}: {exc}"))
+    finally:
+        db.close()
+        engine.dispose()
+        conn.close()
+
+
+def profile_crawl_in_subprocess(database_url: str, base_dir: str | None = None) -> dict:
+    """``profile_crawl`` in a spawned child, so tracemalloc and the stack sampler only slow down the crawl.
+
+    Used by the API: profiling inside the server process would tax every concurrent request. The child is
+    spawned rather than forked because a fork of the threaded server can inherit locks held by other threads.
+    It only shares the database (and ``base_dir``, default PROFILE_DIR) with the caller.
+    """
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_profile_child, args=(database_url, base_dir or settings.profile_dir, sender), name="profiled-crawl")
+    process.start()
+    sender.close()
+    try:
+        ok, payload = receiver.recv()
+    except EOFError:
+        ok, payload = False, "profiled crawl exited without a result"
+    finally:
+        receiver.close()
+        process.join()
+    if not ok:
+        raise RuntimeError(f"profiled crawl failed (exit code {process.exitcode}): {payload}")
+    return payload
@@ -0,0 +1,55 @@
+from __future__ import annotations
+from collections.abc import Awaitable, Callable
+import hashlib
+import threading
+from typing import Any
+
+from fastapi import Request, Response
+
+from app.utils.serialization import dumps
+from app.core.config import settings
+from app.utils.cache import TTLCache
+
+_lock = threading.Lock()
+_generation = 0
+
+response_cache = TTLCache(maxsize=512, maxweight=settings.response_cache_max_bytes)
+
+
+def cache_generation() -> int:
+    return _generation
+
+
+def bump_cache_generation() -> int:
+    """Invalidate every cached read response; call after committing crawl, source or settings changes."""
+    global _generation
+    with _lock:
+        _generation += 1
+        # Entries of older generations can never be hit again; free them now rather than at expiry.
+        response_cache.clear()
+        return _generation
+
+
+def _etag_matches(header: str | None, etag: str) -> bool:
+    if not header:
+        return False
+    candidates = {item.strip().removeprefix("W/") for item in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+async def cached_response(request: Request, build: Callable[[], Awaitable[Any]], ttl: float | None = None) -> Response:
+    # The TTL bounds staleness for changes committed by other processes (e.g. run_crawler.py),
+    # which cannot bump this process' generation.
+    key = (request.url.path, tuple(sorted(request.query_params.multi_items())), cache_generation())
+    entry = response_cache.get(key)
+    if entry is None:
+        body = dumps(await build())
+        entry = (body, '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"')
+        if len(body) <= settings.response_cache_max_entry_bytes:
+            response_cache.set(key, entry, ttl=settings.response_cache_seconds if ttl is None else ttl, weight=len(body))
+    body, etag = entry
+
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -8,6 +8,20 @@ from app.models.setting import Setting
 from app.models.source import Source
 
 
+DEFAULT_SOURCES = (
+    ("aijobsnet", "https://aijobs.net", True),
+    ("linkedin", "https://www.linkedin.com/jobs", True),
+    ("cryptojobslist", "https://cryptojobslist.com", True),
+    ("cryptocurrencyjobs", "https://www.cryptocurrencyjobs.co", True),
+    ("workatstartup_ai", "https://www.workatastartup.com/jobs?query=ai", True),
+    ("web3career", "https://web3.career", True),
+    ("web3jobsai", "https://web3jobs.ai/jobs", True),
+    ("wellfound", "https://wellfound.com", True),
+    ("dejob", "https://www.dejob.ai/job", True),
+    ("abetterweb3", "https://abetterweb3.notion.site/daa095830b624e96af46de63fb9771b9", True),
+)
+
+
 def default_score_config() -> dict:
     return {
         "strong_keywords": {
@@ -97,20 +111,8 @@ def default_notification_config() -> dict:
 def seed_sources_if_empty() -> None:
     db = SessionLocal()
     try:
-        desired_sources = [
-            ("aijobsnet", "https://aijobs.net", True),
-            ("linkedin", "https://www.linkedin.com/jobs", True),
-            ("cryptojobslist", "https://cryptojobslist.com", True),
-            ("cryptocurrencyjobs", "https://www.cryptocurrencyjobs.co", True),
-            ("workatstartup_ai", "https://www.workatastartup.com/jobs?query=ai", True),
-            ("web3career", "https://web3.career", True),
-            ("web3jobsai", "https://web3jobs.ai/jobs", True),
-            ("wellfound", "https://wellfound.com", True),
-            ("dejob", "https://www.dejob.ai/job", True),
-            ("abetterweb3", "https://abetterweb3.notion.site/daa095830b624e96af46de63fb9771b9", True),
-        ]
         existing = {s.name: s for s in db.query(Source).all()}
-        for name, base_url, enabled in desired_sources:
+        for name, base_url, enabled in DEFAULT_SOURCES:
             row = existing.get(name)
             if row is None:
                 db.add(Source(name=name, base_url=base_url, enabled=enabled, crawl_config={}))
@@ -4,6 +4,7 @@ from datetime import datetime
 from sqlalchemy.orm import Session
 
 from app.models.setting import Setting
+from app.services.response_cache import bump_cache_generation
 from app.services.seed import default_notification_config, default_score_config
 
 
@@ -27,5 +28,6 @@ def upsert_setting(db: Session, key: str, value: dict) -> dict:
         row = Setting(key=key, value=value, updated_at=datetime.utcnow())
         db.add(row)
     db.commit()
+    bump_cache_generation()
     db.refresh(row)
     return row.value
@@ -1,9 +1,14 @@
 from __future__ import annotations
 from datetime import datetime, timedelta, timezone
+import time
 
 from jose import JWTError, jwt
 
 from app.core.config import settings
+from app.utils.cache import TTLCache
+
+# Verified token -> subject, kept until the token's own exp; tokens without exp are re-checked after the default TTL.
+_verified_tokens = TTLCache(maxsize=1024, ttl=300)
 
 
 def create_access_token(subject: str) -> str:
@@ -13,8 +18,22 @@ def create_access_token(subject: str) -> str:
 
 
 def verify_access_token(token: str) -> str | None:
+    # Keyed on the signing config too, so rotating JWT_SECRET invalidates cached verifications.
+    key = (token, settings.jwt_secret, settings.jwt_algorithm)
+    subject = _verified_tokens.get(key)
+    if subject is not None:
+        return subject
+
     try:
         payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
-        return payload.get("sub")
     except JWTError:
         return None
+    subject = payload.get("sub")
+    if subject is None:
+        return None
+
+    exp = payload.get("exp")
+    ttl = None if exp is None else float(exp) - time.time()
+    if ttl is None or ttl > 0:
+        _verified_tokens.set(key, subject, ttl=ttl)
+    return subject
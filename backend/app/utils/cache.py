@@ -0,0 +1,58 @@
+from __future__ import annotations
+from collections import OrderedDict
+from collections.abc import Hashable
+import threading
+import time
+from typing import Any
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Small thread-safe LRU cache whose entries expire after ``ttl`` seconds.
+
+    ``maxweight`` additionally bounds the summed ``weight`` of the entries (e.g. their size in bytes).
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 30.0, maxweight: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxweight = maxweight
+        self.weight = 0.0
+        self._data: OrderedDict[Hashable, tuple[float, Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            expires_at, value, weight = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                self.weight -= weight
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None, weight: float = 0.0) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self.weight -= previous[2]
+            self._data[key] = (expires_at, value, weight)
+            self.weight += weight
+            while len(self._data) > self.maxsize or (
+                self.maxweight is not None and self.weight > self.maxweight and self._data
+            ):
+                _key, (_expires_at, _value, evicted) = self._data.popitem(last=False)
+                self.weight -= evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.weight = 0.0
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+import sys
+import time
+import tracemalloc
+
+_active: ContextVar[StageStats | None] = ContextVar("stage_stats", default=None)
+_NOOP = nullcontext()
+
+
+class StageStats:
+    """Cumulative wall time and, while tracemalloc is tracing, memory per named stage.
+
+    ``net_blocks`` is the change in live allocated blocks (``sys.getallocatedblocks``), i.e. how many
+    allocations a stage left behind; ``net_bytes``/``peak_bytes`` come from tracemalloc.
+    """
+
+    def __init__(self):
+        self.stages: dict[str, dict] = {}
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            before, _ = tracemalloc.get_traced_memory()
+            blocks_before = sys.getallocatedblocks()
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            entry = self.stages.setdefault(
+                name, {"calls": 0, "seconds": 0.0, "net_bytes": 0, "peak_bytes": 0, "net_blocks": 0}
+            )
+            entry["calls"] += 1
+            entry["seconds"] += elapsed
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                entry["net_bytes"] += current - before
+                entry["peak_bytes"] = max(entry["peak_bytes"], peak - before)
+                entry["net_blocks"] += sys.getallocatedblocks() - blocks_before
+
+
+@contextmanager
+def collect_stages() -> Iterator[StageStats]:
+    stats = StageStats()
+    token = _active.set(stats)
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+
+
+def stage(name: str):
+    # Outside collect_stages this is a shared no-op, so production crawls pay one ContextVar lookup.
+    stats = _active.get()
+    if stats is None:
+        return _NOOP
+    return stats.measure(name)
@@ -0,0 +1,183 @@
+"""Benchmark the crawl ingest path against recorded fixtures.
+
+    python benchmarks/crawl_ingest.py [--rounds 2] [--repeat 3] [--sources aijobsnet,dejob]
+        [--database-url postgresql+psycopg://localhost/bench --reset-database]
+        [--output results.json] [--baseline base.json] [--max-regression 0.5]
+
+Every adapter in ADAPTERS fetches its fixtures (see replay.py) and run_crawl takes them through
+parse -> filter -> dedup -> score -> persist -> digest. Round 1 inserts into an empty database; later
+rounds replay the same pages, so they measure the dedup path. Each repeat starts from a fresh schema
+and the fastest repeat is reported. With ``--baseline`` the process exits 1 when a stage got slower or
+allocates more than ``--max-regression`` allows. Changed per-source counts are reported but do not
+fail the run: they mean the filters changed and the timings are not comparable stage by stage.
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+from pathlib import Path
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+# Stages faster than this are dominated by timer noise and never count as regressions.
+MIN_SECONDS_DELTA = 0.005
+MIN_BYTES_DELTA = 256 * 1024
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="defaults to a throwaway SQLite file")
+    parser.add_argument("--reset-database", action="store_true", help="allow dropping all tables of --database-url")
+    parser.add_argument("--rounds", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--sources", help="comma separated subset of ADAPTERS")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="time only; tracemalloc slows every stage")
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--baseline", help="compare against a previous --output file")
+    parser.add_argument("--max-regression", type=float, default=0.5, help="allowed relative slowdown per stage")
+    return parser.parse_args(argv)
+
+
+def _best(samples: list[dict]) -> dict:
+    """Merge repeats of one round, keeping the fastest time and the smallest allocation per stage."""
+    merged = json.loads(json.dumps(samples[0]))
+    for sample in samples[1:]:
+        merged["seconds"] = min(merged["seconds"], sample["seconds"])
+        for name, entry in sample["stages"].items():
+            target = merged["stages"].setdefault(name, dict(entry))
+            for key in ("seconds", "net_bytes", "peak_bytes", "net_blocks"):
+                target[key] = min(target.get(key, 0), entry.get(key, 0))
+    return merged
+
+
+def run(args: argparse.Namespace) -> dict:
+    from app.crawlers.registry import ADAPTERS
+    from app.db.database import Base, SessionLocal, engine
+    from app.db.init_db import init_db
+    from app.models.source import Source
+    from app.services.crawl_service import run_crawl
+    from app.utils.stages import collect_stages
+    from benchmarks.replay import FixtureRoutes, replay_http
+
+    sources = args.sources.split(",") if args.sources else list(ADAPTERS)
+    unknown = [name for name in sources if name not in ADAPTERS]
+    if unknown:
+        raise SystemExit(f"unknown sources: {', '.join(unknown)}")
+
+    rounds: list[list[dict]] = [[] for _ in range(args.rounds)]
+    misses: set[str] = set()
+    for _ in range(args.repeat):
+        Base.metadata.drop_all(bind=engine)
+        init_db()
+        db = SessionLocal()
+        try:
+            for source in db.query(Source).all():
+                source.enabled = source.name in sources
+            db.commit()
+
+            # Rendered once per repeat so fixture templating stays out of the measured stages.
+            routes = FixtureRoutes(sources)
+            for index in range(args.rounds):
+                with replay_http(routes), collect_stages() as stats:
+                    if not args.no_tracemalloc:
+                        tracemalloc.start()
+                    started = time.perf_counter()
+                    digest = run_crawl(db)
+                    elapsed = time.perf_counter() - started
+                    if not args.no_tracemalloc:
+                        tracemalloc.stop()
+                rounds[index].append(
+                    {
+                        "seconds": elapsed,
+                        "new_jobs": digest["new_jobs"],
+                        "sources": {
+                            item["source"]: {"fetched": item["fetched"], "new": item["new"], "status": item["status"]}
+                            for item in digest["source_stats"]
+                        },
+                        "stages": stats.stages,
+                    }
+                )
+            misses.update(routes.misses)
+        finally:
+            db.close()
+
+    return {
+        "database": engine.dialect.name,
+        "repeat": args.repeat,
+        "tracemalloc": not args.no_tracemalloc,
+        "rounds": [_best(samples) for samples in rounds],
+        "unmatched_requests": sorted(misses),
+    }
+
+
+def compare(results: dict, baseline: dict, max_regression: float) -> list[str]:
+    problems: list[str] = []
+    check_bytes = results["tracemalloc"] and baseline.get("tracemalloc", False)
+    for index, (current, previous) in enumerate(zip(results["rounds"], baseline["rounds"]), start=1):
+        for name, before in previous["stages"].items():
+            after = current["stages"].get(name)
+            if after is None:
+                continue
+            seconds_limit = before["seconds"] * (1 + max_regression) + MIN_SECONDS_DELTA
+            if after["seconds"] > seconds_limit:
+                problems.append(
+                    f"round {index} {name}: {after['seconds'] * 1000:.1f} ms vs baseline {before['seconds'] * 1000:.1f} ms"
+                )
+            bytes_limit = before["peak_bytes"] * (1 + max_regression) + MIN_BYTES_DELTA
+            if check_bytes and after["peak_bytes"] > bytes_limit:
+                problems.append(
+                    f"round {index} {name}: peak {after['peak_bytes'] / 1024:.0f} KiB "
+                    f"vs baseline {before['peak_bytes'] / 1024:.0f} KiB"
+                )
+    return problems
+
+
+def report(results: dict) -> None:
+    print(f"database={results['database']} repeat={results['repeat']} (fastest repeat shown)")
+    for index, item in enumerate(results["rounds"], start=1):
+        print(f"\nround {index}: {item['seconds'] * 1000:.1f} ms total, {item['new_jobs']} new jobs")
+        print(f"  {'stage':<10}{'calls':>8}{'ms':>10}{'net KiB':>14}{'peak KiB':>10}{'net blocks':>12}")
+        for name, entry in item["stages"].items():
+            print(
+                f"  {name:<10}{entry['calls']:>8}{entry['seconds'] * 1000:>10.1f}"
+                f"{entry['net_bytes'] / 1024:>14.0f}{entry['peak_bytes'] / 1024:>10.0f}{entry['net_blocks']:>12}"
+            )
+        failed = [name for name, stat in item["sources"].items() if stat["status"] != "success"]
+        if failed:
+            print(f"  failed sources: {', '.join(failed)}")
+    if results["unmatched_requests"]:
+        print("\nrequests without a fixture:\n  " + "\n  ".join(results["unmatched_requests"]))
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    if args.database_url and not args.reset_database:
+        raise SystemExit("--database-url drops every table first; pass --reset-database to confirm")
+    database_url = args.database_url or f"sqlite+pysqlite:///{Path(tempfile.mkdtemp()) / 'bench.db'}"
+    # Must be set before app.db.database builds its engine.
+    os.environ["DATABASE_URL"] = database_url
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    results = run(args)
+    report(results)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        for index, (current, previous) in enumerate(zip(results["rounds"], baseline["rounds"]), start=1):
+            if current["sources"] != previous["sources"]:
+                print(f"\nnote: round {index} per-source counts differ from the baseline")
+        problems = compare(results, baseline, args.max_regression)
+        if problems:
+            print("\nregressions against " + args.baseline + ":\n  " + "\n  ".join(problems))
+            return 1
+        print(f"\nno regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,403 @@
+"""Fill jobs, job_scores, crawl_runs and notifications with synthetic rows for scaling benchmarks.
+
+    python benchmarks/generate_dataset.py [--jobs 1000000] [--days 365] [--seed 7]
+        [--database-url sqlite+pysqlite:///synthetic.db] [--reset-database]
+
+Companies follow a Zipf-Mandelbrot curve (a few exchanges post thousands of roles, most a handful),
+titles combine seniority, role and specialty, CJK sources (dejob, abetterweb3) mostly carry Chinese
+titles and descriptions, and collection times ramp up towards today with weekday and office-hour peaks.
+The output is deterministic for a given --seed. Rows are appended after the current max ids, so the
+generator can top up an existing database; --reset-database drops every table first.
+"""
+from __future__ import annotations
+import argparse
+from bisect import bisect
+from datetime import datetime, timedelta
+from itertools import accumulate
+import os
+from pathlib import Path
+import random
+import sys
+import time
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+# (source, relative volume, share of CJK postings)
+SOURCE_MIX = (
+    ("linkedin", 30, 0.02),
+    ("web3career", 16, 0.01),
+    ("cryptojobslist", 12, 0.02),
+    ("cryptocurrencyjobs", 8, 0.0),
+    ("aijobsnet", 10, 0.01),
+    ("workatstartup_ai", 6, 0.0),
+    ("web3jobsai", 6, 0.02),
+    ("wellfound", 4, 0.0),
+    ("dejob", 5, 0.85),
+    ("abetterweb3", 3, 0.9),
+)
+SENIORITY = (("", 30), ("Senior ", 28), ("Staff ", 6), ("Lead ", 7), ("Principal ", 3), ("Junior ", 6), ("Head of ", 3))
+ROLES = (
+    ("Backend Engineer", 14),
+    ("Smart Contract Engineer", 9),
+    ("Full Stack Developer", 9),
+    ("Frontend Engineer", 7),
+    ("Machine Learning Engineer", 8),
+    ("Research Scientist", 4),
+    ("Protocol Engineer", 5),
+    ("Data Engineer", 5),
+    ("DevOps Engineer", 4),
+    ("Security Researcher", 3),
+    ("Product Manager", 6),
+    ("Business Development Manager", 5),
+    ("Growth Marketing Manager", 4),
+    ("Community Manager", 3),
+    ("Customer Success Manager", 2),
+    ("Recruiter", 2),
+)
+SPECIALTIES = ("", "", "", ", DeFi", ", Wallet", ", ZK", ", LLM", ", Infrastructure", " (Rust)", " (Solidity)", ", AI Agents")
+CJK_ROLES = (
+    ("区块链后端开发工程师", 12),
+    ("智能合约开发工程师", 8),
+    ("大模型算法工程师", 7),
+    ("前端开发工程师", 7),
+    ("量化研究员", 4),
+    ("产品经理", 6),
+    ("测试工程师", 3),
+    ("运维工程师", 3),
+    ("商务拓展经理", 5),
+    ("市场运营", 5),
+    ("社区运营", 4),
+    ("人力资源专员", 2),
+)
+COMPANY_HEADS = (
+    "Chain", "Block", "Hash", "Nova", "Zero", "Layer", "Stark", "Solar", "Orbit", "Quantum", "Meta", "Poly",
+    "Alpha", "Flux", "Nexus", "Vault", "Mint", "Ledger", "Atlas", "Cipher", "Neural", "Vector", "Prism", "Echo",
+)
+COMPANY_TAILS = ("Labs", "Protocol", "Finance", "Network", "AI", "Capital", "Exchange", "Systems", "DAO", "Technologies")
+CJK_COMPANY_HEADS = ("链", "币", "星", "火", "云", "数", "智", "矩", "元", "维")
+CJK_COMPANY_TAILS = ("科技", "网络", "资本", "实验室", "交易所", "智能")
+LOCATIONS = (
+    ("Remote", 26),
+    ("Remote - Global", 8),
+    ("Remote - US", 6),
+    ("Remote - Asia", 4),
+    ("Singapore", 8),
+    ("Hong Kong", 5),
+    ("New York, NY", 6),
+    ("San Francisco, CA", 6),
+    ("London", 5),
+    ("Berlin", 3),
+    ("Dubai, UAE", 4),
+    ("Lisbon", 2),
+    ("Zug", 2),
+    ("Seoul", 2),
+    ("Tokyo", 2),
+)
+CJK_LOCATIONS = (("远程", 30), ("上海", 15), ("深圳", 12), ("北京", 10), ("香港", 12), ("新加坡", 10), ("台北", 4), ("迪拜", 3))
+SENTENCES = (
+    "You will design and ship production services used by millions of users.",
+    "Experience with Rust, Go or TypeScript in high-throughput systems is required.",
+    "Familiarity with EVM internals, Solidity and smart contract security is a plus.",
+    "Build large language model inference and retrieval augmented generation pipelines.",
+    "Own observability, incident response and on-call for trading infrastructure.",
+    "Collaborate with research to bring zero-knowledge proofs to mainnet.",
+    "We are a remote-first team spread across Asia, Europe and the Americas.",
+    "Competitive salary, token grants and a generous learning budget.",
+    "Drive partnerships with exchanges, market makers and ecosystem projects.",
+    "Contact hr@example.com or @example_jobs on Telegram to apply.",
+)
+CJK_SENTENCES = (
+    "负责核心交易系统的设计与研发，保障系统高可用。",
+    "熟悉 Go、Rust 或 Solidity，有大规模分布式系统经验优先。",
+    "参与大模型微调、推理优化与智能体应用落地。",
+    "与海外团队协作，支持远程办公，弹性工作时间。",
+    "具备良好的沟通能力，能够独立推进项目。",
+    "提供有竞争力的薪资与 Token 激励。",
+    "简历请投递至 hr@example.cn，或联系 Telegram @example_hr。",
+)
+# Relative crawl volume by hour of day (UTC) and weekday (Monday first).
+HOUR_WEIGHTS = (2, 1, 1, 1, 2, 3, 5, 7, 9, 10, 10, 9, 8, 9, 10, 10, 9, 8, 6, 5, 4, 3, 3, 2)
+WEEKDAY_WEIGHTS = (10, 11, 11, 10, 9, 4, 3)
+
+
+class Picker:
+    """random.choices with the cumulative weights computed once."""
+
+    def __init__(self, rng: random.Random, items):
+        self._rng = rng
+        self._values = [value for value, _weight in items]
+        self._cum = list(accumulate(weight for _value, weight in items))
+
+    def __call__(self):
+        return self._values[bisect(self._cum, self._rng.random() * self._cum[-1])]
+
+
+def _companies(rng: random.Random, count: int, cjk: bool) -> Picker:
+    names: list[str] = []
+    seen: set[str] = set()
+    while len(names) < count:
+        if cjk:
+            name = rng.choice(CJK_COMPANY_HEADS) + rng.choice(CJK_COMPANY_HEADS) + rng.choice(CJK_COMPANY_TAILS)
+        else:
+            name = f"{rng.choice(COMPANY_HEADS)}{rng.choice(COMPANY_HEADS).lower()} {rng.choice(COMPANY_TAILS)}"
+        if name in seen:
+            name = f"{name} {len(names)}"
+        seen.add(name)
+        names.append(name)
+    # Zipf-Mandelbrot: the biggest employers post ~1.5% of all roles each, the long tail a handful.
+    return Picker(rng, [(name, 1 / (rank + 10)) for rank, name in enumerate(names, start=1)])
+
+
+def _slug(text: str) -> str:
+    return "".join(ch if ch.isalnum() and ch.isascii() else "-" for ch in text.lower()).strip("-") or "role"
+
+
+class JobFactory:
+    def __init__(self, seed: int, sources: dict[str, int], days: int, companies: int, now: datetime):
+        from app.utils.hash import job_fallback_hash
+
+        self.fallback_hash = job_fallback_hash
+        self.rng = rng = random.Random(seed)
+        self.now = now
+        self.days = days
+        mix = [(name, weight, cjk) for name, weight, cjk in SOURCE_MIX if name in sources]
+        self.source = Picker(rng, [((sources[name], name, cjk), weight) for name, weight, cjk in mix])
+        self.seniority = Picker(rng, SENIORITY)
+        self.role = Picker(rng, ROLES)
+        self.cjk_role = Picker(rng, CJK_ROLES)
+        self.location = Picker(rng, LOCATIONS)
+        self.cjk_location = Picker(rng, CJK_LOCATIONS)
+        self.company = _companies(rng, companies, cjk=False)
+        self.cjk_company = _companies(rng, max(50, companies // 10), cjk=True)
+        # Linear ramp: today collects about three times as much as the first day.
+        self.day = Picker(rng, [(offset, 1 + 2 * (days - offset) / days) for offset in range(days)])
+        self.hour = Picker(rng, list(zip(range(24), HOUR_WEIGHTS)))
+
+    def collected_at(self) -> datetime:
+        rng = self.rng
+        while True:
+            day = self.now - timedelta(days=self.day())
+            # Rejection sampling keeps the weekday shape without a separate picker per day.
+            if rng.random() * 11 < WEEKDAY_WEIGHTS[day.weekday()]:
+                break
+        moment = day.replace(hour=self.hour(), minute=rng.randrange(60), second=rng.randrange(60), microsecond=0)
+        return min(moment, self.now)
+
+    def description(self, cjk: bool) -> str:
+        rng = self.rng
+        sentences = CJK_SENTENCES if cjk else SENTENCES
+        # Lognormal length: most descriptions are a few hundred characters, a long tail hits the 4000 cap.
+        count = max(1, min(40, int(rng.lognormvariate(1.6, 0.7))))
+        return " ".join(rng.choice(sentences) for _ in range(count))[:4000]
+
+    def job(self, job_id: int) -> dict:
+        rng = self.rng
+        source_id, source_name, cjk_share = self.source()
+        cjk = rng.random() < cjk_share
+        if cjk:
+            title, company, location = self.cjk_role(), self.cjk_company(), self.cjk_location()
+        else:
+            title = f"{self.seniority()}{self.role()}{rng.choice(SPECIALTIES)}"
+            company, location = self.company(), self.location()
+        collected_at = self.collected_at()
+        posted_at = collected_at - timedelta(hours=rng.expovariate(1 / 10)) if rng.random() < 0.9 else None
+        url = f"https://jobs.example/{source_name}/{job_id}-{_slug(title)[:60]}"
+        text = title.lower()
+        return {
+            "id": job_id,
+            "source_id": source_id,
+            "source_job_id": f"syn-{job_id}",
+            "fallback_hash": self.fallback_hash(url, title, company),
+            "canonical_url": url,
+            "title": title,
+            "company": company,
+            "location": location,
+            "remote_type": "remote" if "remote" in location.lower() or "远程" in location else "unknown",
+            "employment_type": rng.choice(("Full-Time", "Full-Time", "Full-Time", "Contract", "Part-Time")),
+            "domain": "AI" if any(k in text for k in ("machine learning", "llm", " ai", "大模型")) else "web3",
+            "description": self.description(cjk),
+            "posted_at": posted_at,
+            "collected_at": collected_at,
+            "raw_payload": {"site": source_name, "synthetic": True},
+            "is_new": collected_at >= self.now - timedelta(days=1),
+        }
+
+    def score(self, job: dict) -> dict:
+        rng = self.rng
+        keyword = round(min(60.0, rng.gammavariate(2.0, 9.0)), 1)
+        seniority = 20.0 if job["title"].startswith(("Senior", "Staff", "Lead", "Principal", "Head")) else 5.0
+        remote = 10.0 if job["remote_type"] == "remote" else 0.0
+        region = 10.0 if rng.random() < 0.2 else 0.0
+        total = keyword + seniority + remote + region
+        return {
+            "job_id": job["id"],
+            "total_score": total,
+            "keyword_score": keyword,
+            "seniority_score": seniority,
+            "remote_bonus": remote,
+            "region_bonus": region,
+            "decision": "high" if total >= 70 else "low",
+            "scored_at": job["collected_at"],
+        }
+
+
+def _next_id(conn, table) -> int:
+    from sqlalchemy import func, select
+
+    return (conn.execute(select(func.max(table.c.id))).scalar() or 0) + 1
+
+
+def _sync_sequences(conn, tables) -> None:
+    # Explicit ids bypass Postgres sequences; move them past the generated rows.
+    from sqlalchemy import text
+
+    if conn.dialect.name != "postgresql":
+        return
+    for table in tables:
+        conn.execute(
+            text(f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), (SELECT max(id) FROM {table.name}))")
+        )
+
+
+def generate(engine, jobs: int, days: int = 365, seed: int = 7, companies: int = 5000, batch_size: int = 5000,
+             runs_per_day: int = 4, daily_push_limit: int = 50, now: datetime | None = None, progress=None) -> dict:
+    """Append synthetic rows and return how many were written per table."""
+    from app.models.crawl_run import CrawlRun
+    from app.models.job import Job
+    from app.models.job_score import JobScore
+    from app.models.notification import Notification
+    from app.models.source import Source
+    from sqlalchemy import select
+
+    now = (now or datetime.utcnow()).replace(microsecond=0)
+    jobs_t, scores_t, runs_t, notes_t = Job.__table__, JobScore.__table__, CrawlRun.__table__, Notification.__table__
+    with engine.begin() as conn:
+        sources = {name: source_id for source_id, name in conn.execute(select(Source.id, Source.name))}
+        first_job = _next_id(conn, jobs_t)
+        first_run = _next_id(conn, runs_t)
+        first_note = _next_id(conn, notes_t)
+    if not sources:
+        raise ValueError("no sources; run init_db first")
+
+    factory = JobFactory(seed, sources, days, companies, now)
+    rng = factory.rng
+    per_day: dict[datetime, list[tuple[float, int]]] = {}
+    written = {"jobs": 0, "job_scores": 0, "crawl_runs": 0, "notifications": 0}
+
+    for start in range(0, jobs, batch_size):
+        job_rows = [factory.job(first_job + offset) for offset in range(start, min(jobs, start + batch_size))]
+        score_rows = [factory.score(row) for row in job_rows]
+        with engine.begin() as conn:
+            conn.execute(jobs_t.insert(), job_rows)
+            conn.execute(scores_t.insert(), score_rows)
+        for job, score in zip(job_rows, score_rows):
+            day = job["collected_at"].replace(hour=0, minute=0, second=0)
+            per_day.setdefault(day, []).append((score["total_score"], job["id"]))
+        written["jobs"] += len(job_rows)
+        written["job_scores"] += len(score_rows)
+        if progress:
+            progress(written["jobs"], jobs)
+
+    run_rows: list[dict] = []
+    note_rows: list[dict] = []
+    for offset in range(days):
+        day = (now - timedelta(days=offset)).replace(hour=0, minute=0, second=0)
+        for slot in range(runs_per_day):
+            started_at = day + timedelta(hours=slot * 24 // runs_per_day, minutes=rng.randrange(10))
+            if started_at > now:
+                continue
+            for source_id in sources.values():
+                failed = rng.random() < 0.04
+                run_rows.append(
+                    {
+                        "id": first_run + len(run_rows),
+                        "source_id": source_id,
+                        "started_at": started_at,
+                        "finished_at": started_at + timedelta(seconds=rng.uniform(2, 90)),
+                        "fetched_count": 0 if failed else rng.randint(20, 80),
+                        "new_count": 0 if failed else rng.randint(0, 25),
+                        "high_priority_count": 0 if failed else rng.randint(0, 4),
+                        "blocked_count": 0,
+                        "status": "failed" if failed else "success",
+                        "error_summary": "HTTPStatusError: 429 Too Many Requests" if failed else "",
+                    }
+                )
+        # One digest per day: the top-scored jobs up to the push limit, framed by digest and end markers.
+        sent_at = day + timedelta(hours=9)
+        if sent_at > now:
+            continue
+        top = sorted(per_day.get(day, []), reverse=True)[:daily_push_limit]
+        modes = [("digest", None), *[("job_digest_item", job_id) for _score, job_id in top], ("end_of_push", None)]
+        status = "failed" if rng.random() < 0.02 else "sent"
+        for mode, job_id in modes:
+            note_rows.append(
+                {
+                    "id": first_note + len(note_rows),
+                    "job_id": job_id,
+                    "channel": "discord",
+                    "mode": mode,
+                    "sent_at": sent_at,
+                    "status": status,
+                    "error": "discord returned 500" if status == "failed" else "",
+                    "batch_id": None,
+                }
+            )
+
+    with engine.begin() as conn:
+        for table, rows in ((runs_t, run_rows), (notes_t, note_rows)):
+            for start in range(0, len(rows), batch_size):
+                conn.execute(table.insert(), rows[start : start + batch_size])
+        _sync_sequences(conn, (jobs_t, runs_t, notes_t))
+    written["crawl_runs"] = len(run_rows)
+    written["notifications"] = len(note_rows)
+    return written
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--companies", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--runs-per-day", type=int, default=4)
+    parser.add_argument("--database-url", default="sqlite+pysqlite:///synthetic.db")
+    parser.add_argument("--reset-database", action="store_true", help="drop every table before generating")
+    args = parser.parse_args(argv)
+
+    # Must be set before app.db.database builds its engine.
+    os.environ["DATABASE_URL"] = args.database_url
+    sys.path.insert(0, str(BACKEND_DIR))
+    from app.db.database import Base, engine
+    from app.db.init_db import init_db
+
+    if args.reset_database:
+        Base.metadata.drop_all(bind=engine)
+    init_db()
+
+    started = time.perf_counter()
+
+    def progress(done: int, total: int) -> None:
+        rate = done / max(time.perf_counter() - started, 1e-9)
+        print(f"\r{done}/{total} jobs ({rate:,.0f} rows/s)", end="", file=sys.stderr, flush=True)
+
+    written = generate(
+        engine,
+        jobs=args.jobs,
+        days=args.days,
+        seed=args.seed,
+        companies=args.companies,
+        batch_size=args.batch_size,
+        runs_per_day=args.runs_per_day,
+        progress=progress,
+    )
+    print(file=sys.stderr)
+    if engine.dialect.name in ("postgresql", "sqlite"):
+        with engine.begin() as conn:
+            conn.exec_driver_sql("ANALYZE")
+    print(", ".join(f"{count} {table}" for table, count in written.items()), f"in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
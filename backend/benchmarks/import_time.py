@@ -0,0 +1,67 @@
+"""Measure cold import time of the API entrypoint.
+
+    python benchmarks/import_time.py [--runs 5] [--module app.main] [--eager-adapters]
+
+Every run is a fresh interpreter, so nothing is cached in sys.modules. ``--eager-adapters``
+additionally imports every crawler adapter, which is what the API paid before the registry
+became lazy.
+"""
+from __future__ import annotations
+import argparse
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+def _snippet(module: str, eager_adapters: bool) -> str:
+    code = f"import {module}"
+    if eager_adapters:
+        code += "\nfrom app.crawlers.registry import ADAPTERS\nfor name in ADAPTERS: ADAPTERS[name]"
+    return code
+
+
+def measure(module: str, eager_adapters: bool = False) -> tuple[float, list[str]]:
+    """Return (cumulative import time in ms, heavy third-party modules loaded) for one cold start."""
+    report = "import sys\nprint(','.join(m for m in ('bs4', 'lxml', 'httpx') if m in sys.modules))"
+    code = _snippet(module, eager_adapters) + "\n" + report
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Nested imports are indented under their parent; summing only top-level entries avoids double counting.
+        if cumulative.strip().isdigit() and not name[1:].startswith(" "):
+            total_us += int(cumulative)
+    loaded = [m for m in proc.stdout.strip().split(",") if m]
+    return total_us / 1000, loaded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--eager-adapters", action="store_true")
+    args = parser.parse_args()
+
+    samples, loaded = [], []
+    for _ in range(args.runs):
+        elapsed_ms, loaded = measure(args.module, args.eager_adapters)
+        samples.append(elapsed_ms)
+
+    label = args.module + (" + all adapters" if args.eager_adapters else "")
+    print(f"{label}: median {statistics.median(samples):.1f} ms, min {min(samples):.1f} ms over {args.runs} runs")
+    print(f"heavy modules loaded: {', '.join(loaded) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
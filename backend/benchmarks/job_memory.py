@@ -0,0 +1,77 @@
+"""Measure the memory a ``NormalizedJob`` costs, using the jobs every adapter parses from the fixtures.
+
+    python benchmarks/job_memory.py [--rounds 20]
+
+Every round replays all fixtures through the real adapters and keeps the parsed jobs, so the strings
+have the provenance a crawl gives them. tracemalloc reports the retained size per job: all of it,
+and what is left after the per-job text (ids, urls, title, description) that no representation shrinks.
+"""
+from __future__ import annotations
+import argparse
+import gc
+import json
+from pathlib import Path
+import sys
+import tracemalloc
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_DIR))
+
+from benchmarks.replay import FixtureRoutes, replay_http  # noqa: E402
+
+TEXT_FIELDS = ("source_job_id", "canonical_url", "title", "description")
+
+
+def replayed_jobs(routes: FixtureRoutes) -> list:
+    from app.crawlers.registry import ADAPTERS
+
+    jobs = []
+    with replay_http(routes):
+        for name in ADAPTERS:
+            jobs.extend(ADAPTERS[name]().fetch())
+    return jobs
+
+
+def _text_bytes(jobs: list) -> int:
+    seen: set[int] = set()
+    total = 0
+    for job in jobs:
+        for name in TEXT_FIELDS:
+            value = getattr(job, name)
+            if id(value) not in seen:
+                seen.add(id(value))
+                total += sys.getsizeof(value)
+    return total
+
+
+def measure(rounds: int) -> dict:
+    routes = FixtureRoutes()
+    replayed_jobs(routes)  # warm imports and caches outside the measurement
+
+    tracemalloc.start()
+    try:
+        gc.collect()
+        before, _ = tracemalloc.get_traced_memory()
+        jobs = [job for _ in range(rounds) for job in replayed_jobs(routes)]
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # The list holding the jobs is not part of their cost.
+    retained = after - before - sys.getsizeof(jobs)
+    return {
+        "jobs": len(jobs),
+        "bytes_per_job": round(retained / len(jobs)),
+        "bytes_per_job_without_text": round((retained - _text_bytes(jobs)) / len(jobs)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20, help="fixture replays whose jobs are kept")
+    args = parser.parse_args()
+    print(json.dumps(measure(args.rounds), indent=2))
+
+
+if __name__ == "__main__":
+    main()
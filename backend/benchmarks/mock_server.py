@@ -0,0 +1,199 @@
+"""Local mock job board serving the recorded fixtures of every adapter over real HTTP.
+
+    python benchmarks/mock_server.py [--port 8765] [--latency-ms 150 --jitter-ms 50]
+        [--error-rate 0.05 --error-statuses 429,500,503] [--pages 4] [--apply]
+
+A request for ``https://aijobs.net/`` is served at ``http://127.0.0.1:8765/aijobs.net/``: the first
+path segment names the original host. ``--apply`` points every source in DATABASE_URL at the server
+through ``Source.crawl_config`` and restores the previous configs on exit, so ``python run_crawler.py``
+crawls the mock board with real sockets, timeouts, retries and the circuit breaker in play.
+``GET /__stats`` returns request counters.
+"""
+from __future__ import annotations
+import argparse
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from pathlib import Path
+import random
+import sys
+import threading
+import time
+from urllib.parse import urlsplit
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_DIR))
+
+from benchmarks.replay import FixtureRoutes, load_manifest  # noqa: E402
+
+
+class MockJobBoard(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        routes: FixtureRoutes,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_statuses: tuple[int, ...] = (500,),
+        seed: int | None = None,
+    ):
+        super().__init__(address, _Handler)
+        self.routes = routes
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_statuses = error_statuses
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats: Counter[str] = Counter()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def respond(self, method: str, path: str) -> tuple[int, bytes, dict[str, str]]:
+        with self._lock:
+            delay = max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter))
+            failed = self._rng.random() < self.error_rate
+            status = self._rng.choice(self.error_statuses) if failed else 200
+            self.stats["requests"] += 1
+        if delay:
+            time.sleep(delay)
+
+        if status != 200:
+            with self._lock:
+                self.stats[f"status_{status}"] += 1
+            headers = {"Retry-After": "1"} if status == 429 else {}
+            return status, b"", headers
+
+        host, _, rest = path.lstrip("/").partition("/")
+        route = self.routes.lookup(method, f"https://{host}/{rest}")
+        with self._lock:
+            self.stats["status_200" if route else "status_404"] += 1
+        if route is None:
+            return 404, b"", {}
+        body, content_type = route
+        return 200, body, {"Content-Type": content_type}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: MockJobBoard
+    protocol_version = "HTTP/1.1"
+
+    def _serve(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        if self.path == "/__stats":
+            status, body, headers = 200, json.dumps(dict(self.server.stats)).encode(), {"Content-Type": "application/json"}
+        else:
+            status, body, headers = self.server.respond(self.command, self.path)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _serve
+    do_POST = _serve
+
+    def log_message(self, *_args) -> None:
+        pass
+
+
+def mock_crawl_configs(base_url: str, sources=None) -> dict[str, dict]:
+    """crawl_config per source that sends all of its requests to the mock server at ``base_url``."""
+    from app.crawlers.registry import ADAPTERS
+
+    configs: dict[str, dict] = {}
+    for source, entries in load_manifest().items():
+        if sources is not None and source not in sources:
+            continue
+        primary = ADAPTERS[source].base_url
+        origins = {f"{parts.scheme}://{parts.netloc}" for parts in (urlsplit(entry["url"]) for entry in entries)}
+        config: dict = {"base_url": f"{base_url}/{urlsplit(primary).netloc}"}
+        overrides = {origin: f"{base_url}/{urlsplit(origin).netloc}" for origin in sorted(origins) if origin != primary}
+        if overrides:
+            config["url_overrides"] = overrides
+        configs[source] = config
+    return configs
+
+
+def _apply(configs: dict[str, dict]) -> dict[str, dict]:
+    from app.db.database import SessionLocal
+    from app.db.init_db import init_db
+    from app.models.source import Source
+
+    init_db()
+    db = SessionLocal()
+    try:
+        previous = {}
+        for row in db.query(Source).filter(Source.name.in_(list(configs))).all():
+            previous[row.name] = dict(row.crawl_config or {})
+            row.crawl_config = {**previous[row.name], **configs[row.name]}
+        db.commit()
+        return previous
+    finally:
+        db.close()
+
+
+def _restore(previous: dict[str, dict]) -> None:
+    from app.db.database import SessionLocal
+    from app.models.source import Source
+
+    db = SessionLocal()
+    try:
+        for row in db.query(Source).filter(Source.name.in_(list(previous))).all():
+            row.crawl_config = previous[row.name]
+        db.commit()
+    finally:
+        db.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with an error")
+    parser.add_argument("--error-statuses", default="500", help="comma separated statuses to pick errors from")
+    parser.add_argument("--pages", type=int, help="pages served by paginated APIs (dejob)")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--sources", help="comma separated subset of sources")
+    parser.add_argument("--apply", action="store_true", help="point the sources in DATABASE_URL at this server")
+    args = parser.parse_args(argv)
+
+    sources = args.sources.split(",") if args.sources else None
+    server = MockJobBoard(
+        (args.host, args.port),
+        FixtureRoutes(sources, pages=args.pages),
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        error_statuses=tuple(int(code) for code in args.error_statuses.split(",")),
+        seed=args.seed,
+    )
+    configs = mock_crawl_configs(server.base_url, sources)
+    previous = _apply(configs) if args.apply else None
+    print(f"mock job board on {server.base_url}")
+    print(json.dumps(configs, indent=2))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if previous is not None:
+            _restore(previous)
+        print(json.dumps(dict(server.stats)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
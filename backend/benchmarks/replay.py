@@ -0,0 +1,129 @@
+"""Serve recorded adapter fixtures through httpx instead of the network.
+
+``fixtures/manifest.json`` maps each source to the requests its adapter makes. Fixture files are
+``string.Template`` bodies: ``$recent_iso`` and friends are filled with timestamps relative to now
+so the crawl's recency filter keeps the same jobs on every run, and ``vars`` fill per-URL detail pages.
+"""
+from __future__ import annotations
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import json
+from pathlib import Path
+from string import Template
+from unittest import mock
+
+import httpx
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+def template_vars(now: datetime | None = None) -> dict[str, str]:
+    now = now or datetime.utcnow()
+    recent = now - timedelta(hours=2)
+    return {
+        "recent_iso": recent.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "recent_ms": str(int((recent - datetime(1970, 1, 1)).total_seconds() * 1000)),
+        "recent_web3career": recent.strftime("%Y-%m-%d %H:%M:%S +0000"),
+        "today": now.strftime("%Y-%m-%d"),
+        "today_long": now.strftime("%B %d, %Y").replace(" 0", " "),
+    }
+
+
+def load_manifest(fixtures_dir: Path = FIXTURES_DIR) -> dict[str, list[dict]]:
+    return json.loads((fixtures_dir / "manifest.json").read_text(encoding="utf-8"))
+
+
+def _content_type(path: str) -> str:
+    return "application/json" if path.endswith(".json") else "text/html; charset=utf-8"
+
+
+def _normalize(url: httpx.URL) -> httpx.URL:
+    # "https://host" and "https://host/" are the same request.
+    return url.copy_with(path=url.path)
+
+
+class FixtureRoutes:
+    """(method, url) -> rendered fixture body; unknown requests are recorded in ``misses``.
+
+    Fixtures with a ``page`` query parameter form a paged family. By default only the recorded pages
+    are served; with ``pages=N`` pages 1..N-1 repeat the first recorded page and page N the last one,
+    with ``$page`` substituted so ids stay unique across pages.
+    """
+
+    def __init__(
+        self,
+        sources: Iterable[str] | None = None,
+        fixtures_dir: Path = FIXTURES_DIR,
+        now: datetime | None = None,
+        pages: int | None = None,
+    ):
+        manifest = load_manifest(fixtures_dir)
+        wanted = set(sources) if sources is not None else set(manifest)
+        self.vars = template_vars(now)
+        self.pages = pages
+        templates: dict[str, Template] = {}
+        self.routes: dict[tuple[str, str], tuple[bytes, str]] = {}
+        self.families: dict[tuple[str, str], list[tuple[int, Template, dict, str]]] = {}
+        for source, entries in manifest.items():
+            if source not in wanted:
+                continue
+            for entry in entries:
+                path = entry["file"]
+                if path not in templates:
+                    templates[path] = Template((fixtures_dir / path).read_text(encoding="utf-8"))
+                method, url = entry.get("method", "GET"), _normalize(httpx.URL(entry["url"]))
+                entry_vars = entry.get("vars", {})
+                body = templates[path].safe_substitute({**self.vars, **entry_vars})
+                self.routes[(method, str(url))] = (body.encode("utf-8"), _content_type(path))
+                page = url.params.get("page")
+                if page and page.isdigit():
+                    family = self.families.setdefault((method, str(url.copy_remove_param("page"))), [])
+                    family.append((int(page), templates[path], entry_vars, _content_type(path)))
+                    family.sort(key=lambda item: item[0])
+        self.hits: Counter[str] = Counter()
+        self.misses: list[str] = []
+
+    def _paged(self, method: str, url: httpx.URL) -> tuple[bytes, str] | None:
+        page = url.params.get("page")
+        family = self.families.get((method, str(url.copy_remove_param("page"))))
+        if not family or not page or not page.isdigit() or not 1 <= int(page) <= self.pages:
+            return None
+        _first, template, entry_vars, content_type = family[0] if int(page) < self.pages else family[-1]
+        body = template.safe_substitute({**self.vars, **entry_vars, "page": page})
+        return body.encode("utf-8"), content_type
+
+    def lookup(self, method: str, url: str) -> tuple[bytes, str] | None:
+        route = None
+        parsed = _normalize(httpx.URL(url))
+        if self.pages and parsed.params.get("page"):
+            route = self._paged(method, parsed)
+        if route is None:
+            route = self.routes.get((method, str(parsed)))
+        if route is None:
+            self.misses.append(f"{method} {url}")
+            return None
+        self.hits[url] += 1
+        return route
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        route = self.lookup(request.method, str(request.url))
+        if route is None:
+            return httpx.Response(404, request=request)
+        body, content_type = route
+        return httpx.Response(200, content=body, headers={"Content-Type": content_type}, request=request)
+
+
+@contextmanager
+def replay_http(routes: FixtureRoutes) -> Iterator[FixtureRoutes]:
+    """Route every ``httpx.Client`` created inside the block to ``routes``."""
+    real_client = httpx.Client
+
+    class ReplayClient(real_client):
+        def __init__(self, *args, **kwargs):
+            kwargs["transport"] = httpx.MockTransport(routes.handle)
+            super().__init__(*args, **kwargs)
+
+    with mock.patch.object(httpx, "Client", ReplayClient):
+        yield routes
@@ -1,14 +1,26 @@
 from __future__ import annotations
+import argparse
+
 from app.db.init_db import init_db
 from app.db.database import SessionLocal
 from app.services.crawl_service import run_crawl
+from app.services.outbox import drain_until_settled
+from app.services.profiling import profile_crawl
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run one crawl of every enabled source.")
+    parser.add_argument("--profile", action="store_true", help="capture a CPU profile and tracemalloc snapshot of the crawl")
+    parser.add_argument("--profile-dir", help="where profiles are written (default: PROFILE_DIR)")
+    args = parser.parse_args()
+
     init_db()
     db = SessionLocal()
     try:
-        result = run_crawl(db)
+        result = profile_crawl(db, args.profile_dir) if args.profile else run_crawl(db)
         print(result)
+        # Retries run in-process until the batch is delivered or exhausted (OUTBOX_DRAIN_MAX_SECONDS);
+        # anything still queued after that is retried by the next invocation.
+        print(drain_until_settled(db))
     finally:
         db.close()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+import threading
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.api.deps import require_user
+from app.db.database import Base, async_database_url, get_async_db, get_db
+from app.main import app
+from app.services.response_cache import response_cache
+from benchmarks.mock_server import MockJobBoard
+from benchmarks.replay import FixtureRoutes
+
+
+@pytest.fixture(autouse=True)
+def _clear_response_cache():
+    # Each test builds its own database, so cached responses must not leak between them.
+    response_cache.clear()
+    yield
+    response_cache.clear()
+
+
+@pytest.fixture()
+def api_sessionmaker(tmp_path):
+    """A file-backed SQLite database shared by the sync and async API dependencies."""
+    url = f"sqlite+pysqlite:///{tmp_path / 'api.db'}"
+    engine = create_engine(url, future=True)
+    Base.metadata.create_all(bind=engine)
+    TestingSession = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    # NullPool: aiosqlite connections must not outlive the TestClient event loop that opened them.
+    async_engine = create_async_engine(async_database_url(url), poolclass=NullPool)
+    AsyncTestingSession = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
+
+    def _get_db():
+        session = TestingSession()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    async def _get_async_db():
+        async with AsyncTestingSession() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = _get_db
+    app.dependency_overrides[get_async_db] = _get_async_db
+    app.dependency_overrides[require_user] = lambda: "admin"
+    try:
+        yield TestingSession
+    finally:
+        app.dependency_overrides.clear()
+        engine.dispose()
+
+
+@pytest.fixture()
+def mock_board():
+    servers = []
+
+    def start(**options) -> MockJobBoard:
+        server = MockJobBoard(("127.0.0.1", 0), FixtureRoutes(pages=options.pop("pages", None)), **options)
+        threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -18,8 +18,8 @@ from app.crawlers.adapters import (
 )
 
 
-def _soup_links_from_html(html: str):
-    soup = BeautifulSoup(html, "html.parser")
+def _soup_links_from_html(html: str, parse_only=None):
+    soup = BeautifulSoup(html, "html.parser", parse_only=parse_only)
     return soup, soup.find_all("a")
 
 
@@ -81,8 +81,7 @@ def test_web3career_adapter_extracts_jobposting(monkeypatch):
     }
     </script>
     """
-    monkeypatch.setattr(web3career, "fetch_html", lambda *_args, **_kwargs: html)
-    monkeypatch.setattr(web3career, "soup_links", _soup_links_from_html)
+    monkeypatch.setattr(web3career, "fetch_bytes", lambda *_args, **_kwargs: html.encode("utf-8"))
 
     jobs = web3career.Web3CareerAdapter().fetch()
 
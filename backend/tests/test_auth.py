@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from jose import jwt
+
+from app.core.config import settings
+from app.utils import auth
+from app.utils.auth import create_access_token, verify_access_token
+
+
+def test_verified_tokens_are_served_from_cache(monkeypatch):
+    auth._verified_tokens.clear()
+    token = create_access_token("admin")
+    assert verify_access_token(token) == "admin"
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("token should not be decoded again")
+
+    monkeypatch.setattr(auth.jwt, "decode", _fail)
+    assert verify_access_token(token) == "admin"
+
+
+def test_cache_honours_expiry_and_secret_rotation(monkeypatch):
+    auth._verified_tokens.clear()
+    token = create_access_token("admin")
+    assert verify_access_token(token) == "admin"
+
+    monkeypatch.setattr(settings, "jwt_secret", "rotated")
+    assert verify_access_token(token) is None
+
+    clock = [0.0]
+    monkeypatch.setattr("app.utils.cache.time.monotonic", lambda: clock[0])
+    short = jwt.encode({"sub": "admin", "exp": int(auth.time.time()) + 5}, "rotated", algorithm=settings.jwt_algorithm)
+    assert verify_access_token(short) == "admin"
+    clock[0] += 10
+
+    def _expired(*_args, **_kwargs):
+        raise auth.JWTError("expired")
+
+    monkeypatch.setattr(auth.jwt, "decode", _expired)
+    assert verify_access_token(short) is None
+    assert verify_access_token("garbage") is None
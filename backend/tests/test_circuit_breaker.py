@@ -0,0 +1,185 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+import re
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.database import Base
+from app.main import app
+from app.models.crawl_run import CrawlRun
+from app.models.setting import Setting
+from app.models.source import Source
+from app.services import crawl_service
+from app.services.circuit_breaker import CLOSED, HALF_OPEN, OPEN, breaker_state, breaker_states
+from app.services.crawl_service import run_crawl
+from app.services.response_cache import bump_cache_generation
+from app.services.seed import default_notification_config, default_score_config
+
+
+class CountingAdapter:
+    calls = 0
+
+    def fetch(self):
+        CountingAdapter.calls += 1
+        return []
+
+
+class BrokenAdapter:
+    def fetch(self):
+        raise RuntimeError("site down")
+
+
+class FakeNotifier:
+    def __init__(self, *_args, **_kwargs):
+        pass
+
+    def build_digest_payloads(self, summary):
+        return [{"content": "digest"}]
+
+    def send(self, payload):
+        return True, "ok"
+
+    @contextmanager
+    def session(self):
+        yield self
+
+
+def _session():
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    TestingSession = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    Base.metadata.create_all(bind=engine)
+    db = TestingSession()
+    source = Source(name="web3career", base_url="https://web3.career", enabled=True, crawl_config={})
+    db.add(source)
+    db.add(Setting(key="scoring", value=default_score_config()))
+    db.add(Setting(key="notifications", value=default_notification_config()))
+    db.commit()
+    return db, source
+
+
+def _add_runs(db, source_id: int, statuses: list[str], finished_at: datetime):
+    # statuses are given oldest first
+    for offset, status in enumerate(statuses):
+        ts = finished_at - timedelta(minutes=len(statuses) - offset)
+        db.add(CrawlRun(source_id=source_id, started_at=ts, finished_at=ts, status=status))
+    db.commit()
+
+
+def test_breaker_opens_after_consecutive_failures():
+    db, source = _session()
+    now = datetime.utcnow()
+    _add_runs(db, source.id, ["failed", "failed"], now)
+    assert breaker_state(db, source.id, now)["state"] == CLOSED
+
+    _add_runs(db, source.id, ["failed"], now + timedelta(minutes=1))
+    state = breaker_state(db, source.id, now + timedelta(minutes=1))
+    assert state["state"] == OPEN
+    assert state["consecutive_failures"] == 3
+    assert state["retry_at"] is not None
+
+
+def test_breaker_success_resets_failure_streak():
+    db, source = _session()
+    now = datetime.utcnow()
+    _add_runs(db, source.id, ["failed", "failed", "failed", "success", "failed"], now)
+
+    state = breaker_state(db, source.id, now)
+    assert state["state"] == CLOSED
+    assert state["consecutive_failures"] == 1
+
+
+def test_breaker_half_opens_after_cooldown():
+    db, source = _session()
+    long_ago = datetime.utcnow() - timedelta(days=30)
+    _add_runs(db, source.id, ["failed", "failed", "failed"], long_ago)
+
+    assert breaker_state(db, source.id)["state"] == HALF_OPEN
+
+
+def test_breaker_states_match_per_source_state(api_sessionmaker):
+    db = api_sessionmaker()
+    now = datetime.utcnow()
+    histories = [[], ["failed"] * 3, ["failed", "failed", "failed", "success"], ["success", "failed", "failed", "failed"]]
+    for idx, statuses in enumerate(histories):
+        source = Source(name=f"source-{idx}", base_url="https://example.com", enabled=True, crawl_config={})
+        db.add(source)
+        db.commit()
+        _add_runs(db, source.id, statuses, now - timedelta(hours=idx))
+    ids = [source_id for (source_id,) in db.query(Source.id)]
+
+    assert breaker_states(db, ids, now) == {source_id: breaker_state(db, source_id, now) for source_id in ids}
+    assert {state["state"] for state in breaker_states(db, ids, now).values()} == {CLOSED, OPEN}
+
+    # The source list costs the same number of queries however many sources there are.
+    client = TestClient(app)
+    response = client.get("/api/v1/sources")
+    assert [item["breaker"]["state"] for item in response.json()] == [CLOSED, OPEN, CLOSED, OPEN]
+    db.query(CrawlRun).filter(CrawlRun.source_id != ids[0]).delete()
+    db.query(Source).filter(Source.id != ids[0]).delete()
+    db.commit()
+    bump_cache_generation()
+    assert client.get("/api/v1/sources").headers["X-DB-Query-Count"] == response.headers["X-DB-Query-Count"]
+
+
+def test_run_crawl_skips_open_circuit_source(monkeypatch):
+    db, source = _session()
+    _add_runs(db, source.id, ["failed", "failed", "failed"], datetime.utcnow())
+
+    CountingAdapter.calls = 0
+    monkeypatch.setitem(crawl_service.ADAPTERS, "web3career", CountingAdapter)
+    monkeypatch.setattr(crawl_service, "DiscordNotifier", FakeNotifier)
+
+    result = run_crawl(db)
+
+    assert CountingAdapter.calls == 0
+    assert result["source_stats"][0]["status"] == "circuit_open"
+    latest = db.query(CrawlRun).order_by(CrawlRun.id.desc()).first()
+    assert latest.status == "skipped"
+    # Skipped runs must not extend the failure streak or reset the cool-down.
+    assert breaker_state(db, source.id)["consecutive_failures"] == 3
+
+
+def test_run_crawl_failed_probe_reopens_circuit(monkeypatch):
+    db, source = _session()
+    _add_runs(db, source.id, ["failed", "failed", "failed"], datetime.utcnow() - timedelta(days=30))
+
+    monkeypatch.setitem(crawl_service.ADAPTERS, "web3career", BrokenAdapter)
+    monkeypatch.setattr(crawl_service, "DiscordNotifier", FakeNotifier)
+
+    result = run_crawl(db)
+
+    assert result["failed_sources"] == ["web3career"]
+    state = breaker_state(db, source.id)
+    assert state["state"] == OPEN
+    assert state["consecutive_failures"] == 4
+
+
+def _scheduled_interval() -> timedelta:
+    workflow = Path(__file__).resolve().parents[2] / ".github" / "workflows" / "crawl.yml"
+    cron = re.search(r'cron:\s*"([^"]+)"', workflow.read_text(encoding="utf-8")).group(1)
+    minute, hour, *rest = cron.split()
+    assert minute.isdigit() and hour.isdigit() and rest == ["*", "*", "*"], f"unexpected schedule {cron}"
+    return timedelta(days=1)
+
+
+def test_breaker_skips_scheduled_runs_of_a_failing_source():
+    db, source = _session()
+    interval = _scheduled_interval()
+    start = datetime(2026, 1, 1)
+
+    probed_days = []
+    for day in range(30):
+        now = start + day * interval
+        if breaker_state(db, source.id, now)["state"] == OPEN:
+            continue
+        probed_days.append(day)
+        finished = now + timedelta(minutes=10)
+        db.add(CrawlRun(source_id=source.id, started_at=now, finished_at=finished, status="failed"))
+        db.commit()
+
+    # Three failures open the circuit; probes then back off 36h, 72h, 144h and the 7 day ceiling.
+    assert probed_days == [0, 1, 2, 4, 8, 15, 23]
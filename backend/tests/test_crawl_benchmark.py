@@ -0,0 +1,78 @@
+from __future__ import annotations
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.crawlers.registry import ADAPTERS
+from app.db.database import Base
+from app.models.job import Job
+from app.models.setting import Setting
+from app.models.source import Source
+from app.services.crawl_service import run_crawl
+from app.services.seed import DEFAULT_SOURCES, default_notification_config, default_score_config
+from app.utils.stages import collect_stages, stage
+from benchmarks.crawl_ingest import compare
+from benchmarks.replay import FixtureRoutes, load_manifest, replay_http
+
+
+def _session():
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)()
+    for name, base_url, _enabled in DEFAULT_SOURCES:
+        db.add(Source(name=name, base_url=base_url, enabled=True, crawl_config={}))
+    db.add(Setting(key="scoring", value=default_score_config()))
+    db.add(Setting(key="notifications", value=default_notification_config()))
+    db.commit()
+    return db
+
+
+def test_stage_is_a_noop_outside_collect_stages():
+    with stage("parse"):
+        pass
+    with collect_stages() as stats:
+        with stage("parse"):
+            pass
+        with stage("parse"):
+            pass
+    assert stats.stages["parse"]["calls"] == 2
+    with stage("parse"):
+        pass
+    assert stats.stages["parse"]["calls"] == 2
+
+
+def test_every_adapter_has_fixtures():
+    assert set(load_manifest()) == set(ADAPTERS)
+
+
+def test_fixture_replay_drives_run_crawl_through_every_stage():
+    db = _session()
+    routes = FixtureRoutes()
+
+    with replay_http(routes), collect_stages() as stats:
+        first = run_crawl(db)
+    assert routes.misses == []
+    assert {item["source"]: item["status"] for item in first["source_stats"]} == {name: "success" for name in ADAPTERS}
+    assert all(item["fetched"] > 0 for item in first["source_stats"])
+    assert first["new_jobs"] == db.query(Job).count() > 0
+    assert {"parse", "filter", "dedup", "score", "persist", "digest"} <= set(stats.stages)
+    assert stats.stages["parse"]["calls"] == len(ADAPTERS)
+
+    # Replaying the same pages only exercises dedup.
+    with replay_http(routes), collect_stages() as stats:
+        second = run_crawl(db)
+    assert second["new_jobs"] == 0
+    assert "persist" not in stats.stages
+
+
+def test_compare_flags_slower_and_larger_stages():
+    def results(seconds, peak):
+        return {
+            "tracemalloc": True,
+            "rounds": [{"sources": {}, "stages": {"parse": {"seconds": seconds, "peak_bytes": peak}}}],
+        }
+
+    baseline = results(0.1, 1_000_000)
+    assert compare(results(0.12, 1_100_000), baseline, 0.5) == []
+    problems = compare(results(0.5, 5_000_000), baseline, 0.5)
+    assert len(problems) == 2
+    assert problems[0].startswith("round 1 parse: 500.0 ms")
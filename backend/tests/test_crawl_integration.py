@@ -1,16 +1,19 @@
 from __future__ import annotations
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from app.crawlers.base import NormalizedJob
+from app.crawlers.base import NormalizedJob, SourceAdapter
 from app.db.database import Base
 from app.models.job import Job
 from app.models.notification import Notification
 from app.models.setting import Setting
 from app.models.source import Source
+from app.models.source_cursor import SourceCursor
 from app.services import crawl_service
 from app.services.crawl_service import run_crawl
+from app.services.outbox import deliver_outbox
 from app.services.seed import default_notification_config, default_score_config
 
 
@@ -110,6 +113,15 @@ class AINonDomainAdapter:
         ]
 
 
+class CursorAdapter(SourceAdapter):
+    seen_cursors: list[dict] = []
+
+    def fetch(self):
+        CursorAdapter.seen_cursors.append(dict(self.cursor))
+        self.cursor["runs"] = self.cursor.get("runs", 0) + 1
+        return []
+
+
 class FakeNotifier:
     def __init__(self, *_args, **_kwargs):
         self.sent = []
@@ -120,23 +132,27 @@ class FakeNotifier:
     def build_digest_payloads(self, summary):
         return [{"mode": "digest", "summary": summary}]
 
-    def send(self, payload):
+    def send(self, payload, idempotency_key=None):
         self.sent.append(payload)
         return True, "ok"
 
+    @contextmanager
+    def session(self):
+        yield self
+
 
 class QuietProbeNotifier(FakeNotifier):
     send_calls = 0
 
-    def send(self, payload):
+    def send(self, payload, idempotency_key=None):
         QuietProbeNotifier.send_calls += 1
-        return super().send(payload)
+        return super().send(payload, idempotency_key)
 
 
 class FlakyDigestNotifier(FakeNotifier):
     send_calls = 0
 
-    def send(self, payload):
+    def send(self, payload, idempotency_key=None):
         FlakyDigestNotifier.send_calls += 1
         if FlakyDigestNotifier.send_calls == 1:
             return False, "digest failed"
@@ -216,6 +232,7 @@ def test_run_crawl_respects_daily_job_push_limit(monkeypatch):
     monkeypatch.setattr(crawl_service, "DiscordNotifier", FakeNotifier)
 
     result = run_crawl(db)
+    deliver_outbox(db, notifier=FakeNotifier())
 
     assert result["new_jobs"] == 2
     assert result["selected_jobs_count"] == 1
@@ -359,6 +376,8 @@ def test_run_crawl_sends_end_marker_even_if_digest_fails(monkeypatch):
     monkeypatch.setattr(crawl_service, "DiscordNotifier", FlakyDigestNotifier)
 
     run_crawl(db)
+    # The digest gets a single attempt, so its failure is final and the end marker is released.
+    deliver_outbox(db, notifier=FlakyDigestNotifier(), max_attempts=1)
 
     digest_rows = db.query(Notification).filter(Notification.mode == "digest").all()
     assert len(digest_rows) == 1
@@ -366,3 +385,25 @@ def test_run_crawl_sends_end_marker_even_if_digest_fails(monkeypatch):
     end_rows = db.query(Notification).filter(Notification.mode == "end_of_push").all()
     assert len(end_rows) == 1
     assert end_rows[0].status == "sent"
+
+
+def test_run_crawl_persists_adapter_cursor(monkeypatch):
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    TestingSession = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    Base.metadata.create_all(bind=engine)
+
+    db = TestingSession()
+    db.add(Source(name="abetterweb3", base_url="https://abetterweb3.notion.site", enabled=True, crawl_config={}))
+    db.add(Setting(key="scoring", value=default_score_config()))
+    db.add(Setting(key="notifications", value=default_notification_config()))
+    db.commit()
+
+    CursorAdapter.seen_cursors = []
+    monkeypatch.setitem(crawl_service.ADAPTERS, "abetterweb3", CursorAdapter)
+    monkeypatch.setattr(crawl_service, "DiscordNotifier", FakeNotifier)
+
+    run_crawl(db)
+    run_crawl(db)
+
+    assert CursorAdapter.seen_cursors == [{}, {"runs": 1}]
+    assert db.query(SourceCursor).one().value == {"runs": 2}
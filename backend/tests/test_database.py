@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from app.api.deps import require_user
+from app.core.config import settings
+from app.db.database import async_database_url, pool_options
+from app.db.pool_stats import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    WaitHistogram,
+    instrumented_pool_class,
+    pool_stats,
+)
+from app.main import app
+
+
+def test_async_database_url_swaps_in_asyncio_drivers():
+    assert async_database_url("postgresql+psycopg://u:p@db:5432/jobs") == "postgresql+psycopg://u:p@db:5432/jobs"
+    assert async_database_url("postgresql://u:p@db/jobs") == "postgresql+psycopg://u:p@db/jobs"
+    assert async_database_url("sqlite:///./local.db") == "sqlite+aiosqlite:///./local.db"
+    assert async_database_url("mysql+aiomysql://u@h/db") == "mysql+aiomysql://u@h/db"
+
+
+def test_pool_options_apply_settings_except_for_sqlite(monkeypatch):
+    monkeypatch.setattr(settings, "db_pool_size", 12)
+    options = pool_options("postgresql+psycopg://u:p@db/jobs")
+    assert options["pool_size"] == 12 and options["pool_pre_ping"] is True
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert pool_options("postgresql+psycopg://u:p@db/jobs", asynchronous=True)["poolclass"] is InstrumentedAsyncQueuePool
+    assert pool_options("sqlite:///./local.db") == {}
+
+
+def test_instrumented_pool_records_checkout_waits_and_timeouts(tmp_path):
+    histogram = WaitHistogram()
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=instrumented_pool_class(QueuePool, histogram),
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    conn = engine.connect()
+    stats = pool_stats(engine.pool)
+    assert stats["checked_out"] == 1 and stats["size"] == 1
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+    conn.close()
+    engine.dispose()
+
+    wait = pool_stats(engine.pool)["wait"]
+    assert wait["count"] == 2 and wait["timeouts"] == 1
+    assert sum(wait["buckets"].values()) == 2 and wait["max_ms"] >= 50
+
+
+def test_pool_stats_require_login():
+    client = TestClient(app)
+    assert client.get("/health").json() == {"ok": True}
+    assert client.get("/health/pool").status_code == 401
+
+    app.dependency_overrides[require_user] = lambda: "admin"
+    try:
+        body = client.get("/health/pool").json()
+    finally:
+        app.dependency_overrides.clear()
+    assert "pool" in body["sync"]
@@ -0,0 +1,65 @@
+from __future__ import annotations
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.db.database import Base
+from app.models.crawl_run import CrawlRun
+from app.models.job import Job
+from app.models.job_score import JobScore
+from app.models.notification import Notification
+from app.models.source import Source
+from app.services.job_search import has_cjk
+from app.services.seed import DEFAULT_SOURCES
+from benchmarks.generate_dataset import generate
+
+
+def _engine():
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine, future=True)()
+    for name, base_url, enabled in DEFAULT_SOURCES:
+        db.add(Source(name=name, base_url=base_url, enabled=enabled, crawl_config={}))
+    db.commit()
+    db.close()
+    return engine
+
+
+def test_generate_fills_every_table_with_consistent_rows():
+    engine = _engine()
+    now = datetime(2026, 3, 4, 23, 30, 0)
+    written = generate(engine, jobs=1200, days=30, companies=200, batch_size=500, runs_per_day=2, now=now)
+
+    assert written["jobs"] == written["job_scores"] == 1200
+    assert written["crawl_runs"] == 30 * 2 * len(DEFAULT_SOURCES)
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(Job)).scalar() == 1200
+        assert conn.execute(select(func.count()).select_from(JobScore)).scalar() == 1200
+        assert conn.execute(select(func.count()).select_from(CrawlRun)).scalar() == written["crawl_runs"]
+        assert conn.execute(select(func.count()).select_from(Notification)).scalar() == written["notifications"]
+
+        rows = conn.execute(select(Job.title, Job.company, Job.collected_at, Job.posted_at)).all()
+        assert all(now - timedelta(days=30) <= row.collected_at <= now for row in rows)
+        assert all(row.posted_at is None or row.posted_at <= row.collected_at for row in rows)
+        assert 0 < sum(has_cjk(row.title) for row in rows) < len(rows) // 2
+        top_company = conn.execute(
+            select(Job.company, func.count()).group_by(Job.company).order_by(func.count().desc())
+        ).first()
+        assert top_company[1] > 1200 / 200
+        items = conn.execute(select(func.count()).where(Notification.mode == "job_digest_item")).scalar()
+        assert 0 < items <= 30 * 50
+
+
+def test_generate_is_deterministic_and_appends():
+    now = datetime(2026, 3, 4, 12, 0, 0)
+    first, second = _engine(), _engine()
+    generate(first, jobs=300, days=10, companies=50, now=now)
+    generate(second, jobs=300, days=10, companies=50, now=now)
+    query = select(Job.title, Job.company, Job.collected_at).order_by(Job.id)
+    with first.connect() as a, second.connect() as b:
+        assert a.execute(query).all() == b.execute(query).all()
+
+    generate(first, jobs=100, days=10, companies=50, now=now, seed=8)
+    with first.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(Job)).scalar() == 400
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import pytest
+
+from app.core.config import settings
+from app.crawlers import http_helpers
+from app.crawlers.adapters import aijobsnet, cryptojobslist, linkedin
+from app.crawlers.http_helpers import FALLBACK_PARSER, LazyLinks, make_soup, resolve_parser, soup_links
+
+
+LINKEDIN_HTML = """
+<div class='base-card'>
+  <a class='base-card__full-link' href='https://www.linkedin.com/jobs/view/head-of-web3-12345?trk=x'>open</a>
+  <h3 class='base-search-card__title'>Head of Web3</h3>
+  <h4 class='base-search-card__subtitle'><a href='/company/revenue3'>Revenue3</a></h4>
+  <span class='job-search-card__location'>United States</span>
+</div>
+"""
+
+AIJOBSNET_HTML = """
+<ul id='job_list'>
+  <li>
+    <div>
+      <div><a href='/job/backend-engineer-ai-remote-us-8829/'>Backend Engineer, AI</a></div>
+      <div><span>Python</span> | <span>LLM</span></div>
+    </div>
+    <div class='text-end'>
+      <div><span class='text-bg-secondary'>Full Time</span></div>
+      <div>Remote - US</div>
+      <div class='text-muted'>5h ago</div>
+    </div>
+  </li>
+</ul>
+"""
+
+
+def test_soup_links_collects_links_lazily(monkeypatch):
+    soup, links = soup_links("<p><a href='/a'>A</a><a href='/b'>B</a></p>")
+    assert isinstance(links, LazyLinks)
+    assert links._links is None
+
+    assert [a["href"] for a in links] == ["/a", "/b"]
+    assert len(links) == 2
+    assert links[1]["href"] == "/b"
+
+
+def test_unknown_parser_falls_back_to_stdlib_parser():
+    assert resolve_parser("no-such-parser") == FALLBACK_PARSER
+    assert make_soup("<a href='/x'>x</a>", parser="no-such-parser").a["href"] == "/x"
+
+
+@pytest.mark.parametrize("parser", ["html.parser", "lxml"])
+def test_adapter_selectors_work_with_each_parser(monkeypatch, parser):
+    if resolve_parser(parser) != parser:
+        pytest.skip(f"{parser} not installed")
+    monkeypatch.setattr(settings, "html_parser", parser)
+
+    monkeypatch.setattr(linkedin, "fetch_html", lambda *_args, **_kwargs: LINKEDIN_HTML)
+    jobs = linkedin.LinkedInAdapter().fetch()
+    assert [(j.title, j.company, j.source_job_id) for j in jobs] == [("Head of Web3", "Revenue3", "12345")]
+
+    monkeypatch.setattr(aijobsnet, "fetch_html", lambda *_args, **_kwargs: AIJOBSNET_HTML)
+    jobs = aijobsnet.AIJobsNetAdapter().fetch()
+    assert [(j.title, j.location, j.employment_type) for j in jobs] == [
+        ("Backend Engineer, AI", "Remote - US", "Full Time")
+    ]
+    assert http_helpers.resolve_parser(settings.html_parser) == parser
+
+
+def test_adapter_strainer_keeps_only_declared_subtree(monkeypatch):
+    page = """
+    <html><head><title>Crypto Jobs</title><script>var big = 1;</script></head>
+    <body>
+      <nav><a href='/about'>About</a></nav>
+      <table class='table job-preview-inline-table striped'>
+        <tbody><tr><td><a href='/jobs/rust-engineer-at-acme'>Rust Engineer</a></td><td>Acme</td></tr></tbody>
+      </table>
+      <footer><a href='/jobs/not-a-row'>Footer link</a></footer>
+    </body></html>
+    """
+    soup, links = soup_links(page, parse_only=cryptojobslist.CryptoJobsListAdapter.parse_only)
+
+    assert soup.title is None
+    assert [a["href"] for a in links] == ["/jobs/rust-engineer-at-acme"]
+
+    monkeypatch.setattr(cryptojobslist, "fetch_html", lambda *_args, **_kwargs: page)
+    jobs = cryptojobslist.CryptoJobsListAdapter().fetch()
+    assert [(j.title, j.company) for j in jobs] == [("Rust Engineer", "Acme")]
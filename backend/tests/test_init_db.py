@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db import init_db as init_db_module
+from app.models.schema_version import SchemaVersion
+from app.models.source import Source
+from app.services import seed
+
+
+@pytest.fixture()
+def fresh_engine(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'init.db'}", future=True)
+    TestingSession = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    monkeypatch.setattr(init_db_module, "engine", engine)
+    monkeypatch.setattr(seed, "SessionLocal", TestingSession)
+    yield TestingSession
+    engine.dispose()
+
+
+def test_init_db_runs_once_per_schema_fingerprint(fresh_engine, monkeypatch):
+    init_db_module.init_db()
+
+    db = fresh_engine()
+    assert db.query(Source).count() == len(seed.DEFAULT_SOURCES)
+    assert db.get(SchemaVersion, 1).fingerprint == init_db_module.schema_fingerprint()
+    db.close()
+
+    calls = []
+    monkeypatch.setattr(init_db_module, "seed_sources_if_empty", lambda: calls.append("seed"))
+    init_db_module.init_db()
+    assert calls == []
+
+    monkeypatch.setattr(init_db_module, "schema_fingerprint", lambda: "changed")
+    init_db_module.init_db()
+    assert calls == ["seed"]
+    db = fresh_engine()
+    assert db.get(SchemaVersion, 1).fingerprint == "changed"
+    db.close()
+
+
+def test_fingerprint_tracks_default_sources(monkeypatch):
+    before = init_db_module.schema_fingerprint()
+    monkeypatch.setattr(init_db_module, "DEFAULT_SOURCES", (*seed.DEFAULT_SOURCES, ("newsite", "https://x", True)))
+    assert init_db_module.schema_fingerprint() != before
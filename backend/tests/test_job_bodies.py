@@ -0,0 +1,101 @@
+from __future__ import annotations
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.crawlers.base import NormalizedJob
+from app.main import app
+from app.models.job import Job
+from app.models.job_body import JobBody
+from app.models.job_score import JobScore
+from app.models.setting import Setting
+from app.models.source import Source
+from app.services import crawl_service, job_bodies
+from app.services.crawl_service import run_crawl
+from app.services.job_bodies import decode_description, decode_payload, encode_body, externalize_bodies
+from app.services.scoring import Scorer
+from app.services.seed import default_notification_config, default_score_config
+
+DESCRIPTION = "Senior smart contract engineer for a defi protocol. Remote, Singapore hours. " * 20
+
+
+class BodyAdapter:
+    def fetch(self):
+        return [
+            NormalizedJob(
+                source_job_id=f"body-{i}",
+                canonical_url=f"https://example.com/jobs/{i}",
+                title="Senior Solidity Engineer",
+                company="Acme",
+                location="Singapore",
+                remote_type="remote",
+                description=DESCRIPTION,
+                posted_at=datetime.utcnow() - timedelta(hours=1),
+                raw_payload={"site": "example", "company_url": "https://acme.example"},
+            )
+            for i in range(3)
+        ]
+
+
+def _seed(db):
+    db.add(Source(name="bodies", base_url="https://example.com", enabled=True, crawl_config={}))
+    db.add(Setting(key="scoring", value=default_score_config()))
+    db.add(Setting(key="notifications", value=default_notification_config()))
+    db.commit()
+
+
+def test_compressed_storage_keeps_jobs_rows_narrow(api_sessionmaker, monkeypatch):
+    monkeypatch.setattr(settings, "job_body_storage", "compressed")
+    monkeypatch.setattr(settings, "job_search_excerpt_chars", 100)
+    monkeypatch.setitem(crawl_service.ADAPTERS, "bodies", BodyAdapter)
+    db = api_sessionmaker()
+    _seed(db)
+
+    result = run_crawl(db)
+
+    assert result["new_jobs"] == 3
+    assert {(job.description, str(job.raw_payload)) for job in db.query(Job)} == {(DESCRIPTION[:100], "{}")}
+    body = db.query(JobBody).first()
+    assert len(body.description) < len(DESCRIPTION) // 4
+    assert decode_description(body.codec, body.description) == DESCRIPTION
+    assert decode_payload(body.codec, body.raw_payload) == {"site": "example", "company_url": "https://acme.example"}
+    # Scoring and the digest still see the full text.
+    expected = Scorer(default_score_config()).score(BodyAdapter().fetch()[0])
+    assert db.query(JobScore).first().keyword_score == expected.keyword_score > 0
+    assert result["company_summaries"][0]["company_url"] == "https://acme.example"
+
+    client = TestClient(app)
+    job_id = db.query(Job.id).order_by(Job.id).first()[0]
+    detail = client.get(f"/api/v1/jobs/{job_id}").json()
+    assert detail["description"] == DESCRIPTION
+    assert detail["raw_payload"] == {"site": "example", "company_url": "https://acme.example"}
+    assert {item["description"] for item in client.get("/api/v1/jobs").json()} == {DESCRIPTION}
+    assert "description" not in client.get("/api/v1/jobs", params={"view": "summary"}).json()[0]
+    # Search matches the inline excerpt of the description.
+    assert len(client.get("/api/v1/jobs", params={"q": "defi protocol"}).json()) == 3
+
+
+def test_externalize_moves_inline_bodies(api_sessionmaker, monkeypatch):
+    monkeypatch.setitem(crawl_service.ADAPTERS, "bodies", BodyAdapter)
+    db = api_sessionmaker()
+    _seed(db)
+    run_crawl(db)
+    assert db.query(JobBody).count() == 0
+    job_id = db.query(Job.id).first()[0]
+    assert TestClient(app).get(f"/api/v1/jobs/{job_id}").json()["raw_payload"]["site"] == "example"
+
+    assert externalize_bodies(db, batch_size=2) == 3
+    assert externalize_bodies(db) == 0
+    assert {job.description for job in db.query(Job)} == {DESCRIPTION[: settings.job_search_excerpt_chars]}
+
+    detail = TestClient(app).get(f"/api/v1/jobs/{job_id}").json()
+    assert (detail["description"], detail["raw_payload"]["site"]) == (DESCRIPTION, "example")
+
+
+def test_zlib_is_used_without_zstandard(monkeypatch):
+    monkeypatch.setattr(job_bodies, "zstandard", None)
+    body = encode_body("描述 description", {"site": "dejob"})
+    assert body.codec == "zlib"
+    assert decode_description(body.codec, body.description) == "描述 description"
+    assert decode_payload(body.codec, body.raw_payload) == {"site": "dejob"}
@@ -0,0 +1,157 @@
+from __future__ import annotations
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.api.jobs import FACET_DIMENSIONS, _facet_statements
+from app.db import init_db as init_db_module
+from app.db.database import Base
+from app.main import app
+from app.models.job import Job
+from app.models.job_score import JobScore
+from app.models.source import Source
+from app.services.response_cache import bump_cache_generation
+from app.utils.cache import TTLCache
+
+
+def _engine():
+    return create_engine(
+        "sqlite+pysqlite:///:memory:", future=True, connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+
+
+def test_facets_count_every_dimension_and_are_cached(api_sessionmaker):
+    db = api_sessionmaker()
+    db.add(Source(id=1, name="web3career", base_url="https://web3.career", enabled=True, crawl_config={}))
+    db.add(Source(id=2, name="aijobsnet", base_url="https://aijobs.net", enabled=True, crawl_config={}))
+    day = datetime(2024, 5, 2, 12, 0)
+    specs = [
+        (1, "web3", "remote", "high", day),
+        (1, "web3", "onsite", "low", day),
+        (2, "AI", "remote", None, day - timedelta(days=1)),
+    ]
+    for idx, (source_id, domain, remote_type, decision, ts) in enumerate(specs):
+        db.add(
+            Job(
+                id=idx + 1,
+                source_id=source_id,
+                source_job_id=str(idx),
+                canonical_url=f"https://example.com/{idx}",
+                title=f"Rust Engineer {idx}",
+                domain=domain,
+                remote_type=remote_type,
+                collected_at=ts,
+            )
+        )
+        if decision:
+            db.add(
+                JobScore(
+                    job_id=idx + 1,
+                    total_score=1.0,
+                    keyword_score=1.0,
+                    seniority_score=0.0,
+                    remote_bonus=0.0,
+                    region_bonus=0.0,
+                    decision=decision,
+                )
+            )
+    db.commit()
+
+    try:
+        client = TestClient(app)
+        body = client.get("/api/v1/jobs/facets").json()
+        assert body["total"] == 3
+        facets = {name: {item["value"]: item["count"] for item in items} for name, items in body["facets"].items()}
+        assert facets["source_id"] == {1: 2, 2: 1}
+        assert facets["decision"] == {"high": 1, "low": 1, None: 1}
+        assert facets["domain"] == {"web3": 2, "AI": 1}
+        assert facets["remote_type"] == {"remote": 2, "onsite": 1}
+        assert [item["value"] for item in body["facets"]["day"]] == ["2024-05-01", "2024-05-02"]
+
+        filtered = client.get("/api/v1/jobs/facets", params={"source_id": 1, "high_priority": True}).json()
+        assert filtered["total"] == 1
+
+        db.add(Job(source_id=1, source_job_id="late", canonical_url="https://example.com/late", title="Late"))
+        db.commit()
+        assert client.get("/api/v1/jobs/facets").json()["total"] == 3
+        bump_cache_generation()
+        assert client.get("/api/v1/jobs/facets").json()["total"] == 4
+    finally:
+        db.close()
+
+
+def test_facets_group_each_dimension_separately():
+    # Postgres: one statement with a grouping set per dimension.
+    [statement] = _facet_statements("postgresql", None, None, None, None, None)
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert "GROUP BY GROUPING SETS(jobs.source_id, job_scores.decision, jobs.domain, jobs.remote_type, date(" in sql
+    assert sql.count("grouping(") == len(FACET_DIMENSIONS)
+    # Elsewhere: one GROUP BY per dimension, never their cross product.
+    statements = _facet_statements("sqlite", None, None, None, None, None)
+    assert [len(statement.selected_columns) for statement in statements] == [2] * len(FACET_DIMENSIONS)
+
+
+def test_ttl_cache_expires_and_evicts(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("app.utils.cache.time.monotonic", lambda: clock[0])
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=1)
+    assert cache.get("a") == 1
+    clock[0] += 2
+    assert cache.get("b") is None
+    cache.set("c", 3)
+    cache.set("d", 4)
+    assert cache.get("a") is None and cache.get("d") == 4
+
+
+def test_ttl_cache_bounds_total_weight():
+    cache = TTLCache(maxsize=10, maxweight=100)
+    cache.set("a", "x", weight=60)
+    cache.set("b", "y", weight=30)
+    cache.set("a", "z", weight=50)
+    assert cache.weight == 80
+    cache.set("c", "w", weight=40)
+    assert (cache.get("b"), cache.get("a"), cache.get("c")) == (None, "z", "w") and cache.weight == 90
+
+
+def test_init_db_adds_missing_nullable_columns(monkeypatch):
+    engine = _engine()
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE jobs DROP COLUMN domain"))
+    monkeypatch.setattr(init_db_module, "engine", engine)
+
+    init_db_module._add_missing_columns()
+
+    assert "domain" in {column["name"] for column in inspect(engine).get_columns("jobs")}
+
+
+def test_init_db_backfills_domain_of_existing_jobs(monkeypatch):
+    engine = _engine()
+    Base.metadata.create_all(bind=engine)
+    with Session(bind=engine) as db:
+        db.add(Source(id=1, name="web3career", base_url="https://web3.career", enabled=True, crawl_config={}))
+        db.add(Source(id=2, name="aijobsnet", base_url="https://aijobs.net", enabled=True, crawl_config={}))
+        rows = [(1, "Solidity Engineer", "defi protocol"), (1, "ML Engineer", "train LLM models"), (2, "Designer", "")]
+        for idx, (source_id, title, description) in enumerate(rows):
+            db.add(
+                Job(
+                    source_id=source_id,
+                    source_job_id=str(idx),
+                    canonical_url=f"https://example.com/{idx}",
+                    title=title,
+                    description=description,
+                )
+            )
+        db.commit()
+    monkeypatch.setattr(init_db_module, "engine", engine)
+
+    init_db_module._backfill()
+
+    with Session(bind=engine) as db:
+        assert [domain for (domain,) in db.query(Job.domain).order_by(Job.id)] == ["web3", "AI", "AI"]
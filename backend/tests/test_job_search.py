@@ -0,0 +1,79 @@
+from __future__ import annotations
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from app.main import app
+from app.models.job import Job
+from app.models.source import Source
+from app.services.job_search import has_cjk, prefix_tsquery, search_condition
+
+
+def _compile(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+def test_postgres_search_uses_tsvector_and_rank():
+    condition, rank = search_condition("solidity engineer", "postgresql")
+    compiled = condition.compile(dialect=postgresql.dialect())
+    assert "jobs.search_vector @@ websearch_to_tsquery(" in str(compiled)
+    assert "jobs.search_vector @@ to_tsquery(" in str(compiled)
+    assert sorted(compiled.params.values()) == ["simple", "simple", "solidity & engineer:*", "solidity engineer"]
+    assert "ts_rank_cd(jobs.search_vector" in _compile(rank)
+
+
+def test_prefix_tsquery_matches_partial_last_word():
+    assert prefix_tsquery("eng") == "eng:*"
+    assert prefix_tsquery("Solid  eng!") == "solid & eng:*"
+    # Websearch syntax is left to websearch_to_tsquery alone.
+    assert prefix_tsquery('"smart contract"') is None
+    assert prefix_tsquery("rust -solana") is None
+    assert prefix_tsquery("rust or go") is None
+    assert prefix_tsquery("!!") is None
+
+
+def test_postgres_search_falls_back_to_trigram_ilike_for_cjk():
+    assert has_cjk("区块链工程师")
+    condition, rank = search_condition("区块链", "postgresql")
+    sql = _compile(condition)
+    assert "ILIKE" in sql.upper()
+    assert "@@" not in sql
+    assert "word_similarity" in _compile(rank)
+
+    # Without pg_trgm word_similarity() does not exist: keep ILIKE, order by recency.
+    condition, rank = search_condition("区块链", "postgresql", trigram=False)
+    assert "ILIKE" in _compile(condition).upper()
+    assert rank is None
+
+
+def test_other_dialects_keep_ilike_without_rank():
+    condition, rank = search_condition("rust", "sqlite")
+    assert rank is None
+    assert "lower(jobs.title) LIKE lower" in str(condition)
+
+
+def test_list_jobs_search_and_relevance_sort_on_sqlite(api_sessionmaker):
+    db = api_sessionmaker()
+    db.add(Source(id=1, name="web3career", base_url="https://web3.career", enabled=True, crawl_config={}))
+    now = datetime.utcnow()
+    for idx, (title, company) in enumerate([("Rust Engineer", "Acme"), ("区块链工程师", "Beta"), ("Designer", "Rustic")]):
+        db.add(
+            Job(
+                source_id=1,
+                source_job_id=str(idx),
+                canonical_url=f"https://example.com/{idx}",
+                title=title,
+                company=company,
+                collected_at=now - timedelta(hours=idx),
+            )
+        )
+    db.commit()
+    db.close()
+
+    client = TestClient(app)
+    titles = [row["title"] for row in client.get("/api/v1/jobs", params={"q": "rust"}).json()]
+    assert titles == ["Rust Engineer", "Designer"]
+    titles = [row["title"] for row in client.get("/api/v1/jobs", params={"q": "区块链", "sort": "relevance"}).json()]
+    assert titles == ["区块链工程师"]
+    assert client.get("/api/v1/jobs", params={"sort": "bogus"}).status_code == 422
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from app.crawlers.jsonld import iter_job_postings, iter_json_ld
+
+
+PAGE = b"""
+<html><head>
+<script type="application/ld+json">{"@type": "Organization", "name": "web3.career"}</script>
+<script type='application/ld+json'>
+[{"@type": "JobPosting", "title": "Rust Engineer"}, {"@type": "BreadcrumbList"}]
+</script>
+<script type=application/ld+json>{"@graph": [{"@type": ["JobPosting"], "title": "\xe5\x8c\xba\xe5\x9d\x97\xe9\x93\xbe\xe5\xb7\xa5\xe7\xa8\x8b\xe5\xb8\x88"}]}</script>
+<script type="application/ld+json">{not json</script>
+<script>var x = {"@type": "JobPosting", "title": "ignored"};</script>
+</head><body>
+<SCRIPT TYPE="application/ld+json"><!-- {"@type": "JobPosting", "title": "Solidity Dev"} --></SCRIPT>
+</body></html>
+"""
+
+
+def test_iter_job_postings_scans_raw_bytes():
+    titles = [item["title"] for item in iter_job_postings(PAGE)]
+    assert titles == ["Rust Engineer", "区块链工程师", "Solidity Dev"]
+
+
+def test_iter_json_ld_without_filter_returns_every_node():
+    types = [item.get("@type") for item in iter_json_ld(PAGE.decode("utf-8"))]
+    assert types == ["Organization", "JobPosting", "BreadcrumbList", ["JobPosting"], "JobPosting"]
+
+
+def test_iter_job_postings_is_lazy():
+    postings = iter_job_postings(PAGE)
+    assert next(postings)["title"] == "Rust Engineer"
@@ -0,0 +1,95 @@
+from __future__ import annotations
+import httpx
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.crawlers.adapters.aijobsnet import AIJobsNetAdapter
+from app.crawlers.registry import ADAPTERS
+from app.db.database import Base
+from app.main import app
+from app.models.job import Job
+from app.models.setting import Setting
+from app.models.source import Source
+from app.services.crawl_service import run_crawl
+from app.services.seed import DEFAULT_SOURCES, default_notification_config, default_score_config
+from benchmarks.mock_server import mock_crawl_configs
+
+
+def _session(configs: dict[str, dict]):
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)()
+    for name, base_url, _enabled in DEFAULT_SOURCES:
+        db.add(Source(name=name, base_url=base_url, enabled=name in configs, crawl_config=configs.get(name, {})))
+    db.add(Setting(key="scoring", value=default_score_config()))
+    db.add(Setting(key="notifications", value=default_notification_config()))
+    db.commit()
+    return db
+
+
+def test_configure_redirects_base_url_and_extra_origins():
+    adapter = AIJobsNetAdapter()
+    assert adapter.resolve("https://aijobs.net/") == "https://aijobs.net/"
+
+    adapter.configure(
+        {"base_url": "http://mirror.local/aijobs/", "url_overrides": {"https://cdn.aijobs.net": "http://mirror.local/cdn"}}
+    )
+    assert adapter.resolve("https://aijobs.net/") == "http://mirror.local/aijobs/"
+    assert adapter.resolve("https://aijobs.net/job/1?x=1") == "http://mirror.local/aijobs/job/1?x=1"
+    assert adapter.resolve("https://cdn.aijobs.net/a.json") == "http://mirror.local/cdn/a.json"
+    assert adapter.resolve("https://aijobs.network/") == "https://aijobs.network/"
+    assert AIJobsNetAdapter().url_overrides == {}
+
+
+def test_run_crawl_against_mock_board(mock_board):
+    server = mock_board()
+    db = _session(mock_crawl_configs(server.base_url))
+
+    result = run_crawl(db)
+
+    assert {item["source"]: item["status"] for item in result["source_stats"]} == {name: "success" for name in ADAPTERS}
+    assert server.routes.misses == []
+    assert server.stats["status_200"] == server.stats["requests"] > len(ADAPTERS)
+    # Only fetches are redirected; stored links keep the public origin.
+    urls = [url for (url,) in db.query(Job.canonical_url)]
+    assert urls and not any(server.base_url in url for url in urls)
+
+
+def test_mock_board_injects_errors(mock_board):
+    server = mock_board(error_rate=1.0, error_statuses=(503,))
+    db = _session(mock_crawl_configs(server.base_url, ["aijobsnet", "dejob"]))
+
+    result = run_crawl(db)
+
+    assert sorted(result["failed_sources"]) == ["aijobsnet", "dejob"]
+    assert server.stats["status_503"] == server.stats["requests"] == 2
+
+
+def test_mock_board_serves_extra_pages(mock_board):
+    server = mock_board(pages=3)
+    config = mock_crawl_configs(server.base_url, ["dejob"])["dejob"]
+    adapter = ADAPTERS["dejob"]()
+    adapter.configure(config)
+
+    jobs = adapter.fetch()
+
+    assert len(jobs) == 20 + 20 + 8
+    assert len({job.source_job_id for job in jobs}) == len(jobs)
+    assert httpx.get(f"{server.base_url}/__stats").json()["requests"] == 3
+
+
+def test_patch_source_updates_crawl_config(api_sessionmaker):
+    db = api_sessionmaker()
+    db.add(Source(name="aijobsnet", base_url="https://aijobs.net", enabled=True, crawl_config={}))
+    db.commit()
+    client = TestClient(app)
+    source_id = client.get("/api/v1/sources").json()[0]["id"]
+
+    resp = client.patch(f"/api/v1/sources/{source_id}", json={"crawl_config": {"base_url": "http://127.0.0.1:8765/aijobs.net"}})
+    assert resp.status_code == 200
+    assert resp.json()["crawl_config"] == {"base_url": "http://127.0.0.1:8765/aijobs.net"}
+    assert resp.json()["enabled"] is True
+
+    bad = client.patch(f"/api/v1/sources/{source_id}", json={"crawl_config": {"base_url": "ftp://example"}})
+    assert bad.status_code == 422
@@ -1,11 +1,16 @@
 from __future__ import annotations
+from pathlib import Path
+import subprocess
+import sys
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from app.crawlers.adapters import abetterweb3
 from app.crawlers.adapters.abetterweb3 import _build_jobs_from_blocks, _extract_collection_and_view
 from app.crawlers.adapters.dejob import _build_jobs
-from app.crawlers.registry import ADAPTERS
+from app.crawlers.base import SourceAdapter
+from app.crawlers.registry import ADAPTER_PATHS, ADAPTERS, LazyAdapterRegistry
 from app.db.database import Base
 from app.models import setting as _setting_model  # ensure settings table is registered
 from app.models.source import Source
@@ -81,6 +86,101 @@ def test_abetterweb3_helpers_extract_company_and_job():
     assert jobs[0].title == "Protocol Engineer"
 
 
+class _FakeNotion:
+    def __init__(self, versions: dict[str, int]):
+        self.versions = versions
+        self.calls: list[tuple[str, dict]] = []
+
+    def _block(self, bid: str) -> dict:
+        return {
+            "value": {
+                "id": bid,
+                "version": self.versions[bid],
+                "type": "page",
+                "parent_table": "collection",
+                "parent_id": "cid",
+                "properties": {"title": [[f"Company {bid}"]], "job": [[f"Engineer {bid}"]]},
+            }
+        }
+
+    def client_factory(self, *_args, **_kwargs):
+        fake = self
+
+        class _Resp:
+            def __init__(self, body: dict):
+                self.body = body
+
+            def raise_for_status(self):
+                return None
+
+            def json(self):
+                return self.body
+
+        class _Client:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *_exc):
+                return False
+
+            def post(self, url, json=None):
+                endpoint = url.rsplit("/", 1)[-1]
+                fake.calls.append((endpoint, json))
+                if endpoint == "loadCachedPageChunk":
+                    return _Resp(
+                        {
+                            "recordMap": {
+                                "collection": {
+                                    "cid": {"value": {"schema": {"title": {"name": "项目/公司"}, "job": {"name": "岗位需求"}}}}
+                                },
+                                "collection_view": {"vid": {"value": {"type": "table", "source_collection_id": "cid"}}},
+                            }
+                        }
+                    )
+                if endpoint == "queryCollection":
+                    listed = {bid: {"value": {"id": bid, "version": v}} for bid, v in fake.versions.items()}
+                    return _Resp(
+                        {
+                            "result": {"reducerResults": {"results": {"blockIds": list(fake.versions)}}},
+                            "recordMap": {"block": listed},
+                        }
+                    )
+                requested = [item["id"] for item in json["requests"]]
+                return _Resp({"recordMap": {"block": {bid: fake._block(bid) for bid in requested}}})
+
+        return _Client()
+
+
+def test_abetterweb3_incremental_sync_only_fetches_changed_blocks(monkeypatch):
+    notion = _FakeNotion({"b1": 1, "b2": 1})
+    monkeypatch.setattr(abetterweb3.httpx, "Client", notion.client_factory)
+
+    adapter = abetterweb3.ABetterWeb3Adapter()
+    adapter.cursor = {}
+    jobs = adapter.fetch()
+    assert sorted(j.source_job_id for j in jobs) == ["b1", "b2"]
+    assert [c[0] for c in notion.calls] == ["loadCachedPageChunk", "queryCollection", "syncRecordValues"]
+    cursor = adapter.cursor
+    assert cursor["collection_id"] == "cid"
+    assert cursor["blocks"] == {"b1": 1, "b2": 1}
+
+    notion.calls.clear()
+    adapter = abetterweb3.ABetterWeb3Adapter()
+    adapter.cursor = dict(cursor)
+    assert adapter.fetch() == []
+    assert [c[0] for c in notion.calls] == ["queryCollection"]
+
+    notion.calls.clear()
+    notion.versions = {"b1": 1, "b2": 2, "b3": 1}
+    adapter = abetterweb3.ABetterWeb3Adapter()
+    adapter.cursor = dict(cursor)
+    jobs = adapter.fetch()
+    assert sorted(j.source_job_id for j in jobs) == ["b2", "b3"]
+    assert [c[0] for c in notion.calls] == ["queryCollection", "syncRecordValues"]
+    assert [item["id"] for item in notion.calls[1][1]["requests"]] == ["b2", "b3"]
+    assert adapter.cursor["blocks"] == {"b1": 1, "b2": 2, "b3": 1}
+
+
 def test_registry_uses_new_sources_and_removes_remote3():
     assert "dejob" in ADAPTERS
     assert "abetterweb3" in ADAPTERS
@@ -91,6 +191,21 @@ def test_registry_uses_new_sources_and_removes_remote3():
     assert "remote3" not in ADAPTERS
 
 
+def test_registry_resolves_every_adapter_lazily():
+    registry = LazyAdapterRegistry(ADAPTER_PATHS)
+    for name in ADAPTER_PATHS:
+        adapter_cls = registry[name]
+        assert issubclass(adapter_cls, SourceAdapter)
+        assert registry[name] is adapter_cls
+
+
+def test_api_import_does_not_load_crawler_stack():
+    code = "import sys, app.main; print(sorted(m for m in ('bs4', 'lxml', 'app.crawlers.http_helpers') if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).resolve().parents[1], capture_output=True, text=True)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.strip() == "[]"
+
+
 def test_seed_adds_new_sources_and_disables_remote3(monkeypatch):
     engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
     TestingSession = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
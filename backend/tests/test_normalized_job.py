@@ -0,0 +1,39 @@
+from __future__ import annotations
+from bs4 import BeautifulSoup
+import pytest
+
+from app.crawlers.base import NormalizedJob
+
+
+def _job(**fields) -> NormalizedJob:
+    return NormalizedJob(source_job_id="1", canonical_url="https://example.com/jobs/1", title="Engineer", **fields)
+
+
+def test_normalized_job_is_slotted():
+    job = _job()
+    assert not hasattr(job, "__dict__")
+    with pytest.raises(AttributeError):
+        job.unknown = 1
+
+
+def test_repeated_small_strings_are_shared():
+    def fresh(value: str) -> str:
+        # A new string object, like a value sliced out of a parsed page.
+        return (value + ".")[:-1]
+
+    first = _job(company=fresh("Acme"), remote_type=fresh("remote"), raw_payload={"site": fresh("dejob")})
+    second = _job(company=fresh("Acme"), remote_type=fresh("remote"), raw_payload={"site": fresh("dejob")})
+    assert fresh("Acme") is not fresh("Acme")
+    assert first.company is second.company
+    assert first.remote_type is second.remote_type
+    assert first.raw_payload["site"] is second.raw_payload["site"]
+
+
+def test_raw_payload_keeps_empty_entries():
+    location = BeautifulSoup("<p>Remote</p>", "html.parser").p.string
+    payload = {"site": "dejob", "company_url": "", "office_mode": None, "category": "AI"}
+    job = _job(location=location, raw_payload=payload)
+    assert type(job.location) is str and job.location == "Remote"
+    # Persisted as parsed, so empty values stay.
+    assert job.raw_payload == payload and job.raw_payload is not payload
+    assert _job().raw_payload == {}
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from datetime import datetime
 
+import pytest
+
 from app.services import notifier as notifier_module
 from app.services.notifier import DiscordNotifier
 
@@ -284,6 +286,7 @@ def test_send_uses_discord_bot_when_configured(monkeypatch):
         def __init__(self, status_code: int = 200, text: str = "ok"):
             self.status_code = status_code
             self.text = text
+            self.headers = {}
 
     class _Client:
         def __init__(self, *args, **kwargs):
@@ -313,6 +316,9 @@ def test_send_uses_discord_bot_when_configured(monkeypatch):
     assert calls[0][0] == "https://discord.com/api/v10/channels/123456/messages"
     assert calls[0][1]["Authorization"] == "Bot bot-token"
 
+    notifier.send({"content": "again"}, idempotency_key="abc123")
+    assert calls[1][2]["nonce"] == "abc123" and calls[1][2]["enforce_nonce"] is True
+
 
 def test_send_falls_back_to_webhook_when_bot_fails(monkeypatch):
     calls: list[str] = []
@@ -321,6 +327,7 @@ def test_send_falls_back_to_webhook_when_bot_fails(monkeypatch):
         def __init__(self, status_code: int, text: str = ""):
             self.status_code = status_code
             self.text = text
+            self.headers = {}
 
     class _Client:
         def __init__(self, *args, **kwargs):
@@ -351,3 +358,82 @@ def test_send_falls_back_to_webhook_when_bot_fails(monkeypatch):
     assert len(calls) == 2
     assert "api/v10/channels/123456/messages" in calls[0]
     assert "api/webhooks/fallback" in calls[1]
+
+
+class _RateLimitedResp:
+    def __init__(self, status_code: int, headers: dict | None = None, body: dict | None = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.text = ""
+        self._body = body or {}
+
+    def json(self):
+        return self._body
+
+
+def test_session_reuses_one_client_and_waits_for_rate_limit_reset(monkeypatch):
+    clients: list = []
+    sleeps: list[float] = []
+    responses = [
+        _RateLimitedResp(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "1.5"}),
+        _RateLimitedResp(200, {"X-RateLimit-Remaining": "4", "X-RateLimit-Reset-After": "2"}),
+    ]
+
+    class _Client:
+        def __init__(self, *args, **kwargs):
+            clients.append(self)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def post(self, url, headers=None, json=None):
+            return responses.pop(0)
+
+    monkeypatch.setattr(notifier_module.httpx, "Client", _Client)
+    monkeypatch.setattr(notifier_module.time, "monotonic", lambda: 100.0)
+    monkeypatch.setattr(notifier_module.time, "sleep", sleeps.append)
+
+    notifier = DiscordNotifier(webhook_url="https://discord.com/api/webhooks/x")
+    with notifier.session():
+        assert notifier.send({"content": "one"})[0] is True
+        assert notifier.send({"content": "two"})[0] is True
+
+    assert len(clients) == 1
+    assert sleeps == [1.5]
+
+
+@pytest.mark.parametrize(
+    ("statuses", "ok", "expected_sleeps"),
+    [
+        ((429, 204), True, [0.25]),
+        # No wait after the last allowed 429: the send has already failed.
+        ((429, 429, 429), False, [0.25, 0.25]),
+    ],
+)
+def test_send_retries_after_429(monkeypatch, statuses, ok, expected_sleeps):
+    sleeps: list[float] = []
+    responses = [_RateLimitedResp(status, body={"retry_after": 0.25}) for status in statuses]
+
+    class _Client:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def post(self, url, headers=None, json=None):
+            return responses.pop(0)
+
+    monkeypatch.setattr(notifier_module.httpx, "Client", _Client)
+    monkeypatch.setattr(notifier_module.time, "sleep", sleeps.append)
+
+    sent, _ = DiscordNotifier(webhook_url="https://discord.com/api/webhooks/x").send({"content": "hello"})
+
+    assert sent is ok
+    assert sleeps == expected_sleeps and responses == []
@@ -0,0 +1,163 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.db.database import Base
+from app.models.notification import Notification
+from app.models.notification_outbox import NotificationOutbox
+from app.services import outbox
+from app.services.outbox import deliver_outbox, drain_outbox, drain_until_settled, enqueue_batch
+from app.services.response_cache import cache_generation
+
+
+class ScriptedNotifier:
+    def __init__(self, results):
+        self.results = list(results)
+        self.calls = []
+
+    @contextmanager
+    def session(self):
+        yield self
+
+    def send(self, payload, idempotency_key=None):
+        self.calls.append((payload["content"], idempotency_key))
+        return self.results.pop(0)
+
+
+def _session():
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)()
+
+
+def test_failed_message_is_retried_with_same_key_and_holds_back_its_batch():
+    db = _session()
+    batch_id = enqueue_batch(db, [("digest", {"content": "digest"}), ("end_of_push", {"content": "end"})])
+    for mode in ("digest", "job_digest_item", "end_of_push"):
+        db.add(Notification(job_id=None, channel="discord", mode=mode, status="pending", batch_id=batch_id))
+    db.commit()
+
+    notifier = ScriptedNotifier([(False, "discord down"), (True, "ok"), (True, "ok")])
+    now = datetime.utcnow()
+    assert deliver_outbox(db, notifier=notifier, now=now) == {"sent": 0, "failed": 0, "retrying": 1}
+    assert [content for content, _ in notifier.calls] == ["digest"]
+    assert {row.status for row in db.query(Notification).all()} == {"pending"}
+
+    # Not due yet: backoff keeps the message parked.
+    assert deliver_outbox(db, notifier=notifier, now=now)["sent"] == 0
+
+    stats = deliver_outbox(db, notifier=notifier, now=now + timedelta(hours=1))
+    assert stats == {"sent": 2, "failed": 0, "retrying": 0}
+    assert [content for content, _ in notifier.calls] == ["digest", "digest", "end"]
+    assert notifier.calls[0][1] == notifier.calls[1][1] and notifier.calls[0][1] != notifier.calls[2][1]
+    assert {row.mode: row.status for row in db.query(Notification).all()} == {
+        "digest": "sent",
+        "job_digest_item": "sent",
+        "end_of_push": "sent",
+    }
+    assert all(row.status == "sent" for row in db.query(NotificationOutbox).all())
+
+
+def _batch(db):
+    enqueue_batch(db, [("digest", {"content": "digest"}), ("end_of_push", {"content": "end"})])
+    db.commit()
+
+
+def test_drain_retries_in_process_until_the_batch_is_sent(monkeypatch):
+    monkeypatch.setattr(settings, "outbox_retry_base_seconds", 0)
+    db = _session()
+    _batch(db)
+    notifier = ScriptedNotifier([(False, "429"), (False, "502"), (True, "ok"), (True, "ok")])
+
+    stats = drain_until_settled(db, notifier=notifier, sleep=lambda _seconds: None)
+
+    assert stats == {"sent": 2, "failed": 0, "retrying": 2, "pending": 0}
+    assert [content for content, _ in notifier.calls] == ["digest", "digest", "digest", "end"]
+
+
+def test_drain_sleeps_until_the_next_retry(monkeypatch):
+    monkeypatch.setattr(settings, "outbox_retry_base_seconds", 30)
+    db = _session()
+    _batch(db)
+    notifier = ScriptedNotifier([(False, "down"), (True, "ok"), (True, "ok")])
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        # Time passes: make the parked retry due.
+        db.query(NotificationOutbox).update({"next_attempt_at": datetime.utcnow() - timedelta(seconds=1)})
+        db.commit()
+
+    assert drain_until_settled(db, notifier=notifier, sleep=sleep)["sent"] == 2
+    assert len(sleeps) == 1 and 0 < sleeps[0] <= 30
+
+
+def test_drain_outbox_makes_one_pass_without_waiting(monkeypatch):
+    monkeypatch.setattr(settings, "outbox_retry_base_seconds", 0)
+    db = _session()
+    _batch(db)
+    monkeypatch.setattr(outbox, "SessionLocal", lambda: db)
+    notifier = ScriptedNotifier([(False, "down")])
+    monkeypatch.setattr(outbox.DiscordNotifier, "from_config", staticmethod(lambda _config: notifier))
+
+    assert drain_outbox() == {"sent": 0, "failed": 0, "retrying": 1}
+    assert db.query(NotificationOutbox).filter_by(status="pending").count() == 2
+
+
+def test_idle_passes_keep_the_response_cache():
+    db = _session()
+    generation = cache_generation()
+    assert deliver_outbox(db, notifier=ScriptedNotifier([])) == {"sent": 0, "failed": 0, "retrying": 0}
+    assert cache_generation() == generation
+
+    _batch(db)
+    deliver_outbox(db, notifier=ScriptedNotifier([(True, "ok"), (True, "ok")]))
+    assert cache_generation() > generation
+
+
+def test_drain_gives_up_at_its_deadline_and_leaves_the_batch_queued():
+    db = _session()
+    _batch(db)
+    sleeps = []
+
+    stats = drain_until_settled(db, notifier=ScriptedNotifier([(False, "down")]), max_wait_seconds=5, sleep=sleeps.append)
+
+    assert stats["pending"] == 2 and sleeps == []
+
+
+def test_concurrent_drainers_never_send_the_same_message(tmp_path):
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'outbox.db'}", future=True)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+    db = Session()
+    _batch(db)
+    rival = ScriptedNotifier([])
+    rival_stats = []
+
+    class OverlappingNotifier(ScriptedNotifier):
+        def send(self, payload, idempotency_key=None):
+            if not rival_stats:
+                # A second drain (e.g. the trigger's background task) starts while this send is in flight.
+                rival_stats.append(deliver_outbox(Session(), notifier=rival))
+            return super().send(payload, idempotency_key)
+
+    notifier = OverlappingNotifier([(True, "ok"), (True, "ok")])
+    assert deliver_outbox(db, notifier=notifier)["sent"] == 2
+    assert rival.calls == [] and rival_stats == [{"sent": 0, "failed": 0, "retrying": 0}]
+    assert [content for content, _ in notifier.calls] == ["digest", "end"]
+
+
+def test_stale_claims_are_released():
+    db = _session()
+    _batch(db)
+    first = db.query(NotificationOutbox).order_by(NotificationOutbox.id).first()
+    first.status = "sending"
+    first.claimed_at = datetime.utcnow() - timedelta(hours=1)
+    db.commit()
+
+    notifier = ScriptedNotifier([(True, "ok"), (True, "ok")])
+    assert deliver_outbox(db, notifier=notifier)["sent"] == 2
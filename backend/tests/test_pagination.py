@@ -0,0 +1,141 @@
+from __future__ import annotations
+from datetime import datetime, timedelta
+import sqlite3
+
+from fastapi.testclient import TestClient
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.main import app
+from app.models.crawl_run import CrawlRun
+from app.models.job import Job
+from app.models.source import Source
+from app.services.response_cache import bump_cache_generation, response_cache
+from app.utils.cursor import decode_cursor, encode_cursor
+
+
+@pytest.fixture()
+def client(api_sessionmaker):
+    db = api_sessionmaker()
+    db.add(Source(id=1, name="web3career", base_url="https://web3.career", enabled=True, crawl_config={}))
+    now = datetime.utcnow().replace(microsecond=0)
+    # Pairs of rows share a timestamp so pages must break ties on id.
+    for idx in range(7):
+        ts = now - timedelta(minutes=idx // 2)
+        db.add(
+            Job(
+                source_id=1,
+                source_job_id=str(idx),
+                canonical_url=f"https://example.com/{idx}",
+                title=f"Job {idx}",
+                company="Acme",
+                collected_at=ts,
+            )
+        )
+        db.add(CrawlRun(source_id=1, status="success", started_at=ts))
+    db.commit()
+    db.close()
+    return TestClient(app)
+
+
+def _walk(client, path, id_key):
+    seen, cursor = [], None
+    while True:
+        params = {"paginate": "cursor", "limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        body = client.get(path, params=params).json()
+        seen.extend(row[id_key] for row in body["items"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return seen
+
+
+def test_cursor_round_trip():
+    ts = datetime(2024, 5, 1, 12, 30)
+    assert decode_cursor(encode_cursor(ts, 42)) == (ts, 42)
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_jobs_cursor_pages_match_offset_order(client):
+    offset_ids = [row["id"] for row in client.get("/api/v1/jobs", params={"limit": 50}).json()]
+    assert len(offset_ids) == 7
+    assert _walk(client, "/api/v1/jobs", "id") == offset_ids
+
+
+def test_runs_cursor_pages_cover_every_run(client):
+    run_ids = _walk(client, "/api/v1/runs", "id")
+    assert sorted(run_ids) == list(range(1, 8))
+    assert run_ids == [row["id"] for row in client.get("/api/v1/runs").json()]
+
+
+def test_cursor_pages_are_index_range_scans(client, tmp_path):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if ") < (" in statement:
+            statements.append((statement, parameters))
+
+    event.listen(Engine, "before_cursor_execute", capture)
+    try:
+        _walk(client, "/api/v1/jobs", "id")
+        _walk(client, "/api/v1/runs", "id")
+    finally:
+        event.remove(Engine, "before_cursor_execute", capture)
+
+    # The row-value comparison seeks the (timestamp, id) index instead of filtering a scan from the top.
+    with sqlite3.connect(tmp_path / "api.db") as conn:
+        plans = {row[3] for statement, params in statements for row in conn.execute(f"EXPLAIN QUERY PLAN {statement}", params)}
+    assert any("INDEX ix_jobs_collected_at_id (collected_at<?)" in plan for plan in plans)
+    assert any("INDEX ix_crawl_runs_started_at_id (started_at<?)" in plan for plan in plans)
+
+
+def test_bad_cursor_and_relevance_cursor_are_rejected(client):
+    assert client.get("/api/v1/jobs", params={"cursor": "garbage"}).status_code == 400
+    assert client.get("/api/v1/runs", params={"cursor": "garbage"}).status_code == 400
+    assert client.get("/api/v1/jobs", params={"paginate": "cursor", "sort": "relevance"}).status_code == 400
+
+
+def test_summary_view_omits_heavy_columns(client):
+    rows = client.get("/api/v1/jobs", params={"view": "summary"}).json()
+    assert len(rows) == 7
+    assert "description" not in rows[0] and "raw_payload" not in rows[0]
+    assert rows[0]["title"] == "Job 1" and rows[0]["score"] is None
+
+    rows = client.get("/api/v1/jobs", params={"fields": "title,company"}).json()
+    assert set(rows[0]) == {"id", "title", "company"}
+
+    body = client.get("/api/v1/jobs", params={"fields": "title", "paginate": "cursor", "limit": 3}).json()
+    assert set(body["items"][0]) == {"id", "title"} and body["next_cursor"]
+
+    assert client.get("/api/v1/jobs", params={"fields": "description"}).status_code == 400
+    assert "description" in client.get(f"/api/v1/jobs/{rows[0]['id']}").json()
+
+
+def test_read_endpoints_serve_etags_and_invalidate_on_generation_bump(client):
+    first = client.get("/api/v1/runs")
+    etag = first.headers["etag"]
+    assert client.get("/api/v1/runs", headers={"If-None-Match": etag}).status_code == 304
+
+    sources = client.get("/api/v1/sources").json()
+    client.patch(f"/api/v1/sources/{sources[0]['id']}", json={"enabled": False})
+    assert client.get("/api/v1/sources").json()[0]["enabled"] is False
+
+    bump_cache_generation()
+    again = client.get("/api/v1/runs", headers={"If-None-Match": etag})
+    # Same rows, so the rebuilt body hashes to the same ETag.
+    assert again.status_code == 304
+
+
+def test_response_cache_skips_large_bodies_and_is_freed_on_bump(client, monkeypatch):
+    client.get("/api/v1/runs")
+    assert len(response_cache) == 1 and response_cache.weight > 0
+    bump_cache_generation()
+    assert len(response_cache) == 0 and response_cache.weight == 0
+
+    monkeypatch.setattr(settings, "response_cache_max_entry_bytes", 100)
+    assert len(client.get("/api/v1/jobs", params={"limit": 50}).json()) == 7
+    assert len(response_cache) == 0
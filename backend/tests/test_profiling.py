@@ -0,0 +1,108 @@
+from __future__ import annotations
+import json
+import logging
+import os
+import pstats
+import tracemalloc
+
+from fastapi.testclient import TestClient
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api import crawl as crawl_api
+from app.core.config import settings
+from app.db.database import Base
+from app.main import app
+from app.models.crawl_run import CrawlRun
+from app.models.setting import Setting
+from app.models.source import Source
+from app.services import crawl_service, profiling
+from app.services.profiling import profile_crawl
+from app.services.seed import DEFAULT_SOURCES, default_notification_config, default_score_config
+from benchmarks.mock_server import mock_crawl_configs
+from benchmarks.replay import FixtureRoutes, replay_http
+
+
+def _seed(db, sources):
+    for name, base_url in sources:
+        db.add(Source(name=name, base_url=base_url, enabled=True, crawl_config={}))
+    db.add(Setting(key="scoring", value=default_score_config()))
+    db.add(Setting(key="notifications", value=default_notification_config()))
+    db.commit()
+
+
+def _session():
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)()
+
+
+def test_profile_crawl_writes_artifacts_linked_from_runs(tmp_path):
+    db = _session()
+    _seed(db, [(name, base_url) for name, base_url, _enabled in DEFAULT_SOURCES])
+
+    with replay_http(FixtureRoutes()):
+        result = profile_crawl(db, str(tmp_path))
+
+    assert result["new_jobs"] > 0
+    path = tmp_path / result["profile_path"]
+    assert path.is_dir() and result["profile_path"] == path.name
+    assert {run.profile_path for run in db.query(CrawlRun)} == {result["profile_path"]}
+    assert not tracemalloc.is_tracing()
+
+    stats = pstats.Stats(str(path / "cpu.pstats"))
+    assert any(func[2] == "run_crawl" for func in stats.stats)
+    speedscope = json.loads((path / "cpu.speedscope.json").read_text())
+    profile = speedscope["profiles"][0]
+    assert profile["type"] == "sampled" and len(profile["samples"]) == len(profile["weights"]) > 0
+    names = {frame["name"] for frame in speedscope["shared"]["frames"]}
+    assert "run_crawl" in names
+    assert tracemalloc.Snapshot.load(str(path / "memory.tracemalloc")).traces
+    assert (path / "memory-top.txt").read_text().strip()
+
+
+def test_trigger_profile_flag(api_sessionmaker, mock_board, monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "profile_dir", str(tmp_path))
+    monkeypatch.setattr(crawl_api, "drain_outbox", lambda: None)
+    db = api_sessionmaker()
+    # The profiled crawl runs in a spawned process, so it fetches over HTTP rather than through a patched adapter.
+    config = mock_crawl_configs(mock_board().base_url, sources=["aijobsnet"])["aijobsnet"]
+    db.add(Source(name="aijobsnet", base_url="https://aijobs.net", enabled=True, crawl_config=config))
+    _seed(db, [])
+    client = TestClient(app)
+
+    plain = client.post("/api/v1/crawl/trigger")
+    assert plain.status_code == 200 and "profile_path" not in plain.json()
+    assert len(client.get("/api/v1/runs").json()) == 1
+
+    profiled = client.post("/api/v1/crawl/trigger", params={"profile": "true"})
+    assert profiled.status_code == 200
+    profile_path = profiled.json()["profile_path"]
+    # Only the directory name under PROFILE_DIR leaves the server.
+    assert "/" not in profile_path and (tmp_path / profile_path / "cpu.pstats").is_file()
+    # Profiled in a child process (the directory name ends with its pid), not in the server.
+    assert not profile_path.endswith(f"-{os.getpid()}")
+
+    # The cached run list from before the profiled crawl is not served again.
+    runs = client.get("/api/v1/runs").json()
+    assert [(run["status"], run["profile_path"]) for run in runs] == [("success", profile_path), ("success", None)]
+
+
+def test_artifact_errors_do_not_hide_the_crawl_error(monkeypatch, tmp_path, caplog):
+    def failing_crawl(db, profile_path=None):
+        raise ValueError("crawl failed")
+
+    def failing_write(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(crawl_service, "run_crawl", failing_crawl)
+    monkeypatch.setattr(profiling, "_write_artifacts", failing_write)
+    with caplog.at_level(logging.ERROR, logger="app.services.profiling"), pytest.raises(ValueError, match="crawl failed"):
+        profile_crawl(_session(), str(tmp_path))
+    assert "could not write profile artifacts" in caplog.text
+
+    # Without a crawl error the write error surfaces.
+    monkeypatch.setattr(crawl_service, "run_crawl", lambda db, profile_path=None: {})
+    with pytest.raises(OSError, match="disk full"):
+        profile_crawl(_session(), str(tmp_path))
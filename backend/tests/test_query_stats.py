@@ -0,0 +1,130 @@
+from __future__ import annotations
+from datetime import datetime, timedelta
+import logging
+
+from fastapi.testclient import TestClient
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.crawlers.base import NormalizedJob
+from app.db.database import Base
+from app.db.query_stats import assert_query_budget, track_queries
+from app.main import app
+from app.models.crawl_run import CrawlRun
+from app.models.setting import Setting
+from app.models.source import Source
+from app.services import crawl_service
+from app.services.crawl_service import run_crawl
+from app.services.seed import default_notification_config, default_score_config
+
+
+class BatchAdapter:
+    def fetch(self):
+        now = datetime.utcnow()
+        return [
+            NormalizedJob(
+                source_job_id=f"batch-{i}",
+                canonical_url=f"https://example.com/jobs/{i}",
+                title="Senior Solidity Engineer",
+                company=f"Company {i % 10}",
+                description="smart contract defi protocol",
+                posted_at=now - timedelta(hours=1),
+            )
+            for i in range(80)
+        ]
+
+
+def _session():
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)()
+    db.add(Source(name="batch", base_url="https://example.com", enabled=True, crawl_config={}))
+    db.add(Setting(key="scoring", value=default_score_config()))
+    db.add(Setting(key="notifications", value=default_notification_config()))
+    db.commit()
+    return db
+
+
+def test_trackers_nest_and_budget_lists_statements():
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    with engine.connect() as conn, track_queries() as outer:
+        conn.execute(text("SELECT 1"))
+        with track_queries() as inner:
+            conn.execute(text("SELECT 2"))
+        with pytest.raises(AssertionError, match="2 queries executed, budget is 1") as failure:
+            with assert_query_budget(1):
+                conn.execute(text("SELECT 3"))
+                conn.execute(text("SELECT 4"))
+    assert (outer.count, inner.count) == (4, 1)
+    assert "SELECT 4" in str(failure.value)
+
+
+def test_slow_queries_are_logged(monkeypatch, caplog):
+    monkeypatch.setattr(settings, "slow_query_ms", 1)
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    slow = "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < 300000) SELECT count(*) FROM c"
+    with caplog.at_level(logging.WARNING, logger="app.db.query_stats"), engine.connect() as conn:
+        conn.execute(text(slow))
+        conn.execute(text("SELECT 1"))
+    assert [record.getMessage().split(": ", 1)[1] for record in caplog.records] == [slow]
+
+
+def test_crawl_reports_queries_per_run_within_budget(monkeypatch):
+    monkeypatch.setitem(crawl_service.ADAPTERS, "batch", BatchAdapter)
+    db = _session()
+
+    # Measured 633 (about seven statements per new job: dedup lookups, insert, refresh, score); lower this
+    # as ingest gets batched.
+    with assert_query_budget(640):
+        result = run_crawl(db)
+
+    stats = result["source_stats"][0]
+    assert result["new_jobs"] == 80
+    assert 0 < stats["queries"] < result["db"]["queries"]
+    run = db.query(CrawlRun).one()
+    assert (run.query_count, run.db_ms) == (stats["queries"], stats["db_ms"])
+
+    # Replaying the same jobs only pays for dedup.
+    with assert_query_budget(stats["queries"]):
+        run_crawl(db)
+
+
+def test_company_summaries_cost_two_queries_for_any_number_of_companies(monkeypatch):
+    monkeypatch.setitem(crawl_service.ADAPTERS, "batch", BatchAdapter)
+    db = _session()
+    run_crawl(db)
+    company_stats = {
+        f"company {i}": {
+            "company": f"Company {i}",
+            "new_jobs": 1,
+            "max_score": 1.0,
+            "score_sum": 1.0,
+            "company_url": "",
+            "source_counts": {"batch": 1},
+            "source_websites": {"batch": "https://example.com"},
+            "new_roles": [],
+            "contact_clues": {"emails": set(), "telegrams": set(), "career_urls": set()},
+        }
+        for i in range(12)
+    }
+
+    with assert_query_budget(2):
+        summaries = crawl_service._build_company_summaries(db, company_stats, datetime.utcnow())
+
+    by_company = {item["company"]: item for item in summaries}
+    assert [by_company[f"Company {i}"]["recent_30d"] for i in (0, 9, 10)] == [8, 8, 0]
+    assert by_company["Company 0"]["first_seen_at"] == datetime.utcnow().strftime("%Y-%m-%d")
+    assert by_company["Company 10"]["first_seen_at"] == "N/A"
+
+
+def test_responses_carry_query_count_headers(api_sessionmaker):
+    api_sessionmaker()
+    client = TestClient(app)
+
+    first = client.get("/api/v1/runs")
+    assert int(first.headers["X-DB-Query-Count"]) > 0
+    assert float(first.headers["X-DB-Time-Ms"]) >= 0
+    # Served from the response cache without touching the database.
+    assert client.get("/api/v1/runs").headers["X-DB-Query-Count"] == "0"
@@ -0,0 +1,25 @@
+from __future__ import annotations
+from datetime import datetime
+import json
+
+import pytest
+
+from app.utils import serialization
+from app.api.responses import FastJSONResponse
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_fast_json_response_matches_stdlib_shape(monkeypatch, use_orjson):
+    if use_orjson and serialization.orjson is None:
+        pytest.skip("orjson not installed")
+    if not use_orjson:
+        monkeypatch.setattr(serialization, "orjson", None)
+
+    content = {"items": [{"id": 1, "title": "区块链", "collected_at": datetime(2024, 5, 1, 12, 30)}], "next": None}
+    resp = FastJSONResponse(content)
+
+    assert resp.media_type == "application/json"
+    assert json.loads(resp.body) == {
+        "items": [{"id": 1, "title": "区块链", "collected_at": "2024-05-01T12:30:00"}],
+        "next": None,
+    }
@@ -12,7 +12,7 @@ export default function JobsPage() {
 
   async function load() {
     setLoading(true);
-    const data = await apiGet(`/jobs?q=${encodeURIComponent(q)}`);
+    const data = await apiGet(`/jobs?view=summary&q=${encodeURIComponent(q)}`);
     setJobs(data);
     setLoading(false);
   }
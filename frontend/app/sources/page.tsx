@@ -23,7 +23,7 @@ export default function SourcesPage() {
           <table className="table">
             <thead>
               <tr>
-                <th>Name</th><th>Base URL</th><th>Enabled</th><th>Action</th>
+                <th>Name</th><th>Base URL</th><th>Enabled</th><th>Circuit</th><th>Action</th>
               </tr>
             </thead>
             <tbody>
@@ -32,6 +32,10 @@ export default function SourcesPage() {
                   <td>{s.name}</td>
                   <td>{s.base_url}</td>
                   <td>{String(s.enabled)}</td>
+                  <td>
+                    {s.breaker?.state ?? "-"}
+                    {s.breaker?.state === "open" ? ` (retry ${s.breaker.retry_at})` : ""}
+                  </td>
                   <td>
                     <button onClick={async () => { await apiRequest(`/sources/${s.id}`, "PATCH", { enabled: !s.enabled }); await load(); }}>
                       {s.enabled ? "Disable" : "Enable"}